@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compare per-element text_content() loops with BasePage.extract on the products page.
+Run from the repository root: python -m benchmarks.bench_extraction --iterations 20
+"""
+
+import argparse
+import statistics
+import time
+from playwright.sync_api import sync_playwright
+from src.local_store.server import StorefrontServer
+from src.pages.products_page import ProductsPage
+
+
+def names_with_loop(page, selector):
+    """Previous implementation: one driver round trip per product plus the count"""
+    products = page.locator(selector)
+    return [products.nth(i).text_content() for i in range(products.count())]
+
+
+def time_call(func, iterations):
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return result, durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched DOM extraction")
+    parser.add_argument("--iterations", type=int, default=20, help="Measurements per approach")
+    parser.add_argument("--base-url", help="Target site (defaults to the bundled local storefront)")
+    args = parser.parse_args()
+
+    server = None if args.base_url else StorefrontServer().start()
+    base_url = args.base_url or server.url
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch()
+            page = browser.new_page()
+            page.goto(f"{base_url}/products")
+            products_page = ProductsPage(page)
+
+            loop_names, loop_times = time_call(
+                lambda: names_with_loop(page, f"{products_page.product_info} p"), args.iterations
+            )
+            batch_names, batch_times = time_call(products_page.get_product_names, args.iterations)
+            assert [name.strip() for name in loop_names] == batch_names, "Approaches returned different names"
+
+            print(f"Products on page: {len(batch_names)}")
+            print(f"Round trips per call: loop={len(loop_names) + 1} extract=1")
+            print(f"Loop    : mean {statistics.mean(loop_times) * 1000:.1f}ms, "
+                  f"median {statistics.median(loop_times) * 1000:.1f}ms")
+            print(f"Extract : mean {statistics.mean(batch_times) * 1000:.1f}ms, "
+                  f"median {statistics.median(batch_times) * 1000:.1f}ms")
+            print(f"Speed-up: {statistics.mean(loop_times) / statistics.mean(batch_times):.1f}x")
+            browser.close()
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Measure what the framework itself costs per test, against the bundled local storefront.
+Run from the repository root: python -m benchmarks.bench_framework --iterations 50
+
+Operations are grouped:
+  python   - Logger.get_logger and the step wrapper, no browser involved
+  browser  - browser.new_context, page.goto(BASE_URL), BasePage primitives next
+             to the raw Playwright call they wrap, and page-object methods
+  fixtures - --tests empty tests using the page fixture, run by pytest in a
+             subprocess under each conftest (root and tests/), copied into a
+             temporary directory; gives setup and teardown latency and tests
+             per second
+
+Results are written to reports/bench_framework.json. Timings only compare on
+the same machine, so the baseline (benchmarks/baseline.json) is not shipped:
+write it with --update-baseline on the reference machine (the CI agent the
+benchmark is gated on) and commit it. The run then exits 1 if any operation's
+median is more than --tolerance slower than in the baseline; with
+--require-baseline a missing baseline exits 2 instead of passing.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from importlib.metadata import version
+
+# Absolute slack on top of --tolerance so sub-microsecond jitter is not a regression
+NOISE_FLOOR_MS = 0.01
+
+GROUPS = ("python", "browser", "fixtures")
+
+# Conftest -> (files copied into the temporary project, directory the generated test goes in).
+# tests/conftest.py adds its own fixtures on top of the root conftest's.
+FIXTURE_LAYOUTS = {
+    "root": (("conftest.py", "pytest.ini"), "."),
+    "tests": (("conftest.py", "pytest.ini", "tests/conftest.py"), "tests"),
+}
+
+FIXTURE_TEST = '''import pytest
+
+
+@pytest.mark.parametrize("index", range({tests}))
+def test_overhead(page, index):
+    assert page.url
+'''
+
+# Set in the pytest subprocess: where the plugin hooks below write phase durations
+OUTPUT_VARIABLE = "BENCH_FRAMEWORK_OUTPUT"
+_phases = defaultdict(list)
+
+
+def pytest_runtest_logreport(report):
+    """Plugin hook (-p benchmarks.bench_framework): collect setup/call/teardown durations"""
+    if os.getenv(OUTPUT_VARIABLE):
+        _phases[report.when].append(report.duration)
+
+
+def pytest_sessionfinish(session):
+    """Plugin hook: hand the durations to the benchmark process"""
+    output = os.getenv(OUTPUT_VARIABLE)
+    if output:
+        with open(output, "w") as output_file:
+            json.dump(_phases, output_file)
+
+
+def measure(func, iterations, setup=None, warmup=2):
+    """Time func() iterations times after warmup calls; setup() runs untimed before each call"""
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+    durations = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(durations):
+    """Latency distribution in milliseconds"""
+    from src.utils.run_stats import percentile
+
+    return {
+        "n": len(durations),
+        "median_ms": round(percentile(durations, 50) * 1000, 4),
+        "p95_ms": round(percentile(durations, 95) * 1000, 4),
+        "mean_ms": round(sum(durations) / len(durations) * 1000, 4),
+        "max_ms": round(max(durations) * 1000, 4),
+    }
+
+
+def python_operations(iterations):
+    from src.utils.logger import Logger
+    from src.utils.step_trace import step
+
+    @step("Benchmark step: {value}")
+    def stepped(value):
+        return value
+
+    def plain(value):
+        return value
+
+    iterations *= 100
+    return {
+        "Logger.get_logger": measure(lambda: Logger.get_logger("Benchmark"), iterations),
+        "function call": measure(lambda: plain(1), iterations),
+        "step wrapper": measure(lambda: stepped(1), iterations),
+    }
+
+
+def browser_operations(browser, base_url, iterations):
+    from src.pages.home_page import HomePage
+    from src.pages.products_page import ProductsPage
+
+    viewport = {"width": 1280, "height": 720}
+    results = {
+        "browser.new_context + close": measure(lambda: browser.new_context(viewport=viewport).close(), iterations),
+    }
+    context = browser.new_context(viewport=viewport)
+    page = context.new_page()
+    results["page.goto(base_url)"] = measure(lambda: page.goto(base_url), iterations)
+
+    home_page = HomePage(page)
+    results["HomePage.go_to_products"] = measure(
+        home_page.go_to_products, iterations, setup=lambda: page.goto(base_url)
+    )
+
+    products_page = ProductsPage(page)
+    title, products = products_page.products_title, products_page.product_info
+    search_box = products_page.search_box
+    pairs = {
+        "get_text": (lambda: page.text_content(title), lambda: products_page.get_text(title)),
+        "is_visible": (
+            lambda: page.wait_for_selector(title, state="visible", timeout=5000),
+            lambda: products_page.is_visible(title),
+        ),
+        "fill": (lambda: page.fill(search_box, "top"), lambda: products_page.fill(search_box, "top")),
+        "click": (lambda: page.click(search_box), lambda: products_page.click(search_box)),
+        "get_count": (lambda: page.locator(products).count(), lambda: products_page.get_count(products)),
+    }
+    for name, (raw, wrapped) in pairs.items():
+        results[f"raw {name}"] = measure(raw, iterations)
+        results[f"BasePage.{name}"] = measure(wrapped, iterations)
+    results["BasePage.wait_for_page_load"] = measure(products_page.wait_for_page_load, iterations)
+    results["ProductsPage.get_product_names"] = measure(products_page.get_product_names, iterations)
+    context.close()
+    return results
+
+
+def fixture_operations(tests):
+    """Run tests empty page-fixture tests under each conftest; returns durations and tests/s per conftest.
+
+    Each conftest is copied with the generated test into a temporary directory,
+    so nothing is written into the repository's own test tree.
+    """
+    from dotenv import dotenv_values
+
+    repository = os.getcwd()
+    results, throughput = {}, {}
+    for conftest, (files, test_dir) in FIXTURE_LAYOUTS.items():
+        project = tempfile.mkdtemp(prefix=f"bench-{conftest}-")
+        output = os.path.join(project, "phases.json")
+        try:
+            for name in files:
+                os.makedirs(os.path.join(project, os.path.dirname(name)), exist_ok=True)
+                shutil.copy(os.path.join(repository, name), os.path.join(project, name))
+            with open(os.path.join(project, test_dir, "test_overhead.py"), "w") as test_file:
+                test_file.write(FIXTURE_TEST.format(tests=tests))
+            # The copied conftest cannot find the repository's .env or src package on its own
+            env = {
+                **{name: value for name, value in dotenv_values(".env").items() if value is not None},
+                **os.environ,
+                "PYTHONPATH": os.pathsep.join(filter(None, [repository, os.getenv("PYTHONPATH")])),
+                OUTPUT_VARIABLE: output,
+                "LOCAL_SERVER": "true",
+            }
+            command = [
+                sys.executable, "-m", "pytest", test_dir, "-q", "-o", "addopts=",
+                "-p", "no:cacheprovider", "-p", "benchmarks.bench_framework",
+            ]
+            start = time.perf_counter()
+            subprocess.run(command, cwd=project, env=env, check=True, stdout=subprocess.DEVNULL)
+            wall = time.perf_counter() - start
+            with open(output) as output_file:
+                phases = json.load(output_file)
+        finally:
+            shutil.rmtree(project, ignore_errors=True)
+        for phase in ("setup", "teardown"):
+            results[f"fixture[{conftest}] {phase}"] = phases[phase]
+        per_test = sum(sum(phases[phase]) for phase in ("setup", "call", "teardown"))
+        throughput[conftest] = {
+            "tests_per_s": round(tests / per_test, 2),
+            "tests_per_s_wall": round(tests / wall, 2),
+        }
+    return results, throughput
+
+
+def compare(summaries, baseline, tolerance):
+    """Operations whose median regressed beyond tolerance, as printable lines"""
+    regressions = []
+    for name, summary in summaries.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        limit = reference["median_ms"] * (1 + tolerance) + NOISE_FLOOR_MS
+        if summary["median_ms"] > limit:
+            regressions.append(
+                f"{name}: median {summary['median_ms']:.3f}ms > {limit:.3f}ms "
+                f"(baseline {reference['median_ms']:.3f}ms + {tolerance:.0%})"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark framework overhead")
+    parser.add_argument("--iterations", type=int, default=50, help="Measurements per browser operation")
+    parser.add_argument("--tests", type=int, default=20, help="Empty tests per conftest for the fixture group")
+    parser.add_argument("--groups", default=",".join(GROUPS), help="Comma-separated groups to run")
+    parser.add_argument("--base-url", help="Target site (defaults to the bundled local storefront)")
+    parser.add_argument("--output", default="reports/bench_framework.json", help="Results file")
+    parser.add_argument("--baseline", default="benchmarks/baseline.json", help="Baseline to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="Exit 2 when there is no baseline (for CI, where a missing baseline must not pass)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed median slowdown versus the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+    groups = [group.strip() for group in args.groups.split(",")]
+
+    durations, throughput = {}, {}
+    if "python" in groups:
+        durations.update(python_operations(args.iterations))
+    if "browser" in groups:
+        from playwright.sync_api import sync_playwright
+        from src.local_store.server import StorefrontServer
+
+        server = None if args.base_url else StorefrontServer().start()
+        try:
+            with sync_playwright() as playwright:
+                browser = playwright.chromium.launch()
+                durations.update(browser_operations(browser, args.base_url or server.url, args.iterations))
+                browser.close()
+        finally:
+            if server:
+                server.stop()
+    if "fixtures" in groups:
+        fixture_durations, throughput = fixture_operations(args.tests)
+        durations.update(fixture_durations)
+
+    summaries = {name: summarize(values) for name, values in durations.items()}
+    print(f"{'operation':<36}{'n':>7}{'median ms':>12}{'p95 ms':>10}{'max ms':>10}")
+    for name, summary in summaries.items():
+        print(f"{name:<36}{summary['n']:>7}{summary['median_ms']:>12.3f}"
+              f"{summary['p95_ms']:>10.3f}{summary['max_ms']:>10.3f}")
+    for name in ("get_text", "is_visible", "fill", "click", "get_count"):
+        if f"raw {name}" in summaries:
+            overhead = summaries[f"BasePage.{name}"]["median_ms"] - summaries[f"raw {name}"]["median_ms"]
+            print(f"BasePage.{name} overhead over raw Playwright: {overhead:+.3f}ms")
+    for conftest, rates in throughput.items():
+        print(f"{conftest} conftest: {rates['tests_per_s']} tests/s in fixtures and test body, "
+              f"{rates['tests_per_s_wall']} tests/s including pytest start-up")
+
+    results = {
+        "python": platform.python_version(),
+        "playwright": version("playwright"),
+        "machine": platform.machine(),
+        "operations": summaries,
+        "throughput": throughput,
+    }
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(summaries, baseline_file, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline on the reference machine to create one")
+        return 2 if args.require_baseline else 0
+    with open(args.baseline) as baseline_file:
+        regressions = compare(summaries, json.load(baseline_file), args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
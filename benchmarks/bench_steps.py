@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Measure the per-action cost of Allure steps for each STEP_MODE and STEP_LEVEL.
+Run from the repository root: python -m benchmarks.bench_steps --tests 200 --actions 100
+
+Each simulated test calls a page-object method (one PAGE step) that performs
+five primitives (ACTION steps), the same shape as ProductsPage.add_to_cart.
+The real allure-pytest listener is registered so live steps pay the same
+bookkeeping they do in a run with --alluredir.
+"""
+
+import argparse
+import time
+from uuid import uuid4
+
+import allure_commons
+from allure_commons.model2 import TestResult
+from allure_pytest.listener import AllureListener
+from src.utils.step_trace import ACTION, StepTrace, step
+
+PRIMITIVES_PER_METHOD = 5
+
+
+class FakePage:
+    @step("Click on element: {selector}", level=ACTION)
+    def click(self, selector):
+        return selector
+
+    @step("Add product to cart: {product_name}")
+    def add_to_cart(self, product_name):
+        for i in range(PRIMITIVES_PER_METHOD):
+            self.click(f".add-to-cart:nth-child({i})")
+
+
+class PlainPage:
+    """The same calls without any step decorator: the floor for the measurements"""
+
+    def click(self, selector):
+        return selector
+
+    def add_to_cart(self, product_name):
+        for i in range(PRIMITIVES_PER_METHOD):
+            self.click(f".add-to-cart:nth-child({i})")
+
+
+def run(listener, page, tests, methods, buffered):
+    start = time.perf_counter()
+    for _ in range(tests):
+        uuid = str(uuid4())
+        test_result = TestResult(name="bench", uuid=uuid)
+        listener.allure_logger.schedule_test(uuid, test_result)
+        for _ in range(methods):
+            page.add_to_cart("Blue Top")
+        if buffered:
+            StepTrace.flush(test_result, failed=False)
+        listener.allure_logger.drop_test(uuid)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark step-tracing overhead")
+    parser.add_argument("--tests", type=int, default=200, help="Simulated tests")
+    parser.add_argument("--actions", type=int, default=100, help="Primitive actions per test")
+    args = parser.parse_args()
+    methods = max(args.actions // PRIMITIVES_PER_METHOD, 1)
+    actions = args.tests * methods * (PRIMITIVES_PER_METHOD + 1)
+
+    listener = AllureListener(config=None)
+    allure_commons.plugin_manager.register(listener)
+    try:
+        baseline = run(listener, PlainPage(), args.tests, methods, buffered=False)
+        print(f"{actions} actions ({args.tests} tests x {methods * (PRIMITIVES_PER_METHOD + 1)} calls)")
+        print(f"{'no steps':<18}: {baseline / actions * 1e6:6.2f}us/action")
+        results = {}
+        for mode in ("live", "buffered", "failure"):
+            for level in ("full", "page", "off"):
+                StepTrace.configure(mode, level)
+                elapsed = run(listener, FakePage(), args.tests, methods, buffered=mode != "live")
+                results[mode, level] = elapsed
+                overhead = (elapsed - baseline) / actions * 1e6
+                print(f"{mode + '/' + level:<18}: {elapsed / actions * 1e6:6.2f}us/action "
+                      f"(+{overhead:.2f}us over no steps)")
+        live = results["live", "full"]
+        for key in (("buffered", "full"), ("failure", "full"), ("live", "page"), ("failure", "page")):
+            saved = (live - results[key]) / actions * 1e6
+            print(f"{'/'.join(key)} saves {saved:.2f}us/action versus live/full "
+                  f"({live / results[key]:.1f}x faster)")
+    finally:
+        allure_commons.plugin_manager.unregister(listener)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,32 @@
 import  os
+import time
 import pytest
-import allure
-from datetime import datetime
+from collections import defaultdict
 from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
+from src.utils.run_stats import RunStats
+from src.utils.har_helper import HarReplayer, hit_rate_line, record_context_args
+from src.utils.resource_blocker import ResourceBlocker, resolve_profile
+from src.utils.auth_state import AuthStateCache, log_in
+from src.utils.cart_seeder import CartSeeder
+from src.utils.async_runner import AsyncRunner
+from src.utils.duration_history import (
+    DurationHistory, assign_shards, marker_names, parse_shard, predicted_makespan, registered_markers,
+)
+from src.utils.shard_merge import write_timings
+from src.utils.test_data import TestData
+from src.utils.artifacts import failed, failed_or_retried, worker_id
+from src.utils.browser_server import (
+    ENDPOINT_VARIABLE, MODES as BROWSER_SERVER_MODES, BrowserServer, RssSampler, SharedBrowser, browser_summary_line,
+    check_playwright_version,
+)
+from src.utils.context_pool import ContextPool, pool_summary_line
+from src.utils.page_metrics import PageMetrics
+from src.utils.perf_budget import PerfBudget, apply_to_report, describe, enforce, resolve_mode
+from src.utils.trace_helper import TraceBuffer
+from src.utils.video_helper import VideoRecorder, parse_size, video_mode, video_summary_line
+from src.utils.step_trace import StepTrace
+from src.utils.screenshot_pipeline import ScreenshotPipeline
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -21,7 +44,26 @@ def get_config():
         "base_url": os.getenv("BASE_URL", "https://automationexercise.com"),
         "screenshot": os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true",
         "trace": os.getenv("TRACING", "false").lower() == "true",
-        "video": os.getenv("VIDEO", "false").lower() == "true",
+        "trace_actions": int(os.getenv("TRACE_ACTIONS", "0")),
+        "perf_budgets": os.getenv("PERF_BUDGETS", "off").lower(),
+        "context_pool": int(os.getenv("CONTEXT_POOL", "0")),
+        "context_reuse": os.getenv("CONTEXT_REUSE", "reset").lower(),
+        "video": video_mode(os.getenv("VIDEO", "off")),
+        "video_size": parse_size(os.getenv("VIDEO_SIZE", "")),
+        "reuse_browser": os.getenv("REUSE_BROWSER", "true").lower() == "true",
+        "browser_server": os.getenv("BROWSER_SERVER", "per-worker").lower(),
+        "local_server": os.getenv("LOCAL_SERVER", "false").lower() == "true",
+        "local_server_port": int(os.getenv("LOCAL_SERVER_PORT", "0")),
+        "har_mode": os.getenv("HAR_MODE", "off").lower(),
+        "har_dir": os.getenv("HAR_DIR", "hars"),
+        "har_miss": os.getenv("HAR_MISS", "fallback").lower(),
+        "block_profile": os.getenv("BLOCK_PROFILE", "off").lower(),
+        "auth_state_dir": os.getenv("AUTH_STATE_DIR", ".auth"),
+        "auth_state_ttl": int(os.getenv("AUTH_STATE_TTL", "1800")),
+        "environment": os.getenv("ENVIRONMENT", "staging"),
+        "schedule": os.getenv("SCHEDULE", "default").lower(),
+        "shard": os.getenv("SHARD", ""),
+        "duration_history": os.getenv("DURATION_HISTORY", ".durations.json"),
     }
 
 def get_browser_args():
@@ -44,7 +86,47 @@ def get_browser_args():
     return args
 
 @pytest.fixture(scope="session")
-def env():
+def local_server():
+    """Start the bundled stand-in storefront when LOCAL_SERVER=true and point BASE_URL at it"""
+    config = get_config()
+    if not config["local_server"]:
+        yield None
+        return
+    
+    from src.local_store.server import StorefrontServer
+    server = StorefrontServer(port=config["local_server_port"]).start()
+    os.environ["BASE_URL"] = server.url
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def auth_state(playwright_browser_type, local_server, tmp_path_factory):
+    """Path to a storage_state logged in as TestData.TEST_USER, logged in at most once per worker"""
+    config = get_config()
+    user = TestData.TEST_USER
+    # The local storefront keeps sessions in memory, so its states never outlive the run
+    cache_dir = str(tmp_path_factory.mktemp("auth")) if local_server else config["auth_state_dir"]
+    cache = AuthStateCache(cache_dir, config["auth_state_ttl"])
+    
+    path = cache.load(config["base_url"], user["email"])
+    if path:
+        return path
+    
+    browser = playwright_browser_type.launch(headless=config["headless"], **get_browser_args())
+    try:
+        context = browser.new_context(viewport=config["viewport"])
+        page = context.new_page()
+        page.set_default_timeout(config["timeout"])
+        if not log_in(page, config["base_url"], user):
+            pytest.fail(f"Could not log in as {user['email']} to create the cached storage state")
+        path = cache.save(context, config["base_url"], user["email"])
+        context.close()
+    finally:
+        browser.close()
+    return path
+
+@pytest.fixture(scope="session")
+def env(local_server):
     """Return environment configuration"""
     return get_config()
 
@@ -64,59 +146,190 @@ def playwright_browser_type():
         else:
             yield playwright.chromium
 
-@pytest.fixture(scope="function")
+def _browser_scope(fixture_name, config):
+    """Launch the browser once per worker unless REUSE_BROWSER=false"""
+    return "session" if get_config()["reuse_browser"] else "function"
+
+# The controller's shared browser server (BROWSER_SERVER=shared), started in pytest_configure
+_browser_server = None
+
+def pytest_configure(config):
+    """Validate SHARD and BROWSER_SERVER; in shared mode start the browser server before xdist spawns workers"""
+    global _browser_server
+    settings = get_config()
+    if settings["browser_server"] not in BROWSER_SERVER_MODES:
+        raise pytest.UsageError(
+            f"BROWSER_SERVER must be one of {BROWSER_SERVER_MODES}, got {settings['browser_server']!r}"
+        )
+    try:
+        parse_shard(settings["shard"])
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    # Workers inherit the endpoint; an endpoint set by the caller means an externally managed server
+    if settings["browser_server"] != "shared" or worker_id() != "main" or os.getenv(ENDPOINT_VARIABLE):
+        return
+    try:
+        check_playwright_version()
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    _browser_server = BrowserServer(
+        settings["browser_name"], {"headless": settings["headless"], **get_browser_args()}
+    ).start()
+    os.environ[ENDPOINT_VARIABLE] = _browser_server.ws_endpoint
+
+def pytest_unconfigure(config):
+    """Stop the shared browser server"""
+    global _browser_server
+    if _browser_server is not None:
+        _browser_server.stop()
+        os.environ.pop(ENDPOINT_VARIABLE, None)
+        _browser_server = None
+
+@pytest.fixture(scope=_browser_scope)
 def browser(playwright_browser_type):
-    """Fixture to provide browser instance"""
+    """Fixture to provide browser instance (one per xdist worker by default).
+    
+    With BROWSER_SERVER=shared the worker connects to the controller's browser
+    server instead of launching its own browser.
+    """
     config = get_config()
-    browser_args = get_browser_args()
     
-    browser = playwright_browser_type.launch(
-        headless=config["headless"],
-        slow_mo=config["slow_mo"],
-        **browser_args
-    )
+    if config["browser_server"] == "shared":
+        browser = SharedBrowser(playwright_browser_type, os.environ[ENDPOINT_VARIABLE], slow_mo=config["slow_mo"])
+    else:
+        start = time.perf_counter()
+        browser = playwright_browser_type.launch(
+            headless=config["headless"],
+            slow_mo=config["slow_mo"],
+            **get_browser_args()
+        )
+        RunStats.record_time("browser_launch", time.perf_counter() - start)
+    
+    # Peak memory of this worker's driver and browsers (the shared server is counted by the controller)
+    sampler = None
+    if config["reuse_browser"]:
+        exclude = (_browser_server.pid,) if _browser_server else ()
+        sampler = RssSampler(os.getpid(), include_root=False, exclude=exclude).start()
     
     yield browser
+    
+    if sampler and sampler.stop():
+        RunStats.increment("browser_worker_rss_kb", sampler.peak_kb)
+        RunStats.increment("browser_workers_sampled")
     browser.close()
 
+@pytest.fixture(scope="session")
+def async_runner(local_server):
+    """Async Playwright on a background event loop, for running many contexts concurrently.
+    
+    Use it with the page objects in src/pages/async_pages:
+    async_runner.run_scenarios(scenario, count=20) runs scenario(page, index) in 20 contexts at once.
+    """
+    config = get_config()
+    runner = AsyncRunner(
+        config["browser_name"],
+        {"headless": config["headless"], "slow_mo": config["slow_mo"], **get_browser_args()},
+        {"viewport": config["viewport"]},
+        config["base_url"],
+        config["timeout"],
+    ).start()
+    yield runner
+    runner.stop()
+
+@pytest.fixture(scope=_browser_scope)
+def context_pool(browser, local_server):
+    """Per-worker pool of contexts prepared ahead of demand (CONTEXT_POOL=N), or None.
+    
+    Off when contexts need per-test creation arguments (video, HAR recording)
+    or the browser itself is per test (REUSE_BROWSER=false).
+    Pooled pages are only navigated to BASE_URL in advance when no per-test
+    routes (HAR replay, resource blocking) have to be installed first.
+    """
+    config = get_config()
+    if (not config["context_pool"] or not config["reuse_browser"]
+            or config["video"] != "off" or config["har_mode"] == "record"):
+        yield None
+        return
+    
+    pool = ContextPool(
+        browser,
+        {"viewport": config["viewport"]},
+        config["base_url"],
+        size=config["context_pool"],
+        reuse=config["context_reuse"],
+        timeout=config["timeout"],
+        navigate=config["har_mode"] == "off" and config["block_profile"] == "off",
+    ).start()
+    yield pool
+    pool.stop()
+
 @pytest.fixture(scope="function")
-def page(browser):
+def page(browser, local_server, context_pool, request):
     """Fixture to provide page instance"""
     config = get_config()
     
-    context = browser.new_context(
-        viewport=config["viewport"],
-        record_video_dir="videos/" if config["video"] else None
-    )
+    recorder = VideoRecorder(config["video"], size=config["video_size"], viewport=config["viewport"])
+    context_args = {
+        "viewport": config["viewport"],
+        **recorder.context_args(),
+    }
+    if config["har_mode"] == "record":
+        context_args.update(record_context_args(config["har_dir"], request.node.nodeid))
+    if request.node.get_closest_marker("authenticated"):
+        context_args["storage_state"] = request.getfixturevalue("auth_state")
     
-    if config["trace"]:
-        context.tracing.start(screenshots=True, snapshots=True)
+    start = time.perf_counter()
+    pooled = context_pool is not None and context_args == context_pool.context_args
+    if pooled:
+        context, page = context_pool.acquire()
+    else:
+        context = browser.new_context(**context_args)
+    
+    if config["har_mode"] == "replay":
+        HarReplayer(config["har_dir"], request.node.nodeid, config["har_miss"]).install(context)
+    blocker = ResourceBlocker(resolve_profile(request.node, config["block_profile"]), config["base_url"])
+    blocker.install(context)
     
-    page = context.new_page()
-    page.set_default_timeout(config["timeout"])
+    if not pooled:
+        page = context.new_page()
+        page.set_default_timeout(config["timeout"])
+    if config["trace"]:
+        page.trace_buffer = TraceBuffer(context, max_actions=config["trace_actions"])
+        page.trace_buffer.start(request.node.nodeid)
+    RunStats.record_time("context_setup", time.perf_counter() - start)
     
     # Add screenshot helper as a page attribute
     from src.utils.screenshot_helper import ScreenshotHelper
     page.screenshot_helper = ScreenshotHelper(page)
     
-    # Navigate to base URL
-    page.goto(config["base_url"])
+    budgets = PerfBudget.install(page, resolve_mode(request.node, config["perf_budgets"]))
+    PageMetrics.install(page, request.node.nodeid, force=budgets)
+    
+    # Navigate to base URL (pooled pages may already be there)
+    if not (pooled and context_pool.navigate):
+        page.goto(config["base_url"])
     
     yield page
     
     # Take screenshot on test failure if enabled
-    if hasattr(pytest, "current_test") and pytest.current_test.failed and config["screenshot"]:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = f"screenshots/failure_{pytest.current_test.name}_{timestamp}.png"
-        page.screenshot(path=screenshot_path)
-        allure.attach.file(screenshot_path, name="screenshot", attachment_type=allure.attachment_type.PNG)
+    if config["screenshot"] and failed(request.node):
+        ScreenshotPipeline.capture(page, f"failure_{request.node.name}")
     
-    # Stop tracing and save trace file if enabled
-    if config["trace"] and hasattr(pytest, "current_test"):
-        trace_path = f"traces/{pytest.current_test.name}.zip"
-        context.tracing.stop(path=trace_path)
+    # Save the test's trace chunk only if it failed
+    if config["trace"]:
+        page.trace_buffer.finish(request.node)
     
-    context.close()
+    if pooled:
+        context_pool.release(context, page, reusable=not failed_or_retried(request.node))
+    else:
+        recorder.close_context(context)
+        recorder.finish(page, request.node)
+    blocker.record(request.node)
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item):
+    """Fail a test that passed but exceeded a hard performance budget (only reached if the test body passed)"""
+    enforce(getattr(item, "funcargs", {}).get("page"))
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -125,7 +338,155 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     
     if rep.when == "call":
-        setattr(pytest, "current_test", item)
-        setattr(pytest.current_test, "failed", rep.failed)
-        setattr(pytest.current_test, "name", item.name)
- 
\ No newline at end of file
+        apply_to_report(rep, item.funcargs.get("page"))
+    
+    # Fixtures decide which artifacts to keep from these (see artifacts.failed_or_retried)
+    setattr(item, f"rep_{rep.when}", rep)
+    
+    # Buffered page-object steps are written to the Allure result once the test is over
+    if rep.when == "teardown" and StepTrace.mode not in (None, "live"):
+        listener = item.config.pluginmanager.getplugin("allure_listener")
+        test_result = listener.allure_logger.get_test(None) if listener else None
+        StepTrace.flush(test_result, failed_or_retried(item) or rep.failed)
+ 
+@pytest.fixture(scope="function")
+def cart_with(page):
+    """Factory fixture: cart_with(products) fills the cart over HTTP and returns the page on /view_cart"""
+    from src.pages.cart_page import CartPage
+    
+    def _cart_with(products):
+        base_url = get_config()["base_url"]
+        CartSeeder(page.context, base_url).seed(products)
+        page.goto(f"{base_url}/view_cart")
+        CartPage(page).wait_for_page_load()
+        return page
+    
+    return _cart_with
+
+def _duration_history():
+    config = get_config()
+    return DurationHistory(config["duration_history"], config["browser_name"], config["environment"])
+
+# Filled from test reports on the xdist controller (or the only process without xdist)
+_test_durations = defaultdict(float)
+_test_markers = {}
+_worker_busy = defaultdict(float)
+_summary_lines = []
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep only this machine's share of the tests with SHARD=i/N, and order them longest-first with SCHEDULE=duration.
+    
+    Runs after -m/-k deselection, so a shard splits only the selected tests.
+    Both use the duration history. Shards are balanced by estimated duration;
+    every machine computes the same split, so each test runs on exactly one.
+    Every xdist worker collects the same order and the load scheduler hands tests
+    out in collection order, so the longest tests start first and short ones fill
+    the gaps at the end of the run.
+    """
+    settings = get_config()
+    shard = parse_shard(settings["shard"])
+    if settings["schedule"] != "duration" and shard is None:
+        return
+    registered = registered_markers(config)
+    estimates = _duration_history().estimates(
+        [(item.nodeid, marker_names((m.name for m in item.iter_markers()), registered)) for item in items]
+    )
+    order = {item.nodeid: estimate for item, estimate in zip(items, estimates)}
+    
+    if shard is not None:
+        index, count = shard
+        selected = set(assign_shards(order.items(), count)[index - 1])
+        deselected = [item for item in items if item.nodeid not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+        if worker_id() in ("main", "gw0"):
+            # With xdist the controller does not collect; gw0 hands the line over in its workeroutput
+            _summary_lines.append(
+                f"shard {index}/{count}: {len(items)} of {len(order)} tests, "
+                f"estimated {sum(order[item.nodeid] for item in items):.1f}s of {sum(order.values()):.1f}s"
+            )
+    
+    if settings["schedule"] == "duration":
+        items.sort(key=lambda item: order[item.nodeid], reverse=True)
+
+def pytest_sessionstart(session):
+    """Remember when the run started, for the wall-clock time in the timings file"""
+    session.started = time.time()
+
+def pytest_runtest_logreport(report):
+    """Add up setup, call and teardown time per test and per worker"""
+    if worker_id() != "main":
+        return
+    node = getattr(report, "node", None)
+    worker = node.gateway.id if node is not None else "main"
+    _test_durations[report.nodeid] += report.duration
+    _worker_busy[worker] += report.duration
+    _test_markers.setdefault(report.nodeid, list(report.keywords))
+
+def pytest_sessionfinish(session):
+    """Hand this worker's data over to the xdist controller, or write page metrics and update the duration history"""
+    # Screenshots are written in the background; this is the only place the run waits for them
+    ScreenshotPipeline.wait()
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["run_stats"] = RunStats.export()
+        session.config.workeroutput["page_metrics"] = PageMetrics.export()
+        session.config.workeroutput["budget_violations"] = PerfBudget.export()
+        session.config.workeroutput["summary_lines"] = list(_summary_lines)
+        return
+    metrics_path = PageMetrics.write()
+    if metrics_path:
+        _summary_lines.append(f"page metrics: {len(PageMetrics.rows())} samples written to {metrics_path}")
+    if not _test_durations:
+        return
+    
+    registered = registered_markers(session.config)
+    markers = {nodeid: marker_names(names, registered) for nodeid, names in _test_markers.items()}
+    history = _duration_history()
+    estimates = history.estimates([(nodeid, markers[nodeid]) for nodeid in _test_durations])
+    workers = len(_worker_busy)
+    _summary_lines.append(
+        f"makespan ({workers} worker{'s' if workers != 1 else ''}): "
+        f"predicted={predicted_makespan(estimates, workers):.1f}s actual={max(_worker_busy.values()):.1f}s "
+        f"(schedule={get_config()['schedule']})"
+    )
+    history.update(_test_durations, markers)
+    history.save()
+    config = get_config()
+    write_timings(
+        _test_durations, markers, config["browser_name"], config["environment"], config["shard"],
+        workers, time.time() - session.started,
+    )
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect run stats, page metrics, budget violations and summary lines from a finished xdist worker"""
+    workeroutput = getattr(node, "workeroutput", {})
+    data = workeroutput.get("run_stats")
+    if data:
+        RunStats.merge(data)
+    PageMetrics.merge(workeroutput.get("page_metrics", []))
+    PerfBudget.merge(workeroutput.get("budget_violations", []))
+    _summary_lines.extend(workeroutput.get("summary_lines", []))
+
+def pytest_terminal_summary(terminalreporter):
+    """Report browser launch time versus per-test context time and other run stats"""
+    lines = RunStats.summary_lines()
+    har_line = hit_rate_line()
+    if har_line:
+        lines.append(har_line)
+    lines.extend(_summary_lines)
+    for line in (browser_summary_line(_browser_server), video_summary_line(), pool_summary_line()):
+        if line:
+            lines.append(line)
+    if lines:
+        terminalreporter.section("framework timings")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    violations = PerfBudget.violations()
+    if violations:
+        terminalreporter.section("performance budgets")
+        for violation in violations:
+            terminalreporter.write_line(f"[{violation['mode']}] {violation['test']}: {describe(violation)}")
@@ -17,7 +17,25 @@ def get_config():
         "base_url": os.getenv("BASE_URL", "https://automationexercise.com"),
         "screenshot": os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true",
         "trace": os.getenv("TRACING", "false").lower() == "true",
-        "video": os.getenv("VIDEO", "false").lower() == "true",
+        "trace_actions": int(os.getenv("TRACE_ACTIONS", "0")),
+        "perf_budgets": os.getenv("PERF_BUDGETS", "off").lower(),
+        "context_pool": int(os.getenv("CONTEXT_POOL", "0")),
+        "context_reuse": os.getenv("CONTEXT_REUSE", "reset").lower(),
+        "video": os.getenv("VIDEO", "off").lower(),
+        "video_size": os.getenv("VIDEO_SIZE", ""),
+        "reuse_browser": os.getenv("REUSE_BROWSER", "true").lower() == "true",
+        "browser_server": os.getenv("BROWSER_SERVER", "per-worker").lower(),
+        "local_server": os.getenv("LOCAL_SERVER", "false").lower() == "true",
+        "local_server_port": int(os.getenv("LOCAL_SERVER_PORT", "0")),
+        "har_mode": os.getenv("HAR_MODE", "off").lower(),
+        "har_dir": os.getenv("HAR_DIR", "hars"),
+        "har_miss": os.getenv("HAR_MISS", "fallback").lower(),
+        "block_profile": os.getenv("BLOCK_PROFILE", "off").lower(),
+        "auth_state_dir": os.getenv("AUTH_STATE_DIR", ".auth"),
+        "auth_state_ttl": int(os.getenv("AUTH_STATE_TTL", "1800")),
+        "environment": os.getenv("ENVIRONMENT", "staging"),
+        "schedule": os.getenv("SCHEDULE", "default").lower(),
+        "duration_history": os.getenv("DURATION_HISTORY", ".durations.json"),
     }
 
 def get_browser_args():
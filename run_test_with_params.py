@@ -3,6 +3,7 @@ import os
 import sys
 import subprocess
 import argparse
+from src.utils.allure_report import IncrementalAllureReport, build_report
 
 def parse_args():
     """Parse command line arguments"""
@@ -15,6 +16,10 @@ def parse_args():
                       help="Run in headless mode (default: true)")
     parser.add_argument("--allure", action="store_true", 
                       help="Generate Allure report")
+    parser.add_argument("--allure_report", choices=["full", "incremental"], default="full",
+                      help="Run a full allure generate, or update a static summary page from new results only (default: full)")
+    parser.add_argument("--allure_stream", type=int, default=0,
+                      help="Refresh a partial report every N seconds while tests run (default: 0, off)")
     parser.add_argument("--test_file", default="tests/test_smoke.py",
                       help="Test file to run (default: tests/test_smoke.py)")
     parser.add_argument("--test_mark", 
@@ -56,15 +61,19 @@ def run_test_with_params():
     print(f"Command: {cmd}")
     
     # Run the command
-    result = subprocess.run(cmd, shell=True)
+    process = subprocess.Popen(cmd, shell=True)
+    if args.allure and args.allure_stream:
+        returncode = IncrementalAllureReport().stream(process, args.allure_stream)
+    else:
+        returncode = process.wait()
     
     # Generate Allure report if requested
-    if args.allure and result.returncode == 0:
+    if args.allure and returncode == 0:
         print("Generating Allure report...")
-        subprocess.run("allure generate allure-results --clean -o allure-report", shell=True)
+        build_report(args.allure_report)
         print("Allure report generated in allure-report directory")
     
-    return result.returncode
+    return returncode
 
 if __name__ == "__main__":
     sys.exit(run_test_with_params())
@@ -4,6 +4,9 @@ import sys
 import argparse
 import subprocess
 from dotenv import load_dotenv
+from src.utils.allure_report import IncrementalAllureReport, build_report
+from src.utils.load_runner import FLOWS, run_load
+from src.utils.shard_merge import ShardMerger
 
 def parse_args():
     """Parse command line arguments"""
@@ -25,15 +28,63 @@ def parse_args():
     parser.add_argument("--headed", action="store_true", help="Run in headed mode")
     parser.add_argument("--slowmo", type=int, default=0, help="Slow down execution by ms")
     parser.add_argument("--screenshot", action="store_true", help="Take screenshots on failure")
-    parser.add_argument("--video", action="store_true", help="Record video of tests")
-    parser.add_argument("--trace", action="store_true", help="Record trace of tests")
+    parser.add_argument("--video", nargs="?", const="on", default="off",
+                        choices=["off", "on", "retain-on-failure"],
+                        help="Record video of tests; retain-on-failure keeps only failed or re-run tests")
+    parser.add_argument("--video-size", default="",
+                        help="Record video at WIDTHxHEIGHT (e.g. 640x360) instead of the viewport size")
+    parser.add_argument("--trace", action="store_true", help="Record traces; only failed tests' traces are saved")
+    parser.add_argument("--trace-actions", type=int, default=0,
+                        help="With --trace, keep only the last 1 to N page-object actions before a failure")
+    parser.add_argument("--har", choices=["record", "replay"],
+                        help="Record network traffic to HAR archives or replay it from them")
+    parser.add_argument("--block", choices=["off", "third_party", "aggressive", "auto"], default="off",
+                        help="Resource blocking profile (auto picks one per test marker)")
+    
+    parser.add_argument("--steps", choices=["live", "buffered", "failure"], default="live",
+                        help="Write Allure steps as they happen, at test end, or only for failed tests")
+    parser.add_argument("--step-level", choices=["full", "page", "off"], default="full",
+                        help="Record every primitive, only page-object methods, or no steps")
+    parser.add_argument("--page-metrics", choices=["off", "json", "csv"], default="off",
+                        help="Record Navigation Timing and Web Vitals per page object to reports/page_metrics.*")
+    parser.add_argument("--budgets", choices=["off", "soft", "hard"], default="off",
+                        help="Check page-object performance budgets; hard fails tests that exceed them")
     
     # Report options
     parser.add_argument("--html", action="store_true", help="Generate HTML report")
     parser.add_argument("--allure", action="store_true", help="Generate Allure report")
+    parser.add_argument("--allure-report", choices=["full", "incremental"], default="full",
+                        help="Run a full allure generate, or update a static summary page from new and changed results only")
+    parser.add_argument("--allure-stream", type=int, default=0, metavar="SECONDS",
+                        help="Refresh a partial report every SECONDS while tests run (0 disables)")
     
     # Parallel execution
+    parser.add_argument("--context-pool", type=int, default=0,
+                        help="Contexts each worker prepares ahead of demand (0 disables the pool)")
+    parser.add_argument("--context-reuse", choices=["reset", "discard"], default="reset",
+                        help="After a passing test, reset its pooled context for reuse or replace it")
     parser.add_argument("--workers", type=int, default=1, help="Number of parallel workers")
+    parser.add_argument("--browser-server", choices=["per-worker", "shared"], default="per-worker",
+                        help="Launch a browser per worker, or one browser server all workers connect to")
+    parser.add_argument("--schedule", choices=["duration", "default"], default="duration",
+                        help="Start the longest tests first, using durations from previous runs")
+    parser.add_argument("--shard", default="",
+                        help="Run only shard i of N (i/N), balanced by durations from previous runs")
+    parser.add_argument("--merge-shards", nargs="+", metavar="DIR",
+                        help="Merge the results of sharded runs (one directory per shard) instead of running tests")
+    parser.add_argument("--merge-output", default="merged", help="Directory the merged shard results are written to")
+    
+    # Load mode
+    parser.add_argument("--load", action="store_true",
+                        help="Run a page-object flow as concurrent virtual users instead of the test suite")
+    parser.add_argument("--flow", choices=sorted(FLOWS), default="search_and_cart", help="Flow each virtual user runs")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds over which users are started")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to run, ramp-up included")
+    parser.add_argument("--think-time", type=float, default=1.0,
+                        help="Mean pause in seconds after each action (+-50%% jitter)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Exit non-zero if more than this fraction of iterations fail")
     
     return parser.parse_args()
 
@@ -48,12 +99,29 @@ def setup_env_vars(args):
     os.environ["SLOWMO"] = str(args.slowmo)
     os.environ["ENVIRONMENT"] = args.env
     os.environ["SCREENSHOT_ON_FAILURE"] = "true" if args.screenshot else "false"
-    os.environ["VIDEO"] = "true" if args.video else "false"
+    os.environ["VIDEO"] = args.video
+    os.environ["VIDEO_SIZE"] = args.video_size
     os.environ["TRACING"] = "true" if args.trace else "false"
+    os.environ["TRACE_ACTIONS"] = str(args.trace_actions)
+    os.environ["HAR_MODE"] = args.har or "off"
+    os.environ["BLOCK_PROFILE"] = args.block
+    os.environ["SCHEDULE"] = args.schedule
+    os.environ["STEP_MODE"] = args.steps
+    os.environ["STEP_LEVEL"] = args.step_level
+    os.environ["PAGE_METRICS"] = args.page_metrics
+    os.environ["PERF_BUDGETS"] = args.budgets
+    os.environ["CONTEXT_POOL"] = str(args.context_pool)
+    os.environ["CONTEXT_REUSE"] = args.context_reuse
+    os.environ["BROWSER_SERVER"] = args.browser_server
+    os.environ["SHARD"] = args.shard
     
     # Set environment-specific base URL
     if args.env == "local":
-        os.environ["BASE_URL"] = os.getenv("LOCAL_URL", "http://localhost:3000")
+        if os.getenv("LOCAL_URL"):
+            os.environ["BASE_URL"] = os.getenv("LOCAL_URL")
+        else:
+            # Each worker starts the bundled stand-in storefront (src/local_store)
+            os.environ["LOCAL_SERVER"] = "true"
     elif args.env == "dev":
         os.environ["BASE_URL"] = os.getenv("DEV_URL", "https://dev-automationexercise.com")
     elif args.env == "staging":
@@ -74,7 +142,7 @@ def build_pytest_command(args):
     
     # Parallel execution
     if args.workers > 1:
-        cmd.append(f"-n {args.workers}")
+        cmd.append(f"-n {args.workers} --dist load")
     
     # Reporting options
     if args.html:
@@ -93,6 +161,19 @@ def run_tests():
     args = parse_args()
     setup_env_vars(args)
     
+    if args.merge_shards:
+        for line in ShardMerger(args.merge_shards, args.merge_output).merge():
+            print(line)
+        if args.allure:
+            report = os.path.join(args.merge_output, "allure-report")
+            build_report(args.allure_report, os.path.join(args.merge_output, "allure-results"), report)
+            print(f"Allure report generated in {report}")
+        return 0
+    
+    if args.load:
+        report = run_load(args.flow, args.users, args.duration, args.ramp_up, args.think_time)
+        return 0 if report["error_rate"] <= args.max_error_rate else 1
+    
     # Ensure directories exist
     os.makedirs("reports", exist_ok=True)
     os.makedirs("screenshots", exist_ok=True)
@@ -104,15 +185,19 @@ def run_tests():
     cmd = build_pytest_command(args)
     print(f"Running command: {cmd}")
     
-    result = subprocess.run(cmd, shell=True)
+    process = subprocess.Popen(cmd, shell=True)
+    if args.allure and args.allure_stream:
+        returncode = IncrementalAllureReport().stream(process, args.allure_stream)
+    else:
+        returncode = process.wait()
     
     # Generate Allure report if requested
     if args.allure:
         print("Generating Allure report...")
-        subprocess.run("allure generate allure-results --clean -o allure-report", shell=True)
+        build_report(args.allure_report)
         print("Allure report generated in allure-report directory")
     
-    return result.returncode
+    return returncode
 
 if __name__ == "__main__":
     sys.exit(run_tests())
@@ -0,0 +1,59 @@
+"""Product catalogue served by the local stand-in storefront.
+
+Names and prices mirror the products the test data relies on
+(see ``TestData.TEST_PRODUCTS`` and ``TestData.SEARCH_TERMS``).
+"""
+
+PRODUCTS = [
+    {"id": 1, "name": "Blue Top", "price": 500, "category": "Women > Tops", "brand": "Polo"},
+    {"id": 2, "name": "Men Tshirt", "price": 400, "category": "Men > Tshirts", "brand": "H&M"},
+    {"id": 3, "name": "Sleeveless Dress", "price": 1000, "category": "Women > Dress", "brand": "Madame"},
+    {"id": 4, "name": "Stylish Dress", "price": 1500, "category": "Women > Dress", "brand": "Madame"},
+    {"id": 5, "name": "Winter Top", "price": 600, "category": "Women > Tops", "brand": "Mast & Harbour"},
+    {"id": 6, "name": "Summer White Top", "price": 400, "category": "Women > Tops", "brand": "Mast & Harbour"},
+    {"id": 7, "name": "Madame Top For Women", "price": 1000, "category": "Women > Tops", "brand": "Madame"},
+    {"id": 8, "name": "Fancy Green Top", "price": 700, "category": "Women > Tops", "brand": "Polo"},
+    {"id": 11, "name": "Blue Cotton Indie Mickey Dress", "price": 1530, "category": "Women > Dress", "brand": "Biba"},
+    {"id": 12, "name": "Long Maxi Tulle Fancy Dress Up Outfits", "price": 1000, "category": "Kids > Dress", "brand": "Babyhug"},
+    {"id": 13, "name": "Sleeveless Unicorn Patch Gown", "price": 1050, "category": "Kids > Dress", "brand": "Babyhug"},
+    {"id": 14, "name": "Cotton Mull Embroidered Dress", "price": 1500, "category": "Women > Dress", "brand": "Biba"},
+    {"id": 15, "name": "Blue Cotton Indie Mickey Dress - Kids", "price": 1530, "category": "Kids > Dress", "brand": "Babyhug"},
+    {"id": 16, "name": "Sleeves Top and Short - Blue & Pink", "price": 478, "category": "Kids > Tops & Shirts", "brand": "Kookie Kids"},
+    {"id": 18, "name": "Little Girls Mr. Panda Shirt", "price": 543, "category": "Kids > Tops & Shirts", "brand": "Allen Solly Junior"},
+    {"id": 19, "name": "Sleeveless Unicorn Print Fit & Flare Net Dress - Multi", "price": 1100, "category": "Kids > Dress", "brand": "Kookie Kids"},
+    {"id": 20, "name": "Cotton Silk Hand Block Print Saree", "price": 3000, "category": "Women > Saree", "brand": "Biba"},
+    {"id": 21, "name": "Rust Red Linen Saree", "price": 3500, "category": "Women > Saree", "brand": "Biba"},
+    {"id": 22, "name": "Beautiful Peacock Blue Cotton Linen Saree", "price": 5000, "category": "Women > Saree", "brand": "Biba"},
+    {"id": 23, "name": "Lace Top For Women", "price": 1400, "category": "Women > Tops", "brand": "Madame"},
+    {"id": 24, "name": "GRAPHIC DESIGN MEN T SHIRT - BLUE", "price": 1389, "category": "Men > Tshirts", "brand": "Polo"},
+    {"id": 28, "name": "Pure Cotton V-Neck T-Shirt", "price": 1299, "category": "Men > Tshirts", "brand": "H&M"},
+    {"id": 29, "name": "Green Side Placket Detail T-Shirt", "price": 1000, "category": "Men > Tshirts", "brand": "Polo"},
+    {"id": 30, "name": "Premium Polo T-Shirts", "price": 1500, "category": "Men > Tshirts", "brand": "Polo"},
+    {"id": 31, "name": "Pure Cotton Neon Green Tshirt", "price": 850, "category": "Men > Tshirts", "brand": "H&M"},
+    {"id": 33, "name": "Soft Stretch Jeans", "price": 799, "category": "Men > Jeans", "brand": "Mast & Harbour"},
+    {"id": 35, "name": "Regular Fit Straight Jeans", "price": 1200, "category": "Men > Jeans", "brand": "H&M"},
+    {"id": 37, "name": "Grunt Blue Slim Fit Jeans", "price": 1400, "category": "Men > Jeans", "brand": "Allen Solly Junior"},
+    {"id": 38, "name": "Colour Blocked Shirt – Sky Blue", "price": 1100, "category": "Kids > Tops & Shirts", "brand": "Allen Solly Junior"},
+    {"id": 39, "name": "Frozen Tops For Kids", "price": 278, "category": "Kids > Tops & Shirts", "brand": "Kookie Kids"},
+    {"id": 40, "name": "Full Sleeves Top Cherry - Pink", "price": 679, "category": "Kids > Tops & Shirts", "brand": "Kookie Kids"},
+    {"id": 41, "name": "Printed Off Shoulder Top - White", "price": 315, "category": "Women > Tops", "brand": "Mast & Harbour"},
+    {"id": 42, "name": "Half Sleeves Top Schiffli Detailing - Pink", "price": 359, "category": "Women > Tops", "brand": "Kookie Kids"},
+    {"id": 43, "name": "Men Tshirt Classic White", "price": 499, "category": "Men > Tshirts", "brand": "H&M"},
+]
+
+PRODUCTS_BY_ID = {product["id"]: product for product in PRODUCTS}
+
+CATEGORIES = ["Women", "Men", "Kids"]
+
+BRANDS = sorted({product["brand"] for product in PRODUCTS})
+
+
+def search_products(term):
+    """Return products whose name or category contains the search term (case-insensitive)"""
+    term = (term or "").strip().lower()
+    if not term:
+        return list(PRODUCTS)
+    return [
+        product for product in PRODUCTS
+        if term in product["name"].lower() or term in product["category"].lower()
+    ]
@@ -0,0 +1,367 @@
+"""Local stand-in for https://automationexercise.com.
+
+Serves the pages and flows the page objects depend on (products, search,
+cart modal, view_cart, login/signup, checkout, payment and invoice download)
+from memory, so suites can run offline and with deterministic timings.
+
+Run standalone with ``python -m src.local_store.server --port 3000``.
+"""
+
+import argparse
+import json
+import os
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from src.local_store import templates
+from src.local_store.catalog import PRODUCTS, PRODUCTS_BY_ID, search_products
+from src.utils.logger import Logger
+
+SESSION_COOKIE = "sessionid"
+
+
+def default_users():
+    """Users that exist when the server starts (matches TEST_USER_* in .env)"""
+    email = os.getenv("TEST_USER_EMAIL", "test@example.com")
+    return {
+        email: {
+            "name": "Test User",
+            "email": email,
+            "password": os.getenv("TEST_USER_PASSWORD", "password123"),
+            "address": {
+                "company": "Test Company",
+                "address1": "123 Test Street",
+                "address2": "Apt 456",
+                "city": "Test City",
+                "state": "California",
+                "zipcode": "12345",
+                "country": "United States",
+                "mobile_number": "1234567890",
+            },
+        }
+    }
+
+
+class StoreState:
+    """Thread-safe in-memory sessions, users and orders"""
+
+    def __init__(self, users=None):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.users = users if users is not None else default_users()
+        self.subscriptions = []
+        self.orders = []
+
+    def new_session(self):
+        session_id = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[session_id] = {"cart": {}, "user": None, "pending_signup": None}
+        return session_id
+
+    def get_session(self, session_id):
+        with self.lock:
+            return self.sessions.get(session_id)
+
+
+class StorefrontHandler(BaseHTTPRequestHandler):
+    """Request handler; one instance per request, state lives on the server"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalStorefront/1.0"
+
+    # -- plumbing -----------------------------------------------------------
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        # http.server's format is %-style already; the logger fills it in only if debug is on
+        self.server.logger.debug("%s - " + format, self.address_string(), *args)
+
+    def _load_session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        session_id = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        session = self.state.get_session(session_id) if session_id else None
+        self._new_session_id = None
+        if session is None:
+            session_id = self.state.new_session()
+            session = self.state.get_session(session_id)
+            self._new_session_id = session_id
+        self.session = session
+
+    def _current_user(self):
+        email = self.session["user"]
+        return self.state.users.get(email) if email else None
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        if self._new_session_id:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={self._new_session_id}; Path=/; HttpOnly")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _redirect(self, location):
+        self._send(302, headers={"Location": location})
+
+    def _json(self, payload, status=200):
+        self._send(status, json.dumps(payload), content_type="application/json")
+
+    def _form(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        raw = self.rfile.read(length).decode("utf-8") if length else ""
+        return {key: values[0] for key, values in parse_qs(raw, keep_blank_values=True).items()}
+
+    def _cart_lines(self):
+        with self.state.lock:
+            items = list(self.session["cart"].items())
+        return [(PRODUCTS_BY_ID[product_id], quantity) for product_id, quantity in items]
+
+    def _cart_count(self):
+        with self.state.lock:
+            return sum(self.session["cart"].values())
+
+    def _product_id(self, path, prefix):
+        try:
+            product_id = int(path[len(prefix):])
+        except ValueError:
+            return None
+        return product_id if product_id in PRODUCTS_BY_ID else None
+
+    # -- dispatch -----------------------------------------------------------
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        self._load_session()
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = {key: values[0] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+
+        if path == "/static/style.css":
+            return self._send(200, templates.STYLE, content_type="text/css")
+        if path == "/static/app.js":
+            return self._send(200, templates.SCRIPT, content_type="application/javascript")
+        if path.startswith("/get_product_picture/"):
+            return self._send(200, templates.PRODUCT_PICTURE, content_type="image/svg+xml")
+        if path == "/":
+            return self._send(200, templates.home_page(PRODUCTS, self._cart_count(), self._current_user()))
+        if path == "/api/productsList":
+            return self._json({"responseCode": 200, "products": [
+                {"id": product["id"], "name": product["name"], "price": templates.price(product["price"]),
+                 "brand": product["brand"], "category": product["category"]}
+                for product in PRODUCTS
+            ]})
+        if path == "/products":
+            search_term = query.get("search")
+            products = search_products(search_term) if search_term is not None else PRODUCTS
+            return self._send(200, templates.products_page(
+                products, self._cart_count(), search_term, self._current_user()
+            ))
+        if path.startswith("/product_details/"):
+            product_id = self._product_id(path, "/product_details/")
+            if product_id is None:
+                return self._send(404, "Product not found", content_type="text/plain")
+            return self._send(200, templates.product_details_page(
+                PRODUCTS_BY_ID[product_id], self._cart_count(), self._current_user()
+            ))
+        if path.startswith("/add_to_cart/"):
+            return self._add_to_cart(path, query)
+        if path.startswith("/delete_cart/"):
+            return self._delete_from_cart(path)
+        if path == "/view_cart":
+            return self._send(200, templates.cart_page(self._cart_lines(), self._current_user()))
+        if path == "/login":
+            return self._send(200, templates.login_page(self._current_user()))
+        if path == "/logout":
+            self.session["user"] = None
+            return self._redirect("/login")
+        if path == "/delete_account":
+            return self._delete_account()
+        if path == "/account_created":
+            return self._send(200, templates.message_page("ACCOUNT CREATED!", "account-created", self._current_user()))
+        if path == "/checkout":
+            user = self._current_user()
+            if not user:
+                return self._redirect("/login")
+            return self._send(200, templates.checkout_page(user, self._cart_lines()))
+        if path == "/payment":
+            user = self._current_user()
+            if not user:
+                return self._redirect("/login")
+            return self._send(200, templates.payment_page(user))
+        if path.startswith("/payment_done/"):
+            return self._send(200, templates.payment_done_page(self._current_user(), path.rsplit("/", 1)[-1]))
+        if path.startswith("/download_invoice/"):
+            return self._download_invoice(path)
+        return self._send(404, "Not found", content_type="text/plain")
+
+    def do_POST(self):
+        self._load_session()
+        path = urlsplit(self.path).path.rstrip("/")
+        form = self._form()
+
+        if path == "/login":
+            return self._login(form)
+        if path == "/signup":
+            return self._signup(form)
+        if path == "/payment":
+            return self._pay(form)
+        if path == "/subscribe":
+            with self.state.lock:
+                self.state.subscriptions.append(form.get("email", ""))
+            return self._json({"status": "subscribed"})
+        return self._send(404, "Not found", content_type="text/plain")
+
+    # -- flows --------------------------------------------------------------
+
+    def _add_to_cart(self, path, query):
+        product_id = self._product_id(path, "/add_to_cart/")
+        if product_id is None:
+            return self._json({"error": "Product not found"}, status=404)
+        try:
+            quantity = int(query.get("quantity", "1") or 1)
+        except ValueError:
+            quantity = 0
+        if quantity < 1:
+            return self._json({"error": "Invalid quantity"}, status=400)
+        with self.state.lock:
+            cart = self.session["cart"]
+            cart[product_id] = cart.get(product_id, 0) + quantity
+        return self._json({"status": "added", "product_id": product_id})
+
+    def _delete_from_cart(self, path):
+        product_id = self._product_id(path, "/delete_cart/")
+        with self.state.lock:
+            removed = self.session["cart"].pop(product_id, None) is not None
+        return self._json({"status": "deleted" if removed else "missing", "product_id": product_id})
+
+    def _login(self, form):
+        user = self.state.users.get(form.get("email", ""))
+        if user and user["password"] == form.get("password"):
+            self.session["user"] = user["email"]
+            return self._redirect("/")
+        return self._send(200, templates.login_page(login_error="Your email or password is incorrect!"))
+
+    def _signup(self, form):
+        if form.get("form_type") == "create_account":
+            pending = self.session.get("pending_signup") or {}
+            email = pending.get("email") or form.get("email", "")
+            address_fields = ("company", "address1", "address2", "city", "state", "zipcode", "country", "mobile_number")
+            with self.state.lock:
+                self.state.users[email] = {
+                    "name": form.get("name") or pending.get("name", ""),
+                    "email": email,
+                    "password": form.get("password", ""),
+                    "address": {key: form.get(key, "") for key in address_fields},
+                }
+            self.session["user"] = email
+            self.session["pending_signup"] = None
+            return self._redirect("/account_created")
+
+        email = form.get("email", "")
+        if email in self.state.users:
+            return self._send(200, templates.login_page(signup_error="Email Address already exist!"))
+        self.session["pending_signup"] = {"name": form.get("name", ""), "email": email}
+        return self._send(200, templates.signup_page(form.get("name", ""), email))
+
+    def _delete_account(self):
+        email = self.session["user"]
+        if email:
+            with self.state.lock:
+                self.state.users.pop(email, None)
+            self.session["user"] = None
+        return self._send(200, templates.message_page("ACCOUNT DELETED!", "account-deleted"))
+
+    def _pay(self, form):
+        user = self._current_user()
+        if not user:
+            return self._redirect("/login")
+        required = ("name_on_card", "card_number", "cvc", "expiry_month", "expiry_year")
+        if not all(form.get(field) for field in required):
+            return self._send(200, templates.payment_page(user))
+        amount = sum(product["price"] * quantity for product, quantity in self._cart_lines())
+        with self.state.lock:
+            self.state.orders.append({"email": user["email"], "cart": dict(self.session["cart"]), "amount": amount})
+            self.session["cart"] = {}
+        return self._redirect(f"/payment_done/{amount}")
+
+    def _download_invoice(self, path):
+        user = self._current_user()
+        name = user["name"] if user else "Guest"
+        amount = path.rsplit("/", 1)[-1]
+        body = f"Hi {name}, Your total purchase amount is {amount}. Thank you"
+        return self._send(200, body, content_type="text/plain", headers={
+            "Content-Disposition": 'attachment; filename="invoice.txt"',
+        })
+
+
+class StorefrontServer(ThreadingHTTPServer):
+    """Threaded HTTP server that can serve many browser contexts concurrently"""
+
+    daemon_threads = True
+    block_on_close = False
+    request_queue_size = 256
+
+    def __init__(self, host="127.0.0.1", port=0, users=None):
+        super().__init__((host, port), StorefrontHandler)
+        self.state = StoreState(users)
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="local-storefront", daemon=True)
+        self._thread.start()
+        self.logger.info("Local storefront listening on %s", self.url)
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local stand-in storefront")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=3000, help="Port to listen on")
+    args = parser.parse_args()
+
+    server = StorefrontServer(args.host, args.port)
+    print(f"Serving local storefront on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
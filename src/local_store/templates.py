@@ -0,0 +1,395 @@
+"""HTML rendering for the local stand-in storefront.
+
+The markup keeps the ids, classes and data-qa attributes used by the page
+objects in ``src/pages`` so the same tests run unchanged against it.
+"""
+
+from html import escape
+
+from src.local_store.catalog import BRANDS, CATEGORIES
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; }
+header, footer, section { padding: 12px 24px; }
+.nav a { margin-right: 12px; }
+.product-image-wrapper { display: inline-block; width: 220px; margin: 8px; vertical-align: top; }
+.modal { display: none; position: fixed; top: 30%; left: 35%; background: #fff; border: 1px solid #ccc; padding: 16px; }
+.modal.show { display: block; }
+.alert-success { display: none; color: green; }
+.alert-danger { color: red; }
+#empty_cart { display: none; }
+table { border-collapse: collapse; }
+td, th { padding: 6px 10px; }
+"""
+
+PRODUCT_PICTURE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="200" height="200">'
+    '<rect width="200" height="200" fill="#eee"/></svg>'
+)
+
+SCRIPT = """
+document.addEventListener('click', function (event) {
+  var addButton = event.target.closest('.add-to-cart');
+  if (addButton) {
+    event.preventDefault();
+    fetch('/add_to_cart/' + addButton.dataset.productId, {credentials: 'same-origin'})
+      .then(function () { document.getElementById('cartModal').classList.add('show'); });
+    return;
+  }
+  if (event.target.closest('.close-modal')) {
+    document.getElementById('cartModal').classList.remove('show');
+    return;
+  }
+  var deleteButton = event.target.closest('.cart_quantity_delete');
+  if (deleteButton) {
+    event.preventDefault();
+    fetch('/delete_cart/' + deleteButton.dataset.productId, {credentials: 'same-origin'})
+      .then(function () {
+        document.getElementById('product-' + deleteButton.dataset.productId).remove();
+        if (!document.querySelector('#cart_info tbody tr')) {
+          document.getElementById('cart_info').style.display = 'none';
+          document.getElementById('empty_cart').style.display = 'block';
+        }
+      });
+  }
+});
+function subscribe() {
+  var body = new URLSearchParams({email: document.getElementById('susbscribe_email').value});
+  fetch('/subscribe', {method: 'POST', body: body, credentials: 'same-origin'})
+    .then(function () { document.getElementById('success-subscribe').style.display = 'block'; });
+}
+"""
+
+
+def price(amount):
+    """Format a price the way the storefront shows it"""
+    return f"Rs. {amount}"
+
+
+def layout(title, body, user=None):
+    """Wrap page content in the shared header and footer"""
+    if user:
+        account_links = (
+            '<a href="/logout">Logout</a>'
+            '<a href="/delete_account">Delete Account</a>'
+            f'<span>Logged in as <b>{escape(user["name"])}</b></span>'
+        )
+    else:
+        account_links = '<a href="/login">Signup / Login</a>'
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="/static/style.css">
+</head>
+<body>
+<header id="header">
+  <div class="logo"><a href="/">Automation Exercise</a></div>
+  <div class="nav">
+    <a href="/">Home</a>
+    <a href="/products">Products</a>
+    <a href="/view_cart">Cart</a>
+    {account_links}
+  </div>
+</header>
+{body}
+<footer id="footer">
+  <div class="single-widget">
+    <h2>Subscription</h2>
+    <input type="email" id="susbscribe_email" placeholder="Your email address">
+    <button type="button" id="subscribe" onclick="subscribe()">Subscribe</button>
+    <div class="alert-success" id="success-subscribe">You have been successfully subscribed!</div>
+  </div>
+</footer>
+<script src="/static/app.js"></script>
+</body>
+</html>"""
+
+
+def _product_card(product):
+    return f"""<div class="product-image-wrapper">
+  <div class="single-products">
+    <div class="productinfo text-center">
+      <img src="/get_product_picture/{product["id"]}" alt="ecommerce website products">
+      <h2>{price(product["price"])}</h2>
+      <p>{escape(product["name"])}</p>
+      <a href="#" data-product-id="{product["id"]}" class="btn btn-default add-to-cart">Add to cart</a>
+    </div>
+  </div>
+  <div class="choose">
+    <ul class="nav nav-pills nav-justified">
+      <li><a href="/product_details/{product["id"]}">View Product</a></li>
+    </ul>
+  </div>
+</div>"""
+
+
+def _cart_modal():
+    return """<div class="modal" id="cartModal">
+  <div class="modal-content">
+    <h4 class="modal-title w-100">Added!</h4>
+    <p class="text-center">Your product has been added to cart.</p>
+    <p class="text-center"><a href="/view_cart"><u>View Cart</u></a></p>
+    <button class="btn btn-success close-modal btn-block">Continue Shopping</button>
+  </div>
+</div>"""
+
+
+def _product_grid(heading, products, cart_count):
+    cards = "\n".join(_product_card(product) for product in products)
+    return f"""<div class="features_items">
+  <h2 class="title text-center">{escape(heading)}</h2>
+  <p class="cart-summary">{cart_count} item(s) in cart. <a href="/view_cart">View Cart</a></p>
+  {cards}
+</div>
+{_cart_modal()}"""
+
+
+def _sidebar():
+    categories = "".join(f'<li><a href="/products?search={name}">{name}</a></li>' for name in CATEGORIES)
+    brands = "".join(f'<li><a href="/products?search=">{escape(name)}</a></li>' for name in BRANDS)
+    return f"""<div class="left-sidebar">
+  <h2>Category</h2>
+  <ul class="category-products">{categories}</ul>
+  <h2>Brands</h2>
+  <ul class="brands-name">{brands}</ul>
+</div>"""
+
+
+def home_page(products, cart_count, user=None):
+    """Render the home page with the slider, featured and recommended items"""
+    recommended = "\n".join(_product_card(product) for product in products[:3])
+    body = f"""<section id="slider">
+  <div id="slider-carousel" class="carousel slide">
+    <h1>AutomationExercise</h1>
+    <p>Full-Fledged practice website for Automation Engineers</p>
+  </div>
+</section>
+<section>
+  {_sidebar()}
+  {_product_grid("Features Items", products, cart_count)}
+  <div class="recommended_items">
+    <h2>recommended items</h2>
+    <div id="recommended-item-carousel" class="carousel slide">{recommended}</div>
+  </div>
+</section>"""
+    return layout("Automation Exercise", body, user)
+
+
+def products_page(products, cart_count, search_term=None, user=None):
+    """Render the products listing or search results"""
+    heading = "SEARCHED PRODUCTS" if search_term is not None else "ALL PRODUCTS"
+    value = escape(search_term or "")
+    body = f"""<section id="advertisement"><h2>Products</h2></section>
+<section>
+  <form action="/products" method="get" class="search-form">
+    <input type="text" id="search_product" name="search" placeholder="Search Product" value="{value}">
+    <button type="submit" id="submit_search" class="btn btn-default btn-lg">Search</button>
+  </form>
+  {_sidebar()}
+  {_product_grid(heading, products, cart_count)}
+</section>"""
+    return layout("Automation Exercise - All Products", body, user)
+
+
+def product_details_page(product, cart_count, user=None):
+    """Render a single product page"""
+    body = f"""<section>
+  <div class="product-information">
+    <h2>{escape(product["name"])}</h2>
+    <p>Category: {escape(product["category"])}</p>
+    <span><span>{price(product["price"])}</span>
+      <a href="#" data-product-id="{product["id"]}" class="btn btn-default cart add-to-cart">Add to cart</a>
+    </span>
+    <p><b>Availability:</b> In Stock</p>
+    <p><b>Brand:</b> {escape(product["brand"])}</p>
+  </div>
+  <p class="cart-summary">{cart_count} item(s) in cart. <a href="/view_cart">View Cart</a></p>
+  {_cart_modal()}
+</section>"""
+    return layout("Automation Exercise - Product Details", body, user)
+
+
+def _cart_rows(lines, deletable=True):
+    rows = []
+    for product, quantity in lines:
+        delete_cell = (
+            f'<td class="cart_delete"><a class="cart_quantity_delete" href="#" '
+            f'data-product-id="{product["id"]}">X</a></td>'
+            if deletable else ""
+        )
+        rows.append(f"""<tr id="product-{product["id"]}">
+  <td class="cart_product"><img src="/get_product_picture/{product["id"]}" alt="Product Image"></td>
+  <td class="cart_description"><h4><a href="/product_details/{product["id"]}">{escape(product["name"])}</a></h4>
+    <p>{escape(product["category"])}</p></td>
+  <td class="cart_price"><p>{price(product["price"])}</p></td>
+  <td class="cart_quantity"><button class="disabled">{quantity}</button></td>
+  <td class="cart_total"><p class="cart_total_price">{price(product["price"] * quantity)}</p></td>
+  {delete_cell}
+</tr>""")
+    return "\n".join(rows)
+
+
+def cart_page(lines, user=None):
+    """Render the cart; ``lines`` is a list of (product, quantity) tuples"""
+    table_style = "" if lines else ' style="display: none;"'
+    empty_style = ' style="display: block;"' if not lines else ""
+    body = f"""<section id="cart_items">
+  <div class="table-responsive cart_info" id="cart_info"{table_style}>
+    <table class="table table-condensed" id="cart_info_table">
+      <thead><tr><td>Item</td><td>Description</td><td>Price</td><td>Quantity</td><td>Total</td><td></td></tr></thead>
+      <tbody>
+{_cart_rows(lines)}
+      </tbody>
+    </table>
+  </div>
+  <span id="empty_cart"{empty_style}><p>Cart is empty! Click <a href="/products">here</a> to buy products.</p></span>
+</section>
+<section id="do_action">
+  <a href="/checkout" class="btn btn-default check_out">Proceed To Checkout</a>
+</section>"""
+    return layout("Automation Exercise - Checkout", body, user)
+
+
+def login_page(user=None, login_error=None, signup_error=None):
+    """Render the combined login and signup page"""
+    login_alert = f'<p class="alert-danger">{escape(login_error)}</p>' if login_error else ""
+    signup_alert = f'<p class="alert-danger">{escape(signup_error)}</p>' if signup_error else ""
+    body = f"""<section id="form">
+  <div class="login-form">
+    <h2>Login to your account</h2>
+    <form action="/login" method="post">
+      <input type="email" name="email" data-qa="login-email" placeholder="Email Address" required>
+      <input type="password" name="password" data-qa="login-password" placeholder="Password" required>
+      {login_alert}
+      <button type="submit" class="btn btn-default" data-qa="login-button">Login</button>
+    </form>
+  </div>
+  <h2 class="or">OR</h2>
+  <div class="signup-form">
+    <h2>New User Signup!</h2>
+    <form action="/signup" method="post">
+      <input type="text" name="name" data-qa="signup-name" placeholder="Name" required>
+      <input type="email" name="email" data-qa="signup-email" placeholder="Email Address" required>
+      {signup_alert}
+      <button type="submit" class="btn btn-default" data-qa="signup-button">Signup</button>
+    </form>
+  </div>
+</section>"""
+    return layout("Automation Exercise - Signup / Login", body, user)
+
+
+def _options(values):
+    return "".join(f'<option value="{escape(str(value))}">{escape(str(value))}</option>' for value in values)
+
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+
+COUNTRIES = ["India", "United States", "Canada", "Australia", "Israel", "New Zealand", "Singapore"]
+
+
+def signup_page(name, email):
+    """Render the account information form shown after the first signup step"""
+    body = f"""<section id="form">
+  <div class="login-form">
+    <h2 class="title text-center"><b>Enter Account Information</b></h2>
+    <form action="/signup" method="post">
+      <input type="hidden" name="form_type" value="create_account">
+      <input type="radio" name="title" value="Mr" id="id_gender1"><label for="id_gender1">Mr.</label>
+      <input type="radio" name="title" value="Mrs" id="id_gender2"><label for="id_gender2">Mrs.</label>
+      <input type="text" name="name" data-qa="name" value="{escape(name)}">
+      <input type="email" name="email" data-qa="email" value="{escape(email)}" readonly>
+      <input type="password" name="password" data-qa="password">
+      <select name="days" data-qa="days">{_options(range(1, 32))}</select>
+      <select name="months" data-qa="months">{_options(MONTHS)}</select>
+      <select name="years" data-qa="years">{_options(range(2021, 1899, -1))}</select>
+      <input type="checkbox" name="newsletter" id="newsletter"><label for="newsletter">Newsletter</label>
+      <input type="checkbox" name="optin" id="optin"><label for="optin">Special offers</label>
+      <input type="text" name="first_name" data-qa="first_name">
+      <input type="text" name="last_name" data-qa="last_name">
+      <input type="text" name="company" data-qa="company">
+      <input type="text" name="address1" data-qa="address">
+      <input type="text" name="address2" data-qa="address2">
+      <select name="country" data-qa="country">{_options(COUNTRIES)}</select>
+      <input type="text" name="state" data-qa="state">
+      <input type="text" name="city" data-qa="city">
+      <input type="text" name="zipcode" data-qa="zipcode">
+      <input type="text" name="mobile_number" data-qa="mobile_number">
+      <button type="submit" data-qa="create-account" class="btn btn-default">Create Account</button>
+    </form>
+  </div>
+</section>"""
+    return layout("Automation Exercise - Signup", body)
+
+
+def message_page(message, data_qa, user=None):
+    """Render a confirmation page such as ACCOUNT CREATED! or ACCOUNT DELETED!"""
+    body = f"""<section id="form">
+  <h2 class="title text-center" data-qa="{data_qa}"><b>{escape(message)}</b></h2>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return layout(f"Automation Exercise - {message.title()}", body, user)
+
+
+def checkout_page(user, lines):
+    """Render the address review and order summary"""
+    total = sum(product["price"] * quantity for product, quantity in lines)
+    address = user.get("address", {})
+    address_lines = "".join(
+        f'<li class="address_address1 address_address2">{escape(address.get(key, ""))}</li>'
+        for key in ("company", "address1", "address2")
+    )
+    body = f"""<section id="cart_items">
+  <h2 class="heading">Address Details</h2>
+  <ul class="address item box" id="address_delivery">
+    <li class="address_title"><h3 class="page-subheading">Your delivery address</h3></li>
+    <li class="address_firstname address_lastname">{escape(user["name"])}</li>
+    {address_lines}
+    <li class="address_city address_state_name address_postcode">{escape(address.get("city", ""))} {escape(address.get("state", ""))} {escape(address.get("zipcode", ""))}</li>
+    <li class="address_country_name">{escape(address.get("country", ""))}</li>
+    <li class="address_phone">{escape(address.get("mobile_number", ""))}</li>
+  </ul>
+  <h2 class="heading">Review Your Order</h2>
+  <div class="table-responsive cart_info" id="cart_info">
+    <table class="table table-condensed">
+      <tbody>
+{_cart_rows(lines, deletable=False)}
+      <tr><td colspan="4"><h4><b>Total Amount</b></h4></td><td><p class="cart_total_price">{price(total)}</p></td></tr>
+      </tbody>
+    </table>
+  </div>
+  <textarea name="message" class="form-control"></textarea>
+  <a href="/payment" class="btn btn-default check_out">Place Order</a>
+</section>"""
+    return layout("Automation Exercise - Checkout", body, user)
+
+
+def payment_page(user):
+    """Render the card payment form"""
+    body = """<section id="cart_items">
+  <h2 class="heading">Payment</h2>
+  <form action="/payment" method="post" id="payment-form">
+    <input type="text" name="name_on_card" data-qa="name-on-card">
+    <input type="text" name="card_number" data-qa="card-number">
+    <input type="text" name="cvc" data-qa="cvc" placeholder="ex. 311">
+    <input type="text" name="expiry_month" data-qa="expiry-month" placeholder="MM">
+    <input type="text" name="expiry_year" data-qa="expiry-year" placeholder="YYYY">
+    <button type="submit" id="submit" data-qa="pay-button" class="btn btn-default">Pay and Confirm Order</button>
+  </form>
+</section>"""
+    return layout("Automation Exercise - Payment", body, user)
+
+
+def payment_done_page(user, amount):
+    """Render the order confirmation with the invoice download link"""
+    body = f"""<section id="form">
+  <h2 class="title text-center" data-qa="order-placed"><b>ORDER PLACED!</b></h2>
+  <p>Congratulations! Your order has been confirmed!</p>
+  <a href="/download_invoice/{amount}" class="btn btn-default check_out">Download Invoice</a>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return layout("Automation Exercise - Order Placed", body, user)
@@ -0,0 +1,138 @@
+import time
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.pages.base_page import (
+    EXTRACT_SCRIPT,
+    FIRST_VISIBLE_STATE_SCRIPT,
+    RESOURCE_LOADED_SCRIPT,
+    extract_spec,
+    readiness_strategy,
+)
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+from src.utils.screenshot_pipeline import ScreenshotPipeline
+
+class AsyncBasePage:
+    """Base page for the playwright.async_api page objects.
+
+    Mirrors BasePage method for method; selectors and readiness conditions come
+    from the same locator classes in src/pages/locators.py. There are no allure
+    steps here: many pages run concurrently on one event loop, and allure's step
+    stack would interleave their steps.
+    """
+
+    ready_load_state = "domcontentloaded"
+    ready_selectors = []
+    ready_any_selectors = []
+    ready_response = None
+    ready_function = None
+
+    def __init__(self, page):
+        self.page = page
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    async def wait_for_page_load(self, strategy=None):
+        """Wait until the page is ready to use (see BasePage.wait_for_page_load)"""
+        strategy = readiness_strategy(strategy)
+
+        start = time.perf_counter()
+        if strategy == "page":
+            await self._wait_until_ready()
+        else:
+            await self.page.wait_for_load_state(strategy)
+        elapsed = time.perf_counter() - start
+
+        RunStats.record_time(f"ready_{strategy}", elapsed)
+        self.logger.info("%s ready via %s in %.0fms", self.__class__.__name__, strategy, elapsed * 1000)
+
+    async def _wait_until_ready(self):
+        """Wait for this page object's readiness condition"""
+        await self.page.wait_for_load_state(self.ready_load_state)
+        for selector in self.ready_selectors:
+            await self.page.wait_for_selector(selector, state="visible")
+        if self.ready_any_selectors:
+            states = {selector: selector for selector in self.ready_any_selectors}
+            await self.page.wait_for_function(FIRST_VISIBLE_STATE_SCRIPT, arg=states)
+        if self.ready_response:
+            await self.page.wait_for_function(RESOURCE_LOADED_SCRIPT, arg=self.ready_response)
+        if self.ready_function:
+            await self.page.wait_for_function(self.ready_function)
+
+    def navigation_count(self):
+        """Number of main-frame navigations since first asked; lets page objects cache DOM reads"""
+        page = self.page
+        if not hasattr(page, "navigation_count"):
+            page.navigation_count = 0
+
+            def on_navigated(frame):
+                if frame == page.main_frame:
+                    page.navigation_count += 1
+
+            page.on("framenavigated", on_navigated)
+        return page.navigation_count
+
+    async def wait_for_selector(self, selector, state="visible", timeout=10000):
+        """Wait for an element to be visible"""
+        self.logger.info("Waiting for selector: %s", selector)
+        return await self.page.wait_for_selector(selector, state=state, timeout=timeout)
+
+    async def click(self, selector):
+        """Click on an element"""
+        self.logger.info("Clicking on: %s", selector)
+        await self.page.click(selector)
+
+    async def fill(self, selector, value):
+        """Fill a text field"""
+        self.logger.info("Filling %s with: %s", selector, value)
+        await self.page.fill(selector, value)
+
+    async def get_text(self, selector):
+        """Get text from an element"""
+        self.logger.info("Getting text from: %s", selector)
+        return await self.page.text_content(selector)
+
+    async def is_visible(self, selector, timeout=5000):
+        """Check if an element is visible"""
+        self.logger.info("Checking if visible: %s", selector)
+        try:
+            await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def is_present_now(self, selector):
+        """Check if an element is visible right now, without waiting (see BasePage.is_present_now)"""
+        self.logger.info("Checking if present now: %s", selector)
+        return await self.page.is_visible(selector)
+
+    async def wait_for_any(self, states, timeout=5000):
+        """Race mutually exclusive page states and return the name of the first one to appear"""
+        self.logger.info("Waiting for first of: %s", list(states))
+        try:
+            handle = await self.page.wait_for_function(FIRST_VISIBLE_STATE_SCRIPT, arg=states, timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return await handle.json_value()
+
+    async def extract(self, container, fields):
+        """Read fields from every element matching container in a single round trip"""
+        self.logger.info("Extracting %s from: %s", list(fields), container)
+        return await self.page.eval_on_selector_all(container, EXTRACT_SCRIPT, extract_spec(fields))
+
+    async def get_count(self, selector):
+        """Get count of elements matching a selector"""
+        self.logger.info("Getting count of: %s", selector)
+        return await self.page.locator(selector).count()
+
+    async def take_screenshot(self, name):
+        """Take a screenshot and return its path; it is written in the background but not attached to Allure"""
+        if not ScreenshotPipeline.settings()["steps"]:
+            return None
+        self.logger.info("Taking screenshot: %s", name)
+        data = await self.page.screenshot(**ScreenshotPipeline.screenshot_args())
+        return ScreenshotPipeline.queue(data, name, attach=False)
+
+    async def navigate_to(self, url):
+        """Navigate to a URL"""
+        self.logger.info("Navigating to: %s", url)
+        await self.page.goto(url)
+        await self.wait_for_page_load()
@@ -0,0 +1,89 @@
+from src.pages.async_pages.base_page import AsyncBasePage
+from src.pages.async_pages.checkout_page import AsyncCheckoutPage
+from src.pages.cart_page import CartRow, CartSnapshot, parse_amount
+from src.pages.locators import CartLocators
+
+class AsyncCartPage(CartLocators, AsyncBasePage):
+    """Async counterpart of CartPage, with the same snapshot caching"""
+
+    def __init__(self, page):
+        super().__init__(page)
+        self._snapshot = None
+
+    async def get_rows(self):
+        """Read every cart row in a single round trip"""
+        return await self.extract(self.cart_items, self.row_fields)
+
+    async def snapshot(self):
+        """Indexed view of the cart, re-read only after a navigation or a mutation"""
+        navigation = self.navigation_count()
+        if self._snapshot is None or self._snapshot.navigation != navigation:
+            rows = []
+            for i, row in enumerate(await self.get_rows()):
+                rows.append(CartRow(
+                    index=i,
+                    name=row["name"],
+                    price=parse_amount(row["price"]),
+                    quantity=parse_amount(row["quantity"]),
+                    total=parse_amount(row["total"]),
+                    delete_button=self.page.locator(self.cart_items).nth(i).locator(self.delete_buttons),
+                ))
+            self._snapshot = CartSnapshot(rows, navigation)
+        return self._snapshot
+
+    def invalidate(self):
+        """Drop the cached snapshot after changing the cart"""
+        self._snapshot = None
+
+    async def is_loaded(self):
+        """Check if cart page is loaded correctly"""
+        self.logger.info("Checking if cart page is loaded")
+        return await self.get_state() is not None
+
+    async def get_state(self):
+        """Return "items" or "empty", whichever the cart page shows first (None if neither)"""
+        return await self.wait_for_any({"items": self.cart_table, "empty": self.empty_cart_message})
+
+    async def get_cart_items_count(self):
+        """Get number of items in cart"""
+        self.logger.info("Getting cart items count")
+        return len(await self.snapshot())
+
+    async def is_product_in_cart(self, product_name):
+        """Check if a product is in the cart"""
+        self.logger.info("Checking if product is in cart: %s", product_name)
+        return product_name in await self.snapshot()
+
+    async def get_product_price(self, product_name):
+        """Get price of a product in cart"""
+        self.logger.info("Getting price for product: %s", product_name)
+        row = (await self.snapshot()).get(product_name)
+        return row.price if row else None
+
+    async def get_total_price(self):
+        """Get total price of all items in cart"""
+        self.logger.info("Getting total price of cart")
+        return (await self.snapshot()).total
+
+    async def remove_product(self, product_name):
+        """Remove a product from cart"""
+        self.logger.info("Removing product from cart: %s", product_name)
+        row = (await self.snapshot()).get(product_name)
+        if row is None:
+            return False
+
+        row_handle = await self.page.locator(self.cart_items).nth(row.index).element_handle()
+        await row.delete_button.click()
+        # The row is removed in place once the delete request completes
+        await row_handle.wait_for_element_state("hidden")
+        self.invalidate()
+        return True
+
+    async def proceed_to_checkout(self):
+        """Click on checkout button"""
+        self.logger.info("Proceeding to checkout")
+        if await self.is_present_now(self.checkout_button):
+            await self.click(self.checkout_button)
+            await AsyncCheckoutPage(self.page).wait_for_page_load()
+            return True
+        return False
@@ -0,0 +1,79 @@
+from src.pages.async_pages.base_page import AsyncBasePage
+from src.pages.locators import CheckoutLocators
+
+class AsyncCheckoutPage(CheckoutLocators, AsyncBasePage):
+    """Async counterpart of CheckoutPage"""
+
+    async def is_loaded(self):
+        """Check if checkout page is loaded correctly"""
+        self.logger.info("Checking if checkout page is loaded")
+        return (
+            await self.is_visible(self.address_details) and
+            await self.is_visible(self.order_info) and
+            await self.is_visible(self.place_order_button)
+        )
+
+    async def get_delivery_address(self):
+        """Get delivery address information"""
+        self.logger.info("Getting delivery address")
+        if not await self.is_present_now(self.address_details):
+            return None
+        return await self.get_text(self.address_details)
+
+    async def place_order(self):
+        """Place order and proceed to payment"""
+        self.logger.info("Placing order")
+        if await self.is_present_now(self.place_order_button):
+            async with self.page.expect_navigation(url=self.payment_url):
+                await self.click(self.place_order_button)
+            await self.wait_for_page_load("domcontentloaded")
+            return await self.is_visible(self.payment_name)
+        return False
+
+    async def complete_payment(self, payment_info):
+        """Complete payment with card details"""
+        self.logger.info("Completing payment")
+        if not await self.is_present_now(self.payment_name):
+            return False
+
+        await self.fill(self.payment_name, payment_info["name_on_card"])
+        await self.fill(self.payment_card_number, payment_info["card_number"])
+        await self.fill(self.payment_cvc, payment_info["cvc"])
+        await self.fill(self.payment_expiry_month, payment_info["expiry_month"])
+        await self.fill(self.payment_expiry_year, payment_info["expiry_year"])
+
+        async with self.page.expect_navigation():
+            await self.click(self.payment_submit_button)
+        await self.wait_for_page_load("domcontentloaded")
+
+        return (
+            await self.is_visible(self.order_placed_message) and
+            "ORDER PLACED!" in await self.get_text(self.order_placed_message)
+        )
+
+    async def download_invoice(self):
+        """Download invoice for the order"""
+        self.logger.info("Downloading invoice")
+        if await self.is_present_now(self.download_invoice_button):
+            async with self.page.expect_download() as download_info:
+                await self.click(self.download_invoice_button)
+            download = await download_info.value
+            return await download.path()
+        return None
+
+    async def continue_after_order(self):
+        """Continue after placing order"""
+        self.logger.info("Continuing after order")
+        if await self.is_present_now(self.continue_button):
+            async with self.page.expect_navigation():
+                await self.click(self.continue_button)
+            await self.wait_for_page_load("domcontentloaded")
+            return True
+        return False
+
+    async def get_confirmation_message(self):
+        """Get order confirmation message"""
+        self.logger.info("Getting order confirmation message")
+        if await self.is_visible(self.order_placed_message):
+            return await self.get_text(self.order_placed_message)
+        return None
@@ -0,0 +1,53 @@
+from src.pages.async_pages.base_page import AsyncBasePage
+from src.pages.async_pages.cart_page import AsyncCartPage
+from src.pages.async_pages.login_page import AsyncLoginPage
+from src.pages.async_pages.products_page import AsyncProductsPage
+from src.pages.locators import HomeLocators
+
+class AsyncHomePage(HomeLocators, AsyncBasePage):
+    """Async counterpart of HomePage"""
+
+    async def is_loaded(self):
+        """Check if homepage is loaded correctly"""
+        self.logger.info("Checking if homepage is loaded")
+        return (
+            await self.is_visible(self.logo) and
+            await self.is_visible(self.slider) and
+            await self.is_visible(self.features_items)
+        )
+
+    async def go_to_products(self):
+        """Navigate to products page"""
+        self.logger.info("Navigating to products page")
+        # The catalogue's ready selectors also match the home page, so wait for the new document first
+        async with self.page.expect_navigation(url=self.products_url):
+            await self.click(self.products_button)
+        await AsyncProductsPage(self.page).wait_for_page_load()
+
+    async def go_to_login(self):
+        """Navigate to login page"""
+        self.logger.info("Navigating to login page")
+        await self.click(self.login_button)
+        await AsyncLoginPage(self.page).wait_for_page_load()
+
+    async def go_to_cart(self):
+        """Navigate to cart page"""
+        self.logger.info("Navigating to cart page")
+        await self.click(self.cart_button)
+        await AsyncCartPage(self.page).wait_for_page_load()
+
+    async def search_product(self, product_name):
+        """Search for a product"""
+        self.logger.info("Searching for product: %s", product_name)
+        await self.fill(self.search_box, product_name)
+        async with self.page.expect_navigation(url=self.products_url):
+            await self.click(self.search_button)
+        await AsyncProductsPage(self.page).wait_for_page_load()
+
+    async def subscribe(self, email):
+        """Subscribe to newsletter"""
+        self.logger.info("Subscribing with email: %s", email)
+        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await self.fill(self.subscription_email, email)
+        await self.click(self.subscription_button)
+        return await self.is_visible(self.subscription_success, 5000)
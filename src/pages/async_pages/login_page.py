@@ -0,0 +1,67 @@
+from src.pages.async_pages.base_page import AsyncBasePage
+from src.pages.locators import LoginLocators
+
+class AsyncLoginPage(LoginLocators, AsyncBasePage):
+    """Async counterpart of LoginPage"""
+
+    async def is_loaded(self):
+        """Check if login page is loaded correctly"""
+        self.logger.info("Checking if login page is loaded")
+        return (
+            await self.is_visible(self.login_email) and
+            await self.is_visible(self.login_password) and
+            await self.is_visible(self.login_button)
+        )
+
+    async def login(self, email, password):
+        """Login with email and password"""
+        self.logger.info("Logging in with email: %s", email)
+        await self.fill(self.login_email, email)
+        await self.fill(self.login_password, password)
+        async with self.page.expect_navigation():
+            await self.click(self.login_button)
+        await self.wait_for_page_load("domcontentloaded")
+        state = await self.wait_for_any({"logged_in": self.logout_button, "error": self.error_message})
+        return state == "logged_in"
+
+    async def signup(self, name, email):
+        """Sign up with name and email"""
+        self.logger.info("Signing up with name: %s, email: %s", name, email)
+        await self.fill(self.signup_name, name)
+        await self.fill(self.signup_email, email)
+        async with self.page.expect_navigation():
+            await self.click(self.signup_button)
+        await self.wait_for_page_load("domcontentloaded")
+        return await self.is_visible(self.signup_form)
+
+    async def complete_registration(self, user_data):
+        """Complete the registration form after signup"""
+        self.logger.info("Completing registration form")
+        gender = "2" if user_data.get("gender", "male").lower() != "male" else "1"
+        await self.click(self.gender_radio.format(gender))
+        await self.fill(self.password_input, user_data["password"])
+
+        await self.page.select_option(self.days_select, user_data["day"])
+        await self.page.select_option(self.months_select, user_data["month"])
+        await self.page.select_option(self.years_select, user_data["year"])
+
+        await self.page.check(self.newsletter_checkbox)
+        await self.page.check(self.optin_checkbox)
+
+        for key, selector in self.registration_inputs.items():
+            await self.fill(selector, user_data[key])
+        await self.page.select_option(self.country_select, user_data["country"])
+
+        async with self.page.expect_navigation():
+            await self.click(self.create_account_button)
+        await self.wait_for_page_load("domcontentloaded")
+        return "ACCOUNT CREATED!" in await self.get_text(self.account_created_message)
+
+    async def logout(self):
+        """Logout from account"""
+        self.logger.info("Logging out")
+        if await self.is_present_now(self.logout_button):
+            await self.click(self.logout_button)
+            await self.wait_for_page_load()
+            return await self.is_loaded()
+        return False
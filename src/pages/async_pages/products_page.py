@@ -0,0 +1,71 @@
+from src.pages.async_pages.base_page import AsyncBasePage
+from src.pages.async_pages.cart_page import AsyncCartPage
+from src.pages.locators import ProductsLocators
+
+class AsyncProductsPage(ProductsLocators, AsyncBasePage):
+    """Async counterpart of ProductsPage"""
+
+    async def is_loaded(self):
+        """Check if products page is loaded correctly"""
+        self.logger.info("Checking if products page is loaded")
+        return (
+            await self.is_visible(self.products_title) and
+            await self.is_visible(self.product_list)
+        )
+
+    async def get_product_names(self):
+        """Get all product names on the page"""
+        self.logger.info("Getting all product names")
+        return [product["name"] for product in await self.extract(self.product_info, {"name": "p"})]
+
+    async def add_to_cart(self, product_name):
+        """Add a product to cart by name"""
+        self.logger.info("Adding product to cart: %s", product_name)
+        product_names = await self.get_product_names()
+        if product_name not in product_names:
+            self.logger.error("Product not found: %s", product_name)
+            return False
+        await self.page.locator(self.add_to_cart_buttons).nth(product_names.index(product_name)).click()
+        await self.wait_for_selector(self.cart_modal, state="visible")
+        await self.click(self.continue_shopping_button)
+        return True
+
+    async def view_product_details(self, product_name):
+        """View details of a product by name"""
+        self.logger.info("Viewing product details: %s", product_name)
+        product_names = await self.get_product_names()
+        if product_name not in product_names:
+            self.logger.error("Product not found: %s", product_name)
+            return False
+        async with self.page.expect_navigation(url=self.product_details_url):
+            await self.page.locator(self.view_product_buttons).nth(product_names.index(product_name)).click()
+        await self.wait_for_page_load("load")
+        return True
+
+    async def get_search_results_count(self):
+        """Get count of search results"""
+        self.logger.info("Getting search results count")
+        return await self.get_count(self.search_result)
+
+    async def go_to_cart(self):
+        """Go to cart page after adding product"""
+        self.logger.info("Going to cart after adding product")
+        await self.click(self.view_cart_button)
+        await AsyncCartPage(self.page).wait_for_page_load()
+
+    async def search_product(self, search_term):
+        """Search for a product using the search box"""
+        self.logger.info("Searching for product: %s", search_term)
+        await self.fill(self.search_box, search_term)
+        # The catalogue's ready selectors also match the page being left, so wait for the results document first
+        async with self.page.expect_navigation(url=self.search_results_url):
+            await self.click(self.search_button)
+        await self.wait_for_page_load()
+
+    async def add_first_product_to_cart(self):
+        """Add the first product on the page to cart"""
+        self.logger.info("Adding first product to cart")
+        await self.page.locator(self.product_info).first.hover()
+        await self.page.locator(self.add_to_cart_buttons).first.click()
+        await self.wait_for_selector(self.cart_modal, state="visible")
+        await self.click(self.continue_shopping_button)
@@ -1,69 +1,239 @@
-import  allure
 import logging
+import os
+import time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from src.utils.logger import Logger
+from src.utils.page_metrics import PageMetrics
+from src.utils.perf_budget import PerfBudget
+from src.utils.run_stats import RunStats
+from src.utils.screenshot_pipeline import ScreenshotPipeline
+from src.utils.step_trace import ACTION, step
+
+# Reads every field of every container in one evaluation (see BasePage.extract)
+EXTRACT_SCRIPT = """
+(elements, fields) => elements.map(element => {
+    const record = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const target = spec.selector ? element.querySelector(spec.selector) : element;
+        if (!target) {
+            record[name] = null;
+        } else if (spec.attribute) {
+            record[name] = target.getAttribute(spec.attribute);
+        } else {
+            record[name] = (target.textContent || "").trim();
+        }
+    }
+    return record;
+})
+"""
+
+# Returns the name of the first state whose selector has a visible match, or null to keep polling
+FIRST_VISIBLE_STATE_SCRIPT = """
+states => {
+    for (const [name, selector] of Object.entries(states)) {
+        for (const element of document.querySelectorAll(selector)) {
+            const rect = element.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden") {
+                return name;
+            }
+        }
+    }
+    return null;
+}
+"""
+
+# True once a resource whose URL contains the fragment has finished loading
+RESOURCE_LOADED_SCRIPT = "fragment => performance.getEntriesByType('resource').some(e => e.name.includes(fragment))"
+
+def extract_spec(fields):
+    """Turn BasePage.extract field definitions into the argument EXTRACT_SCRIPT expects"""
+    spec = {}
+    for name, field in fields.items():
+        if isinstance(field, tuple):
+            spec[name] = {"selector": field[0], "attribute": field[1]}
+        else:
+            spec[name] = {"selector": field, "attribute": None}
+    return spec
+
+def readiness_strategy(strategy):
+    """Strategy wait_for_page_load should use, honouring READINESS=networkidle"""
+    if os.getenv("READINESS", "page").lower() == "networkidle":
+        return "networkidle"
+    return strategy or "page"
 
 class BasePage:
     """Base page for all page objects"""
     
+    # Readiness condition used by wait_for_page_load; set by the locator classes in locators.py
+    ready_load_state = "domcontentloaded"
+    ready_selectors = []       # all must be visible
+    ready_any_selectors = []   # at least one must be visible
+    ready_response = None      # URL fragment of a request that must have completed
+    ready_function = None      # JS predicate evaluated in the page
+    
+    # Performance budget checked when PERF_BUDGETS is on: ready_ms, transfer_kb, requests (see perf_budget.py)
+    budget = None
+    
     def __init__(self, page):
         self.page = page
         self.logger = Logger.get_logger(self.__class__.__name__)
     
-    @allure.step("Wait for page to load")
-    def wait_for_page_load(self):
-        """Wait for page to load completely"""
-        self.page.wait_for_load_state("networkidle")
+    @step("Wait for page to load", level=ACTION)
+    def wait_for_page_load(self, strategy=None):
+        """Wait until the page is ready to use.
+        
+        By default the page object's readiness condition is used. Pass a load state
+        ("domcontentloaded", "load", "networkidle") to wait for that instead, or set
+        READINESS=networkidle to restore the old blanket networkidle wait everywhere.
+        """
+        strategy = readiness_strategy(strategy)
+        
+        start = time.perf_counter()
+        if strategy == "page":
+            self._wait_until_ready()
+        else:
+            self.page.wait_for_load_state(strategy)
+        elapsed = time.perf_counter() - start
+        
+        RunStats.record_time(f"ready_{strategy}", elapsed)
+        self.logger.info("%s ready via %s in %.0fms", self.__class__.__name__, strategy, elapsed * 1000)
+        if PageMetrics.active(self.page):
+            sample = PageMetrics.record(self.page, self.__class__.__name__, strategy, elapsed, self.navigation_count())
+            if sample:
+                PerfBudget.check(self, sample)
     
-    @allure.step("Wait for selector: {selector}")
+    def _wait_until_ready(self):
+        """Wait for this page object's readiness condition"""
+        self.page.wait_for_load_state(self.ready_load_state)
+        for selector in self.ready_selectors:
+            self.page.wait_for_selector(selector, state="visible")
+        if self.ready_any_selectors:
+            states = {selector: selector for selector in self.ready_any_selectors}
+            self.page.wait_for_function(FIRST_VISIBLE_STATE_SCRIPT, arg=states)
+        if self.ready_response:
+            self.page.wait_for_function(RESOURCE_LOADED_SCRIPT, arg=self.ready_response)
+        if self.ready_function:
+            self.page.wait_for_function(self.ready_function)
+    
+    def navigation_count(self):
+        """Number of main-frame navigations since first asked; lets page objects cache DOM reads"""
+        page = self.page
+        if not hasattr(page, "navigation_count"):
+            page.navigation_count = 0
+            
+            def on_navigated(frame):
+                if frame == page.main_frame:
+                    page.navigation_count += 1
+            
+            page.on("framenavigated", on_navigated)
+        return page.navigation_count
+    
+    def _action(self):
+        """Count an action for the test's trace buffer (TRACE_ACTIONS windows), if tracing"""
+        trace_buffer = getattr(self.page, "trace_buffer", None)
+        if trace_buffer is not None:
+            trace_buffer.action()
+    
+    @step("Wait for selector: {selector}", level=ACTION)
     def wait_for_selector(self, selector, state="visible", timeout=10000):
         """Wait for an element to be visible"""
-        self.logger.info(f"Waiting for selector: {selector}")
+        self.logger.info("Waiting for selector: %s", selector)
+        self._action()
         return self.page.wait_for_selector(selector, state=state, timeout=timeout)
     
-    @allure.step("Click on element: {selector}")
+    @step("Click on element: {selector}", level=ACTION)
     def click(self, selector):
         """Click on an element"""
-        self.logger.info(f"Clicking on: {selector}")
+        self.logger.info("Clicking on: %s", selector)
+        self._action()
         self.page.click(selector)
     
-    @allure.step("Fill text: {value} in field: {selector}")
+    @step("Fill text: {value} in field: {selector}", level=ACTION)
     def fill(self, selector, value):
         """Fill a text field"""
-        self.logger.info(f"Filling {selector} with: {value}")
+        self.logger.info("Filling %s with: %s", selector, value)
+        self._action()
         self.page.fill(selector, value)
     
-    @allure.step("Get text from element: {selector}")
+    @step("Get text from element: {selector}", level=ACTION)
     def get_text(self, selector):
         """Get text from an element"""
-        self.logger.info(f"Getting text from: {selector}")
+        self.logger.info("Getting text from: %s", selector)
+        self._action()
         return self.page.text_content(selector)
     
-    @allure.step("Check if element exists: {selector}")
+    @step("Check if element exists: {selector}", level=ACTION)
     def is_visible(self, selector, timeout=5000):
         """Check if an element is visible"""
-        self.logger.info(f"Checking if visible: {selector}")
+        self.logger.info("Checking if visible: %s", selector)
+        self._action()
         try:
             self.page.wait_for_selector(selector, state="visible", timeout=timeout)
             return True
-        except:
+        except PlaywrightTimeoutError:
             return False
     
-    @allure.step("Get count of elements: {selector}")
+    @step("Check if element is present now: {selector}", level=ACTION)
+    def is_present_now(self, selector):
+        """Check if an element is visible right now, without waiting.
+        
+        For optional elements of a page that is already ready, where is_visible
+        would spend its whole timeout whenever the element is absent.
+        """
+        self.logger.info("Checking if present now: %s", selector)
+        self._action()
+        return self.page.is_visible(selector)
+    
+    @step("Wait for first of states: {states}", level=ACTION)
+    def wait_for_any(self, states, timeout=5000):
+        """Race mutually exclusive page states and return the name of the first one to appear.
+        
+        states maps a state name to a CSS selector, e.g.
+        {"cart": "#cart_info", "empty": "#empty_cart"}. All states share one
+        timeout; None is returned if none of them became visible in time.
+        """
+        self.logger.info("Waiting for first of: %s", list(states))
+        self._action()
+        try:
+            handle = self.page.wait_for_function(FIRST_VISIBLE_STATE_SCRIPT, arg=states, timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return handle.json_value()
+    
+    @step("Extract records from: {container}", level=ACTION)
+    def extract(self, container, fields):
+        """Read fields from every element matching container in a single round trip.
+        
+        fields maps a record key to a CSS selector relative to the container
+        (text content, trimmed), a (selector, attribute) tuple, or None for the
+        container itself. Missing elements give None.
+        
+        Example: self.extract(".productinfo", {"name": "p", "price": "h2"})
+        """
+        self.logger.info("Extracting %s from: %s", list(fields), container)
+        self._action()
+        return self.page.eval_on_selector_all(container, EXTRACT_SCRIPT, extract_spec(fields))
+    
+    @step("Get count of elements: {selector}", level=ACTION)
     def get_count(self, selector):
         """Get count of elements matching a selector"""
-        self.logger.info(f"Getting count of: {selector}")
+        self.logger.info("Getting count of: %s", selector)
+        self._action()
         return self.page.locator(selector).count()
     
-    @allure.step("Take screenshot: {name}")
+    @step("Take screenshot: {name}", level=ACTION)
     def take_screenshot(self, name):
-        """Take a screenshot"""
-        self.logger.info(f"Taking screenshot: {name}")
-        return self.page.screenshot_helper.take_screenshot(name)
+        """Take a checkpoint screenshot (skipped with SCREENSHOT_STEPS=false)"""
+        if not ScreenshotPipeline.settings()["steps"]:
+            return None
+        self.logger.info("Taking screenshot: %s", name)
+        return ScreenshotPipeline.capture(self.page, name)
     
-    @allure.step("Navigate to URL: {url}")
+    @step("Navigate to URL: {url}", level=ACTION)
     def navigate_to(self, url):
         """Navigate to a URL"""
-        self.logger.info(f"Navigating to: {url}")
+        self.logger.info("Navigating to: %s", url)
+        self._action()
         self.page.goto(url)
         self.wait_for_page_load()
  
\ No newline at end of file
@@ -1,105 +1,135 @@
-import  allure
 import re
+from collections import namedtuple
 from src.pages.base_page import BasePage
+from src.pages.locators import CartLocators
+from src.pages.checkout_page import CheckoutPage
+from src.utils.step_trace import step
 
-class CartPage(BasePage):
+CartRow = namedtuple("CartRow", ["index", "name", "price", "quantity", "total", "delete_button"])
+
+def parse_amount(text):
+    """Extract number from price text (e.g., "Rs. 500" -> 500)"""
+    match = re.search(r'\d+', text or "")
+    return int(match.group()) if match else None
+
+class CartSnapshot:
+    """Cart rows read in one round trip and indexed by product name"""
+    
+    def __init__(self, rows, navigation):
+        self.rows = rows
+        self.by_name = {}
+        for row in rows:
+            self.by_name.setdefault(row.name, row)
+        self.navigation = navigation
+    
+    def __contains__(self, product_name):
+        return product_name in self.by_name
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def get(self, product_name):
+        return self.by_name.get(product_name)
+    
+    @property
+    def names(self):
+        return [row.name for row in self.rows]
+    
+    @property
+    def total(self):
+        return sum(row.total or 0 for row in self.rows)
+
+class CartPage(CartLocators, BasePage):
+    budget = {"ready_ms": 4000, "transfer_kb": 3000, "requests": 120}
+    
     def __init__(self, page):
         super().__init__(page)
-        self.cart_table = "#cart_info"
-        self.checkout_button = ".check_out"
-        self.delete_buttons = ".cart_quantity_delete"
-        self.cart_items = ".cart_info tbody tr"
-        self.empty_cart_message = "#empty_cart"
-        self.product_price = ".cart_price p"
-        self.product_quantity = ".cart_quantity button"
-        self.product_total = ".cart_total_price"
-        self.product_name = ".cart_description h4 a"
-        self.continue_shopping_button = ".btn-success"
-    
-    @allure.step("Check if cart page is loaded")
+        self._snapshot = None
+    
+    def get_rows(self):
+        """Read every cart row in a single round trip"""
+        return self.extract(self.cart_items, self.row_fields)
+    
+    def snapshot(self):
+        """Indexed view of the cart, re-read only after a navigation or a mutation"""
+        navigation = self.navigation_count()
+        if self._snapshot is None or self._snapshot.navigation != navigation:
+            rows = []
+            for i, row in enumerate(self.get_rows()):
+                rows.append(CartRow(
+                    index=i,
+                    name=row["name"],
+                    price=parse_amount(row["price"]),
+                    quantity=parse_amount(row["quantity"]),
+                    total=parse_amount(row["total"]),
+                    delete_button=self.page.locator(self.cart_items).nth(i).locator(self.delete_buttons),
+                ))
+            self._snapshot = CartSnapshot(rows, navigation)
+        return self._snapshot
+    
+    def invalidate(self):
+        """Drop the cached snapshot after changing the cart"""
+        self._snapshot = None
+    
+    @step("Check if cart page is loaded")
     def is_loaded(self):
         """Check if cart page is loaded correctly"""
         self.logger.info("Checking if cart page is loaded")
-        return self.is_visible(self.cart_table) or self.is_visible(self.empty_cart_message)
+        return self.get_state() is not None
+    
+    @step("Get cart state")
+    def get_state(self):
+        """Return "items" or "empty", whichever the cart page shows first (None if neither)"""
+        return self.wait_for_any({"items": self.cart_table, "empty": self.empty_cart_message})
     
-    @allure.step("Get cart items count")
+    @step("Get cart items count")
     def get_cart_items_count(self):
         """Get number of items in cart"""
         self.logger.info("Getting cart items count")
-        if self.is_visible(self.empty_cart_message):
-            return 0
-        return self.get_count(self.cart_items)
+        return len(self.snapshot())
     
-    @allure.step("Check if product is in cart: {product_name}")
+    @step("Check if product is in cart: {product_name}")
     def is_product_in_cart(self, product_name):
         """Check if a product is in the cart"""
-        self.logger.info(f"Checking if product is in cart: {product_name}")
-        if self.is_visible(self.empty_cart_message):
-            return False
-        
-        product_names = self.page.locator(self.product_name)
-        for i in range(product_names.count()):
-            if product_names.nth(i).text_content().strip() == product_name:
-                return True
-        return False
+        self.logger.info("Checking if product is in cart: %s", product_name)
+        return product_name in self.snapshot()
     
-    @allure.step("Get product price: {product_name}")
+    @step("Get product price: {product_name}")
     def get_product_price(self, product_name):
         """Get price of a product in cart"""
-        self.logger.info(f"Getting price for product: {product_name}")
-        if not self.is_product_in_cart(product_name):
-            return None
-        
-        # Find product index
-        product_names = self.page.locator(self.product_name)
-        for i in range(product_names.count()):
-            if product_names.nth(i).text_content().strip() == product_name:
-                price_text = self.page.locator(self.product_price).nth(i).text_content().strip()
-                # Extract number from price text (e.g., "Rs. 500" -> 500)
-                match = re.search(r'\d+', price_text)
-                if match:
-                    return int(match.group())
-        return None
-    
-    @allure.step("Get total price")
+        self.logger.info("Getting price for product: %s", product_name)
+        row = self.snapshot().get(product_name)
+        return row.price if row else None
+    
+    @step("Get total price")
     def get_total_price(self):
         """Get total price of all items in cart"""
         self.logger.info("Getting total price of cart")
-        if self.is_visible(self.empty_cart_message):
-            return 0
-        
-        total = 0
-        prices = self.page.locator(self.product_total)
-        for i in range(prices.count()):
-            price_text = prices.nth(i).text_content().strip()
-            match = re.search(r'\d+', price_text)
-            if match:
-                total += int(match.group())
-        return total
-    
-    @allure.step("Remove product from cart: {product_name}")
+        return self.snapshot().total
+    
+    @step("Remove product from cart: {product_name}")
     def remove_product(self, product_name):
         """Remove a product from cart"""
-        self.logger.info(f"Removing product from cart: {product_name}")
-        if not self.is_product_in_cart(product_name):
+        self.logger.info("Removing product from cart: %s", product_name)
+        row = self.snapshot().get(product_name)
+        if row is None:
             return False
         
-        # Find product index
-        product_names = self.page.locator(self.product_name)
-        for i in range(product_names.count()):
-            if product_names.nth(i).text_content().strip() == product_name:
-                self.page.locator(self.delete_buttons).nth(i).click()
-                self.wait_for_page_load()
-                return True
-        return False
+        row_handle = self.page.locator(self.cart_items).nth(row.index).element_handle()
+        row.delete_button.click()
+        # The row is removed in place once the delete request completes
+        row_handle.wait_for_element_state("hidden")
+        self.invalidate()
+        return True
     
-    @allure.step("Proceed to checkout")
+    @step("Proceed to checkout")
     def proceed_to_checkout(self):
         """Click on checkout button"""
         self.logger.info("Proceeding to checkout")
-        if self.is_visible(self.checkout_button):
+        # The cart page is ready, so an empty cart has no checkout button to wait for
+        if self.is_present_now(self.checkout_button):
             self.click(self.checkout_button)
-            self.wait_for_page_load()
+            CheckoutPage(self.page).wait_for_page_load()
             return True
         return False
  
\ No newline at end of file
@@ -1,22 +1,14 @@
-import  allure
 from src.pages.base_page import BasePage
+from src.pages.locators import HomeLocators
+from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
+from src.pages.products_page import ProductsPage
+from src.utils.step_trace import step
 
-class HomePage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
-        self.products_button = "a[href='/products']"
-        self.login_button = "a[href='/login']"
-        self.cart_button = "a[href='/view_cart']"
-        self.search_box = "#search_product"
-        self.search_button = "#submit_search"
-        self.slider = "#slider-carousel"
-        self.logo = ".logo"
-        self.recommended_items = "#recommended-item-carousel"
-        self.subscription_email = "#susbscribe_email"
-        self.subscription_button = "#subscribe"
-        self.features_items = ".features_items"
+class HomePage(HomeLocators, BasePage):
+    budget = {"ready_ms": 5000, "transfer_kb": 4000, "requests": 150}
     
-    @allure.step("Check if homepage is loaded")
+    @step("Check if homepage is loaded")
     def is_loaded(self):
         """Check if homepage is loaded correctly"""
         self.logger.info("Checking if homepage is loaded")
@@ -26,43 +18,46 @@ class HomePage(BasePage):
             self.is_visible(self.features_items)
         )
     
-    @allure.step("Navigate to products page")
+    @step("Navigate to products page")
     def go_to_products(self):
         """Navigate to products page"""
         self.logger.info("Navigating to products page")
-        self.click(self.products_button)
-        self.wait_for_page_load()
+        # The catalogue's ready selectors also match the home page, so wait for the new document first
+        with self.page.expect_navigation(url=self.products_url):
+            self.click(self.products_button)
+        ProductsPage(self.page).wait_for_page_load()
     
-    @allure.step("Navigate to login page")
+    @step("Navigate to login page")
     def go_to_login(self):
         """Navigate to login page"""
         self.logger.info("Navigating to login page")
         self.click(self.login_button)
-        self.wait_for_page_load()
+        LoginPage(self.page).wait_for_page_load()
     
-    @allure.step("Navigate to cart page")
+    @step("Navigate to cart page")
     def go_to_cart(self):
         """Navigate to cart page"""
         self.logger.info("Navigating to cart page")
         self.click(self.cart_button)
-        self.wait_for_page_load()
+        CartPage(self.page).wait_for_page_load()
     
-    @allure.step("Search for product: {product_name}")
+    @step("Search for product: {product_name}")
     def search_product(self, product_name):
         """Search for a product"""
-        self.logger.info(f"Searching for product: {product_name}")
+        self.logger.info("Searching for product: %s", product_name)
         self.fill(self.search_box, product_name)
-        self.click(self.search_button)
-        self.wait_for_page_load()
+        with self.page.expect_navigation(url=self.products_url):
+            self.click(self.search_button)
+        ProductsPage(self.page).wait_for_page_load()
     
-    @allure.step("Subscribe with email: {email}")
+    @step("Subscribe with email: {email}")
     def subscribe(self, email):
         """Subscribe to newsletter"""
-        self.logger.info(f"Subscribing with email: {email}")
+        self.logger.info("Subscribing with email: %s", email)
         # Scroll to subscription area
         self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
         self.fill(self.subscription_email, email)
         self.click(self.subscription_button)
         # Wait for success message
-        return self.is_visible(".alert-success", 5000)
+        return self.is_visible(self.subscription_success, 5000)
  
\ No newline at end of file
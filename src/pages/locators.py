@@ -0,0 +1,125 @@
+"""Selectors and readiness conditions shared by the sync and async page objects.
+
+Page objects inherit these as class attributes (``class HomePage(HomeLocators, BasePage)``),
+so both APIs always use the same definitions.
+"""
+
+
+class HomeLocators:
+    products_button = "a[href='/products']"
+    login_button = "a[href='/login']"
+    cart_button = "a[href='/view_cart']"
+    search_box = "#search_product"
+    search_button = "#submit_search"
+    slider = "#slider-carousel"
+    logo = ".logo"
+    recommended_items = "#recommended-item-carousel"
+    subscription_email = "#susbscribe_email"
+    subscription_button = "#subscribe"
+    subscription_success = ".alert-success"
+    features_items = ".features_items"
+    # Catalogue and search results; its ready selectors also match the home page
+    products_url = "**/products*"
+
+    ready_selectors = [logo, features_items]
+
+
+class ProductsLocators:
+    products_title = ".title"
+    product_list = ".features_items"
+    add_to_cart_buttons = ".add-to-cart"
+    view_product_buttons = ".choose a"
+    product_info = ".productinfo"
+    search_result = ".features_items .product-image-wrapper"
+    continue_shopping_button = ".btn-success"
+    view_cart_button = "p a[href='/view_cart']"
+    category_list = ".category-products"
+    brands_list = ".brands-name"
+    product_details_link = "a[href='/product_details/']"
+    search_box = "#search_product"
+    search_button = "#submit_search"
+    cart_modal = "#cartModal"
+    search_results_url = "**/products?search=*"
+    product_details_url = "**/product_details/*"
+
+    ready_selectors = [products_title, product_list]
+
+
+class CartLocators:
+    cart_table = "#cart_info"
+    checkout_button = ".check_out"
+    delete_buttons = ".cart_quantity_delete"
+    cart_items = ".cart_info tbody tr"
+    empty_cart_message = "#empty_cart"
+    product_price = ".cart_price p"
+    product_quantity = ".cart_quantity button"
+    product_total = ".cart_total_price"
+    product_name = ".cart_description h4 a"
+    continue_shopping_button = ".btn-success"
+
+    ready_any_selectors = [cart_table, empty_cart_message]
+
+    # Fields read for every cart row (see CartPage.get_rows)
+    row_fields = {
+        "name": product_name,
+        "price": product_price,
+        "quantity": product_quantity,
+        "total": product_total,
+    }
+
+
+class CheckoutLocators:
+    address_details = "#address_delivery"
+    order_info = "#cart_info"
+    place_order_button = "a.check_out"
+    payment_name = "input[name='name_on_card']"
+    payment_card_number = "input[name='card_number']"
+    payment_cvc = "input[name='cvc']"
+    payment_expiry_month = "input[name='expiry_month']"
+    payment_expiry_year = "input[name='expiry_year']"
+    payment_submit_button = "#submit"
+    order_placed_message = ".title"
+    download_invoice_button = ".check_out"
+    continue_button = "a[data-qa='continue-button']"
+    payment_url = "**/payment"
+
+    ready_selectors = [address_details, order_info]
+
+
+class LoginLocators:
+    login_email = "input[data-qa='login-email']"
+    login_password = "input[data-qa='login-password']"
+    login_button = "button[data-qa='login-button']"
+    signup_name = "input[data-qa='signup-name']"
+    signup_email = "input[data-qa='signup-email']"
+    signup_button = "button[data-qa='signup-button']"
+    signup_form = "form[action='/signup']"
+    error_message = ".login-form .alert-danger"
+    logout_button = "a[href='/logout']"
+    delete_account_button = "a[href='/delete_account']"
+    account_created_message = "h2.title"
+
+    # Account information form shown after the first signup step
+    gender_radio = "#id_gender{}"  # 1 = Mr, 2 = Mrs
+    password_input = "input[data-qa='password']"
+    days_select = "select[data-qa='days']"
+    months_select = "select[data-qa='months']"
+    years_select = "select[data-qa='years']"
+    newsletter_checkbox = "#newsletter"
+    optin_checkbox = "#optin"
+    country_select = "select[data-qa='country']"
+    create_account_button = "button[data-qa='create-account']"
+    # registration data key -> text input
+    registration_inputs = {
+        "first_name": "input[data-qa='first_name']",
+        "last_name": "input[data-qa='last_name']",
+        "company": "input[data-qa='company']",
+        "address1": "input[data-qa='address']",
+        "address2": "input[data-qa='address2']",
+        "state": "input[data-qa='state']",
+        "city": "input[data-qa='city']",
+        "zipcode": "input[data-qa='zipcode']",
+        "mobile_number": "input[data-qa='mobile_number']",
+    }
+
+    ready_selectors = [login_email, signup_email]
@@ -1,24 +1,12 @@
-import  allure
 from src.pages.base_page import BasePage
+from src.pages.locators import ProductsLocators
+from src.pages.cart_page import CartPage
+from src.utils.step_trace import step
 
-class ProductsPage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
-        self.products_title = ".title"
-        self.product_list = ".features_items"
-        self.add_to_cart_buttons = ".add-to-cart"
-        self.view_product_buttons = ".choose a"
-        self.product_info = ".productinfo"
-        self.search_result = ".features_items .product-image-wrapper"
-        self.continue_shopping_button = ".btn-success"
-        self.view_cart_button = "p a[href='/view_cart']"
-        self.category_list = ".category-products"
-        self.brands_list = ".brands-name"
-        self.product_details_link = "a[href='/product_details/']"
-        self.search_box = "#search_product"
-        self.search_button = "#submit_search"
+class ProductsPage(ProductsLocators, BasePage):
+    budget = {"ready_ms": 5000, "transfer_kb": 4000, "requests": 150}
     
-    @allure.step("Check if products page is loaded")
+    @step("Check if products page is loaded")
     def is_loaded(self):
         """Check if products page is loaded correctly"""
         self.logger.info("Checking if products page is loaded")
@@ -27,17 +15,16 @@ class ProductsPage(BasePage):
             self.is_visible(self.product_list)
         )
     
-    @allure.step("Get all product names")
+    @step("Get all product names")
     def get_product_names(self):
         """Get all product names on the page"""
         self.logger.info("Getting all product names")
-        products = self.page.locator(f"{self.product_info} p")
-        return [products.nth(i).text_content() for i in range(products.count())]
+        return [product["name"] for product in self.extract(self.product_info, {"name": "p"})]
     
-    @allure.step("Add product to cart: {product_name}")
+    @step("Add product to cart: {product_name}")
     def add_to_cart(self, product_name):
         """Add a product to cart by name"""
-        self.logger.info(f"Adding product to cart: {product_name}")
+        self.logger.info("Adding product to cart: %s", product_name)
         # Find product by name and get its index
         product_names = self.get_product_names()
         if product_name in product_names:
@@ -45,52 +32,55 @@ class ProductsPage(BasePage):
             # Click on add to cart button for this product
             self.page.locator(self.add_to_cart_buttons).nth(index).click()
             # Wait for modal to appear
-            self.wait_for_selector("#cartModal", state="visible")
+            self.wait_for_selector(self.cart_modal, state="visible")
             # Click continue shopping
             self.click(self.continue_shopping_button)
             return True
         else:
-            self.logger.error(f"Product not found: {product_name}")
+            self.logger.error("Product not found: %s", product_name)
             return False
     
-    @allure.step("View product details: {product_name}")
+    @step("View product details: {product_name}")
     def view_product_details(self, product_name):
         """View details of a product by name"""
-        self.logger.info(f"Viewing product details: {product_name}")
+        self.logger.info("Viewing product details: %s", product_name)
         # Find product by name and get its index
         product_names = self.get_product_names()
         if product_name in product_names:
             index = product_names.index(product_name)
-            # Click on view product button for this product
-            self.page.locator(self.view_product_buttons).nth(index).click()
-            self.wait_for_page_load()
+            # Click on view product button for this product; the load state of the page being left is already reached
+            with self.page.expect_navigation(url=self.product_details_url):
+                self.page.locator(self.view_product_buttons).nth(index).click()
+            self.wait_for_page_load("load")
             return True
         else:
-            self.logger.error(f"Product not found: {product_name}")
+            self.logger.error("Product not found: %s", product_name)
             return False
     
-    @allure.step("Get search results count")
+    @step("Get search results count")
     def get_search_results_count(self):
         """Get count of search results"""
         self.logger.info("Getting search results count")
         return self.get_count(self.search_result)
     
-    @allure.step("Go to cart after adding product")
+    @step("Go to cart after adding product")
     def go_to_cart(self):
         """Go to cart page after adding product"""
         self.logger.info("Going to cart after adding product")
         self.click(self.view_cart_button)
-        self.wait_for_page_load()
+        CartPage(self.page).wait_for_page_load()
         
-    @allure.step("Search for product: {search_term}")
+    @step("Search for product: {search_term}")
     def search_product(self, search_term):
         """Search for a product using the search box"""
-        self.logger.info(f"Searching for product: {search_term}")
+        self.logger.info("Searching for product: %s", search_term)
         self.fill(self.search_box, search_term)
-        self.click(self.search_button)
+        # The catalogue's ready selectors also match the page being left, so wait for the results document first
+        with self.page.expect_navigation(url=self.search_results_url):
+            self.click(self.search_button)
         self.wait_for_page_load()
         
-    @allure.step("Add first product to cart")
+    @step("Add first product to cart")
     def add_first_product_to_cart(self):
         """Add the first product on the page to cart"""
         self.logger.info("Adding first product to cart")
@@ -99,7 +89,7 @@ class ProductsPage(BasePage):
         # Click the first add to cart button
         self.page.locator(self.add_to_cart_buttons).first.click()
         # Wait for modal to appear
-        self.wait_for_selector("#cartModal", state="visible")
+        self.wait_for_selector(self.cart_modal, state="visible")
         # Click continue shopping
         self.click(self.continue_shopping_button)
  
\ No newline at end of file
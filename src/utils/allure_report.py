@@ -0,0 +1,318 @@
+import html
+import json
+import os
+import shutil
+import subprocess
+import time
+
+from src.utils.logger import Logger
+
+STATUSES = ("failed", "broken", "passed", "skipped", "unknown")
+MODES = ("full", "incremental")
+
+# Bumped when the parsed fields change, so an older incremental.json is rebuilt
+STATE_VERSION = 2
+
+# Allure's own history files, written so a later full `allure generate` keeps the trends
+HISTORY_FILES = ("history.json", "history-trend.json", "duration-trend.json")
+
+STATUS_COLOURS = {
+    "failed": "#fd5a3e",
+    "broken": "#ffd050",
+    "passed": "#97cc64",
+    "skipped": "#aaaaaa",
+    "unknown": "#d35ebe",
+}
+
+
+def _attachments(node):
+    """Attachments of a result or step, including those of nested steps"""
+    found = list(node.get("attachments", []))
+    for step in node.get("steps", []):
+        found.extend(_attachments(step))
+    return found
+
+
+def _summarize(result):
+    """The fields of an Allure result file the report needs"""
+    details = result.get("statusDetails") or {}
+    labels = {label["name"]: label["value"] for label in result.get("labels", [])}
+    return {
+        "uuid": result["uuid"],
+        "history_id": result.get("historyId") or result.get("fullName") or result["uuid"],
+        "name": result.get("name"),
+        "full_name": result.get("fullName") or result.get("name"),
+        "suite": labels.get("suite", ""),
+        "status": result.get("status") or "unknown",
+        "message": (details.get("message") or "").strip(),
+        "start": result.get("start") or 0,
+        "stop": result.get("stop") or 0,
+        "attachments": [
+            {"name": attachment.get("name") or attachment["source"], "source": attachment["source"]}
+            for attachment in _attachments(result)
+        ],
+    }
+
+
+class IncrementalAllureReport:
+    """Builds a static report from allure-results, parsing only result files that are new or changed.
+
+    The parsed results are kept in <report_dir>/data/incremental.json with
+    each file's size and modification time, so a rebuild reads only what
+    changed since the previous one and copies only new attachments. Like
+    Allure, the report shows the latest result per test (historyId); earlier
+    ones count as retries.
+
+    finish_build() closes a run: it appends the run's statistics to the trend
+    and each test's result to its history, and writes Allure's history files
+    to <report_dir>/history, so `allure generate` keeps the trends too.
+    Calling update() while tests are still running writes a partial report
+    that reloads itself.
+    """
+
+    def __init__(self, results_dir="allure-results", report_dir="allure-report", history_limit=20):
+        self.results_dir = results_dir
+        self.report_dir = report_dir
+        self.history_limit = history_limit
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.state_path = os.path.join(report_dir, "data", "incremental.json")
+        self.state = self._load()
+
+    def _load(self):
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, encoding="utf-8") as state_file:
+                    state = json.load(state_file)
+                if state.get("version") == STATE_VERSION:
+                    return state
+                self.logger.info("Rebuilding the report, state %s is from an older version", self.state_path)
+            except (OSError, ValueError) as error:
+                self.logger.warning("Rebuilding the report, unreadable state %s: %s", self.state_path, error)
+        return {"version": STATE_VERSION, "files": {}, "built": [], **self._load_history()}
+
+    def _load_history(self):
+        """Trend and history from Allure's history files (e.g. left by a full `allure generate`)"""
+        directory = os.path.join(self.report_dir, "history")
+        loaded = {}
+        for file_name in HISTORY_FILES:
+            try:
+                with open(os.path.join(directory, file_name), encoding="utf-8") as history_file:
+                    loaded[file_name] = json.load(history_file)
+            except (OSError, ValueError):
+                loaded[file_name] = None
+        builds = loaded["history-trend.json"] or []
+        durations = loaded["duration-trend.json"] or []
+        trend = [
+            {
+                "buildOrder": build.get("buildOrder") or len(builds) - index,
+                "reportName": build.get("reportName") or f"Run {len(builds) - index}",
+                "data": {**{status: 0 for status in STATUSES}, "total": 0, **build.get("data", {})},
+                "duration": durations[index]["data"].get("duration", 0) if index < len(durations) else 0,
+            }
+            for index, build in enumerate(builds)
+        ]
+        history = {
+            history_id: entry.get("items", [])
+            for history_id, entry in (loaded["history.json"] or {}).items()
+        }
+        return {"trend": trend, "history": history}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as state_file:
+            json.dump(self.state, state_file)
+        os.replace(tmp_path, self.state_path)
+
+    def _copy_attachment(self, source):
+        target = os.path.join(self.report_dir, "data", "attachments", source)
+        origin = os.path.join(self.results_dir, source)
+        if not os.path.exists(target) and os.path.exists(origin):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(origin, target)
+
+    def update(self, partial=False, refresh=10):
+        """Parse new and changed result files and rewrite the report; returns how many were parsed.
+
+        partial marks the report as in progress (it reloads every refresh seconds).
+        """
+        start = time.perf_counter()
+        files = self.state["files"]
+        present = set()
+        parsed = 0
+        names = os.listdir(self.results_dir) if os.path.isdir(self.results_dir) else []
+        for name in names:
+            if not name.endswith("-result.json"):
+                continue
+            present.add(name)
+            stat = os.stat(os.path.join(self.results_dir, name))
+            fingerprint = [stat.st_size, stat.st_mtime_ns]
+            if name in files and files[name]["fingerprint"] == fingerprint:
+                continue
+            try:
+                with open(os.path.join(self.results_dir, name), encoding="utf-8") as result_file:
+                    summary = _summarize(json.load(result_file))
+            except (OSError, ValueError, KeyError) as error:
+                # Possibly still being written; picked up by the next update
+                self.logger.debug("Skipping %s for now: %s", name, error)
+                continue
+            for attachment in summary["attachments"]:
+                self._copy_attachment(attachment["source"])
+            files[name] = {"fingerprint": fingerprint, "test": summary}
+            parsed += 1
+        for name in set(files) - present:
+            del files[name]
+        self._save()
+        self._write_html(partial, refresh)
+        self.logger.info(
+            "Report updated: %d new or changed of %d result files in %.2fs",
+            parsed, len(files), time.perf_counter() - start,
+        )
+        return parsed
+
+    def stream(self, process, interval=10):
+        """Keep a partial report up to date until process exits; returns its exit code"""
+        while True:
+            try:
+                return process.wait(timeout=interval)
+            except subprocess.TimeoutExpired:
+                self.update(partial=True, refresh=interval)
+
+    def latest(self):
+        """historyId -> (latest result, number of earlier results)"""
+        latest = {}
+        for entry in self.state["files"].values():
+            test = entry["test"]
+            current, retries = latest.get(test["history_id"], (None, -1))
+            if current is None or test["stop"] >= current["stop"]:
+                current = test
+            latest[test["history_id"]] = (current, retries + 1)
+        return latest
+
+    def statistic(self):
+        counts = {status: 0 for status in STATUSES}
+        for test, _ in self.latest().values():
+            counts[test["status"] if test["status"] in counts else "unknown"] += 1
+        counts["total"] = sum(counts.values())
+        return counts
+
+    def finish_build(self, name=None):
+        """Record the run since the previous finish_build in the trend and history"""
+        self.update()
+        built = set(self.state["built"])
+        new = [entry["test"] for file_name, entry in self.state["files"].items() if file_name not in built]
+        if not new:
+            return None
+        build_order = (self.state["trend"][0]["buildOrder"] + 1) if self.state["trend"] else 1
+        statistic = self.statistic()
+        stops = [test["stop"] for test in new if test["stop"]]
+        starts = [test["start"] for test in new if test["start"]]
+        self.state["trend"].insert(0, {
+            "buildOrder": build_order,
+            "reportName": name or f"Run {build_order}",
+            "data": statistic,
+            "duration": (max(stops) - min(starts)) if stops and starts else 0,
+        })
+        del self.state["trend"][self.history_limit:]
+        for test in new:
+            items = self.state["history"].setdefault(test["history_id"], [])
+            items.insert(0, {
+                "uid": test["uuid"],
+                "status": test["status"],
+                "statusDetails": test["message"] or None,
+                "time": {"start": test["start"], "stop": test["stop"], "duration": test["stop"] - test["start"]},
+            })
+            del items[self.history_limit:]
+        self.state["built"] = sorted(self.state["files"])
+        self._save()
+        self._write_history()
+        self._write_html(partial=False)
+        return statistic
+
+    def _write_history(self):
+        """Allure's history files, from the trend and history kept in the state"""
+        directory = os.path.join(self.report_dir, "history")
+        os.makedirs(directory, exist_ok=True)
+        history = {}
+        for history_id, items in self.state["history"].items():
+            statistic = {status: 0 for status in STATUSES}
+            for item in items:
+                statistic[item["status"] if item["status"] in statistic else "unknown"] += 1
+            statistic["total"] = len(items)
+            history[history_id] = {"statistic": statistic, "items": items}
+        trend = self.state["trend"]
+        contents = {
+            "history.json": history,
+            "history-trend.json": [
+                {"buildOrder": build["buildOrder"], "reportName": build["reportName"], "data": build["data"]}
+                for build in trend
+            ],
+            "duration-trend.json": [{"data": {"duration": build["duration"]}} for build in trend],
+        }
+        for file_name, content in contents.items():
+            with open(os.path.join(directory, file_name), "w", encoding="utf-8") as history_file:
+                json.dump(content, history_file)
+
+    def _write_html(self, partial, refresh=10):
+        statistic = self.statistic()
+        order = {status: index for index, status in enumerate(STATUSES)}
+        latest = sorted(self.latest().values(), key=lambda pair: (order.get(pair[0]["status"], 99), pair[0]["full_name"]))
+        rows = []
+        for test, retries in latest:
+            links = " ".join(
+                f'<a href="data/attachments/{html.escape(attachment["source"])}">{html.escape(attachment["name"])}</a>'
+                for attachment in test["attachments"]
+            )
+            rows.append(
+                f'<tr><td style="color:{STATUS_COLOURS.get(test["status"], "#000")}">{test["status"]}</td>'
+                f'<td>{html.escape(test["full_name"])}</td>'
+                f'<td>{(test["stop"] - test["start"]) / 1000:.2f}s</td>'
+                f'<td>{retries or ""}</td>'
+                f'<td><pre>{html.escape(test["message"])}</pre></td><td>{links}</td></tr>'
+            )
+        trend = "".join(
+            f'<div title="{html.escape(build["reportName"])}: {build["data"]["passed"]}/{build["data"]["total"]} passed" '
+            f'style="display:inline-block;width:14px;margin-right:2px;vertical-align:bottom">'
+            + "".join(
+                f'<div style="height:{round(40 * build["data"][status] / max(build["data"]["total"], 1))}px;'
+                f'background:{STATUS_COLOURS[status]}"></div>'
+                for status in STATUSES
+            )
+            + "</div>"
+            for build in reversed(self.state["trend"])
+        )
+        counts = ", ".join(f"{statistic[status]} {status}" for status in STATUSES if statistic[status])
+        page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Test report</title>
+{f'<meta http-equiv="refresh" content="{refresh}">' if partial else ''}
+<style>body{{font-family:sans-serif;margin:2em}}table{{border-collapse:collapse;width:100%}}
+td,th{{border-bottom:1px solid #ddd;padding:4px;text-align:left;vertical-align:top}}pre{{margin:0;white-space:pre-wrap}}</style>
+</head><body>
+<h1>Test report{' (run in progress)' if partial else ''}</h1>
+<p>{statistic["total"]} tests: {counts or "no results yet"}</p>
+<div>{trend}</div>
+<table><tr><th>Status</th><th>Test</th><th>Duration</th><th>Retries</th><th>Message</th><th>Attachments</th></tr>
+{"".join(rows)}
+</table></body></html>
+"""
+        os.makedirs(self.report_dir, exist_ok=True)
+        with open(os.path.join(self.report_dir, "index.html"), "w", encoding="utf-8") as report_file:
+            report_file.write(page)
+
+
+def generate_full(results_dir="allure-results", report_dir="allure-report"):
+    """Run `allure generate`, carrying the previous report's history over so trends survive --clean"""
+    previous = os.path.join(report_dir, "history")
+    if os.path.isdir(previous):
+        shutil.copytree(previous, os.path.join(results_dir, "history"), dirs_exist_ok=True)
+    return subprocess.run(f"allure generate {results_dir} --clean -o {report_dir}", shell=True).returncode
+
+
+def build_report(mode="full", results_dir="allure-results", report_dir="allure-report"):
+    """Build the report after a run: a full Allure report, or the incremental static page"""
+    if mode not in MODES:
+        raise ValueError(f"Allure report mode must be one of {MODES}, got {mode!r}")
+    if mode == "full":
+        return generate_full(results_dir, report_dir)
+    IncrementalAllureReport(results_dir, report_dir).finish_build()
+    return 0
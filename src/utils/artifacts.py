@@ -0,0 +1,28 @@
+import os
+import re
+
+
+def safe_node_name(nodeid):
+    """Turn a pytest nodeid into a file-system safe name"""
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+
+
+def worker_id():
+    """Return the xdist worker id (gw0, gw1, ...) or "main" when not running in parallel"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def failed(item):
+    """True if the test's setup or call failed.
+
+    Relies on the root conftest storing each phase's report as item.rep_<when>.
+    """
+    return any(
+        getattr(getattr(item, f"rep_{when}", None), "failed", False)
+        for when in ("setup", "call")
+    )
+
+
+def failed_or_retried(item):
+    """True if the test failed or is a re-run (pytest-rerunfailures)"""
+    return getattr(item, "execution_count", 1) > 1 or failed(item)
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import time
+
+from playwright.async_api import async_playwright
+
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+
+class AsyncRunner:
+    """Drives playwright.async_api on an event loop running in a background thread.
+
+    Sync tests (and the sync Playwright driver used by the rest of the suite)
+    keep the main thread; coroutines are submitted with ``run`` and many
+    independent contexts can be driven concurrently with ``run_scenarios``.
+
+        runner = AsyncRunner("chromium", {"headless": True}, {"viewport": ...}, base_url).start()
+        results = runner.run_scenarios(scenario, count=20)
+        runner.stop()
+    """
+
+    def __init__(self, browser_name, launch_args, context_args, base_url, timeout=30000):
+        self.browser_name = browser_name
+        self.launch_args = launch_args
+        self.context_args = context_args
+        self.base_url = base_url
+        self.timeout = timeout
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.loop = None
+        self.playwright = None
+        self.browser = None
+        self._thread = None
+
+    def start(self):
+        """Start the event loop thread and launch the browser on it"""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-playwright", daemon=True)
+        self._thread.start()
+        self.run(self._launch())
+        return self
+
+    async def _launch(self):
+        start = time.perf_counter()
+        self.playwright = await async_playwright().start()
+        browser_type = getattr(self.playwright, self.browser_name, self.playwright.chromium)
+        self.browser = await browser_type.launch(**self.launch_args)
+        RunStats.record_time("async_browser_launch", time.perf_counter() - start)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the runner's loop and return its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    async def new_page(self, **context_args):
+        """Open a page in a fresh context, already on BASE_URL"""
+        context = await self.browser.new_context(**{**self.context_args, **context_args})
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout)
+        await page.goto(self.base_url)
+        return page
+
+    async def _run_scenario(self, scenario, index, semaphore):
+        async with semaphore:
+            page = await self.new_page()
+            start = time.perf_counter()
+            try:
+                return await scenario(page, index)
+            finally:
+                RunStats.record_time("async_scenario", time.perf_counter() - start)
+                await page.context.close()
+
+    async def _gather(self, scenario, count, concurrency):
+        semaphore = asyncio.Semaphore(concurrency or count)
+        return await asyncio.gather(
+            *(self._run_scenario(scenario, index, semaphore) for index in range(count)),
+            return_exceptions=True,
+        )
+
+    def run_scenarios(self, scenario, count, concurrency=None):
+        """Run ``scenario(page, index)`` in ``count`` independent contexts concurrently.
+
+        At most ``concurrency`` contexts are open at once (all of them by default).
+        Every scenario runs to completion; the first failure is then re-raised.
+        """
+        self.logger.info("Running %s concurrent scenarios (concurrency=%s)", count, concurrency or count)
+        results = self.run(self._gather(scenario, count, concurrency))
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _close(self):
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+
+    def stop(self):
+        """Close the browser and stop the event loop thread"""
+        try:
+            self.run(self._close())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+            self.loop.close()
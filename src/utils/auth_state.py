@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+import time
+
+from src.pages.login_page import LoginPage
+from src.utils.logger import Logger
+from src.utils.test_data import TestData
+
+
+class AuthStateCache:
+    """Stores a logged-in context's storage_state on disk and reuses it until it goes stale.
+
+    A cached state is only reused for the same BASE_URL and user, while it is
+    younger than ``max_age`` seconds and none of its cookies have expired.
+    """
+
+    def __init__(self, cache_dir=".auth", max_age=1800):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def path_for(self, base_url, email):
+        key = hashlib.sha1(f"{base_url}|{email}".encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"storage_state_{key}.json")
+
+    def _meta_path(self, path):
+        return path.replace(".json", ".meta.json")
+
+    def load(self, base_url, email):
+        """Return the path of a usable cached state, or None"""
+        path = self.path_for(base_url, email)
+        meta_path = self._meta_path(path)
+        if not (os.path.exists(path) and os.path.exists(meta_path)):
+            return None
+
+        with open(meta_path, encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        if meta.get("base_url") != base_url or meta.get("email") != email:
+            self.logger.info("Cached storage state is for another BASE_URL or user")
+            return None
+        if time.time() - meta.get("created", 0) > self.max_age:
+            self.logger.info("Cached storage state is older than AUTH_STATE_TTL")
+            return None
+
+        with open(path, encoding="utf-8") as state_file:
+            state = json.load(state_file)
+        now = time.time()
+        if any(0 < cookie.get("expires", -1) < now for cookie in state.get("cookies", [])):
+            self.logger.info("Cached storage state has expired cookies")
+            return None
+        return path
+
+    def save(self, context, base_url, email):
+        """Write the context's storage_state atomically and return its path"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(base_url, email)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        context.storage_state(path=tmp_path)
+        os.replace(tmp_path, path)
+
+        meta = {"base_url": base_url, "email": email, "created": time.time()}
+        tmp_meta = f"{self._meta_path(path)}.{os.getpid()}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(tmp_meta, self._meta_path(path))
+        return path
+
+
+def log_in(page, base_url, user):
+    """Log in through the UI, registering the user first if it does not exist yet"""
+    page.goto(f"{base_url}/login")
+    login_page = LoginPage(page)
+    login_page.wait_for_page_load()
+    if login_page.login(user["email"], user["password"]):
+        return True
+
+    page.goto(f"{base_url}/login")
+    login_page.signup(user["name"], user["email"])
+    registration = dict(TestData.NEW_USER, password=user["password"])
+    return login_page.complete_registration(registration)
@@ -0,0 +1,316 @@
+import json
+import os
+from importlib.metadata import version
+import queue
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from playwright._impl._driver import compute_driver_executable, get_driver_env
+
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+MODES = ("per-worker", "shared")
+
+# Set by the session controller in shared mode; xdist workers inherit it
+ENDPOINT_VARIABLE = "BROWSER_WS_ENDPOINT"
+
+# BrowserServer starts the driver through Playwright's private _impl._driver
+# helpers and its undocumented launch-server command; both are only known to
+# work with the version pinned in requirements.txt
+SUPPORTED_PLAYWRIGHT = "1.35.0"
+
+
+def check_playwright_version():
+    """Raise ValueError when the installed Playwright is not the one BrowserServer was built against"""
+    installed = version("playwright")
+    if installed != SUPPORTED_PLAYWRIGHT:
+        raise ValueError(
+            f"BROWSER_SERVER=shared needs playwright=={SUPPORTED_PLAYWRIGHT} (installed {installed}); "
+            f"use BROWSER_SERVER=per-worker or set {ENDPOINT_VARIABLE} to an externally managed server"
+        )
+
+
+def process_tree_rss(pid, include_root=True, exclude=()):
+    """Resident memory (KB) of a process and its descendants, or None where /proc is unavailable.
+
+    Subtrees rooted at a pid in exclude are skipped.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children, rss = {}, {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat_file:
+                # The command name may contain spaces; fields after it are fixed
+                fields = stat_file.read().rsplit(")", 1)[1].split()
+            with open(f"/proc/{entry}/statm") as statm_file:
+                resident_pages = int(statm_file.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+        rss[int(entry)] = resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    if pid not in rss:
+        return None
+    total, pending = (rss[pid] if include_root else 0), list(children.get(pid, []))
+    while pending:
+        child = pending.pop()
+        if child in exclude:
+            continue
+        total += rss.get(child, 0)
+        pending.extend(children.get(child, []))
+    return total
+
+
+class RssSampler:
+    """Background thread tracking the peak resident memory of a process tree"""
+
+    def __init__(self, pid, include_root=True, exclude=(), interval=1.0):
+        self.pid = pid
+        self.include_root = include_root
+        self.exclude = exclude
+        self.interval = interval
+        self.peak_kb = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def sample(self):
+        """Take one sample now; returns it in KB (None where unsupported)"""
+        rss = process_tree_rss(self.pid, self.include_root, self.exclude)
+        if rss is not None:
+            self.peak_kb = max(self.peak_kb, rss)
+        return rss
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.sample()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling; returns the peak in KB"""
+        self._stopped.set()
+        self._thread.join()
+        self.sample()
+        return self.peak_kb
+
+
+def _free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class BrowserServer:
+    """One Playwright browser server (``playwright launch-server``) shared by every xdist worker.
+
+    The session controller starts it before the workers are spawned; workers
+    connect to ws_endpoint and open their own contexts. A watchdog thread
+    restarts the server on the same port and path if it exits, so the endpoint
+    the workers were given stays valid, and tracks the server's peak memory.
+
+    The server is started through Playwright's private driver helpers and the
+    undocumented launch-server command, which are tied to the pinned Playwright
+    version (see check_playwright_version).
+    """
+
+    def __init__(self, browser_name, launch_options, start_timeout=60, check_interval=1.0):
+        self.browser_name = browser_name
+        self.launch_options = launch_options
+        self.start_timeout = start_timeout
+        self.check_interval = check_interval
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.ws_endpoint = None
+        self.restarts = 0
+        self._process = None
+        self._config_path = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watchdog = None
+        self._sampler = None
+        self.peak_rss_kb = 0
+
+    def _launch(self):
+        """Start the server process and wait for it to print its endpoint"""
+        start = time.perf_counter()
+        self._process = subprocess.Popen(
+            [str(compute_driver_executable()), "launch-server",
+             "--browser", self.browser_name, "--config", self._config_path],
+            env=get_driver_env(),
+            stdout=subprocess.PIPE,
+            text=True,
+            # Own process group, so stopping the server also stops the shell wrapper's node child
+            start_new_session=sys.platform != "win32",
+        )
+        lines = queue.Queue()
+        threading.Thread(target=lambda: lines.put(self._process.stdout.readline()), daemon=True).start()
+        try:
+            endpoint = lines.get(timeout=self.start_timeout).strip()
+        except queue.Empty:
+            endpoint = ""
+        if not endpoint.startswith("ws"):
+            self._terminate()
+            raise RuntimeError(f"{self.browser_name} browser server did not start (output: {endpoint!r})")
+        self.ws_endpoint = endpoint
+        self._sampler = RssSampler(self._process.pid, interval=self.check_interval).start()
+        RunStats.record_time("browser_server_start", time.perf_counter() - start)
+        self.logger.info("Started %s browser server at %s", self.browser_name, endpoint)
+
+    def start(self):
+        """Launch the server and its watchdog; returns the server"""
+        options = {**self.launch_options, "port": _free_port(), "wsPath": f"/{uuid.uuid4().hex}"}
+        handle, self._config_path = tempfile.mkstemp(prefix="browser-server-", suffix=".json")
+        with os.fdopen(handle, "w") as config_file:
+            json.dump(options, config_file)
+        self._launch()
+        self._watchdog = threading.Thread(target=self._watch, name="browser-server-watchdog", daemon=True)
+        self._watchdog.start()
+        return self
+
+    @property
+    def pid(self):
+        return self._process.pid if self._process else None
+
+    def peak_rss(self):
+        """Peak memory of the server's process tree so far, in KB (across restarts)"""
+        if self._sampler:
+            return max(self.peak_rss_kb, self._sampler.peak_kb)
+        return self.peak_rss_kb
+
+    def alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def restart(self):
+        """Replace a dead or unresponsive server; the endpoint does not change"""
+        with self._lock:
+            self.logger.warning("Restarting %s browser server (exit code %s)",
+                                self.browser_name, self._process.poll() if self._process else None)
+            self._terminate()
+            self._launch()
+            self.restarts += 1
+            RunStats.increment("browser_server_restarts")
+
+    def _watch(self):
+        while not self._stopped.wait(self.check_interval):
+            if not self.alive() and not self._stopped.is_set():
+                try:
+                    self.restart()
+                except Exception as error:
+                    self.logger.error("Browser server restart failed: %s", error)
+
+    def _terminate(self):
+        if self._sampler:
+            self.peak_rss_kb = max(self.peak_rss_kb, self._sampler.stop())
+            self._sampler = None
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            try:
+                if sys.platform == "win32":
+                    self._process.terminate()
+                else:
+                    # SIGTERM lets the driver close its browsers before exiting
+                    os.killpg(self._process.pid, signal.SIGTERM)
+                self._process.wait(timeout=30)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+        self._process.stdout.close()
+        self._process = None
+
+    def stop(self):
+        """Stop the watchdog and the server"""
+        self._stopped.set()
+        if self._watchdog:
+            self._watchdog.join()
+        with self._lock:
+            self._terminate()
+        if self._config_path and os.path.exists(self._config_path):
+            os.remove(self._config_path)
+
+
+class SharedBrowser:
+    """A worker's connection to the shared browser server, reconnecting after a restart.
+
+    Behaves like the Browser it wraps. When the server has gone away, the next
+    attribute access reconnects (retrying while the controller restarts the
+    server); objects created on the old connection are gone with it.
+    """
+
+    def __init__(self, browser_type, ws_endpoint, slow_mo=0, timeout=60):
+        self._browser_type = browser_type
+        self._ws_endpoint = ws_endpoint
+        self._slow_mo = slow_mo
+        self._timeout = timeout
+        self._logger = Logger.get_logger(self.__class__.__name__)
+        self._browser = None
+        self._connect()
+
+    def _connect(self):
+        start = time.perf_counter()
+        deadline = start + self._timeout
+        while True:
+            try:
+                self._browser = self._browser_type.connect(self._ws_endpoint, slow_mo=self._slow_mo)
+                break
+            except Exception as error:
+                if time.perf_counter() > deadline:
+                    raise
+                self._logger.warning("Browser server not reachable (%s), retrying", error)
+                time.sleep(1)
+        RunStats.record_time("browser_connect", time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        if not self._browser.is_connected():
+            self._logger.warning("Lost the browser server connection, reconnecting")
+            RunStats.increment("browser_reconnects")
+            self._connect()
+        return getattr(self._browser, name)
+
+    def close(self):
+        """Disconnect; contexts this worker opened are closed, the server keeps running"""
+        if self._browser.is_connected():
+            self._browser.close()
+
+
+def browser_summary_line(server=None):
+    """One line for the terminal summary: browser startup time and memory in the mode that ran.
+
+    server is the controller's BrowserServer in shared mode.
+    """
+    worker_rss = RunStats.get_counter("browser_worker_rss_kb")
+    workers = RunStats.get_counter("browser_workers_sampled")
+    if server is not None:
+        connects = RunStats.get_timings("browser_connect")
+        line = (
+            f"browsers (shared server): server start {RunStats.get_timings('browser_server_start')[0]:.2f}s, "
+            f"restarts {server.restarts}"
+        )
+        if connects:
+            line += f", worker connect mean {sum(connects) / len(connects) * 1000:.0f}ms"
+        server_rss = server.peak_rss()
+        if server_rss and workers:
+            # Both are peaks sampled separately, so their sum is an upper bound
+            line += (
+                f", peak RSS <= {(server_rss + worker_rss) / 1024:.0f}MB "
+                f"(server peak {server_rss / 1024:.0f}MB + {workers} worker drivers' peaks {worker_rss / 1024:.0f}MB)"
+            )
+        return line
+    launches = RunStats.get_timings("browser_launch")
+    if not launches:
+        return None
+    line = f"browsers (per-worker): launch mean {sum(launches) / len(launches):.2f}s x{len(launches)}"
+    if workers:
+        line += f", peak RSS {worker_rss / 1024:.0f}MB across {workers} workers"
+    return line
@@ -0,0 +1,49 @@
+import json
+
+from src.utils.logger import Logger
+
+
+class CartSeeder:
+    """Puts products into a browser context's cart through direct HTTP calls.
+
+    Uses ``context.request``, which shares cookies with the browser context, so
+    the cart seeded here is the one the page sees on /view_cart.
+    """
+
+    _catalogs = {}
+
+    def __init__(self, context, base_url):
+        self.request = context.request
+        self.base_url = base_url.rstrip("/")
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def product_ids(self):
+        """Product name -> id, fetched once per base URL from /api/productsList"""
+        if self.base_url not in self._catalogs:
+            response = self.request.get(f"{self.base_url}/api/productsList")
+            if not response.ok:
+                raise RuntimeError(f"Could not load product list: HTTP {response.status}")
+            products = json.loads(response.text())["products"]
+            # Keep the first id for duplicated names, matching ProductsPage.add_to_cart
+            catalog = {}
+            for product in products:
+                catalog.setdefault(product["name"], product["id"])
+            self._catalogs[self.base_url] = catalog
+        return self._catalogs[self.base_url]
+
+    def add(self, product_name, quantity=1):
+        """Add a product to the cart by name"""
+        product_ids = self.product_ids()
+        if product_name not in product_ids:
+            raise ValueError(f"Product not found: {product_name}")
+        for _ in range(quantity):
+            response = self.request.get(f"{self.base_url}/add_to_cart/{product_ids[product_name]}")
+            if not response.ok:
+                raise RuntimeError(f"Could not add {product_name} to cart: HTTP {response.status}")
+
+    def seed(self, products):
+        """Add products given as names or (name, quantity) tuples"""
+        for product in products:
+            name, quantity = product if isinstance(product, tuple) else (product, 1)
+            self.logger.info("Seeding cart with %s x %s", quantity, name)
+            self.add(name, quantity)
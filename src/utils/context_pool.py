@@ -0,0 +1,193 @@
+import asyncio
+import time
+from collections import deque
+
+from playwright._impl._sync_base import mapping
+
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+REUSE_POLICIES = ("reset", "discard")
+
+# Clears the storage the page's current origin can reach before the page is closed
+CLEAR_STORAGE_SCRIPT = """
+async () => {
+    try { localStorage.clear(); sessionStorage.clear(); } catch (error) {}
+    try {
+        for (const database of await indexedDB.databases()) indexedDB.deleteDatabase(database.name);
+    } catch (error) {}
+}
+"""
+
+# The only route pattern the framework installs (HAR replay, resource blocking); reset unroutes it
+FRAMEWORK_ROUTE = "**/*"
+
+# BrowserContext calls whose effects a reset cannot undo; a test that makes one
+# (or routes any other pattern) gets its context discarded instead of reused
+UNRESETTABLE_CALLS = (
+    "add_init_script", "set_extra_http_headers", "expose_binding", "expose_function",
+    "set_offline", "set_geolocation", "route_from_har",
+)
+
+
+class ContextPool:
+    """Per-worker pool of browser contexts prepared ahead of demand.
+
+    Contexts (each with one page, optionally already on base_url) are created
+    as tasks on the sync Playwright driver's own event loop. They make progress
+    whenever the test thread is inside a Playwright call, so the next test's
+    context is usually ready by the time the current test finishes.
+
+    After a test the context is either reset and reused or closed and replaced,
+    both in the background:
+      reset   - unroute "**/*" (the routes the framework installs), clear
+                cookies and permissions, clear the current origin's local and
+                session storage and IndexedDB, close every page and open a
+                fresh one
+      discard - close every context and prepare a new one
+
+    Reset only undoes that much, so a context is discarded instead when its
+    test failed, called one of UNRESETTABLE_CALLS or routed another pattern,
+    or when localStorage of any other origin is left afterwards. Other
+    origins' IndexedDB, Cache Storage and service workers are not checked;
+    tests that depend on a clean slate there should use CONTEXT_REUSE=discard.
+
+    This reaches into the sync API's loop (Browser._loop/_impl_obj), which is
+    tied to the pinned Playwright version.
+    """
+
+    def __init__(self, browser, context_args, base_url, size=2, reuse="reset", timeout=30000, navigate=True):
+        if reuse not in REUSE_POLICIES:
+            raise ValueError(f"CONTEXT_REUSE must be one of {REUSE_POLICIES}, got {reuse!r}")
+        self.browser = browser
+        self.context_args = context_args
+        self.base_url = base_url
+        self.size = size
+        self.reuse = reuse
+        self.timeout = timeout
+        self.navigate = navigate
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._loop = browser._loop
+        self._ready = deque()
+        self._closing = []
+
+    def start(self):
+        """Schedule the first contexts; returns the pool"""
+        for _ in range(self.size):
+            self._ready.append(self._spawn(self._create()))
+        return self
+
+    def _spawn(self, coro):
+        return self._loop.create_task(coro)
+
+    async def _prepare_page(self, context):
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout)
+        if self.navigate:
+            await page.goto(self.base_url)
+        return page
+
+    async def _create(self):
+        start = time.perf_counter()
+        context = await self.browser._impl_obj.new_context(**self.context_args)
+        page = await self._prepare_page(context)
+        RunStats.record_time("context_pool_create", time.perf_counter() - start)
+        RunStats.increment("context_pool_created")
+        return context, page
+
+    async def _reset(self, context, page):
+        start = time.perf_counter()
+        try:
+            await context.unroute(FRAMEWORK_ROUTE)
+            await context.clear_cookies()
+            await context.clear_permissions()
+            if not page.is_closed():
+                await page.evaluate(CLEAR_STORAGE_SCRIPT)
+            if (await context.storage_state())["origins"]:
+                raise RuntimeError("storage of another origin is left")
+            for open_page in list(context.pages):
+                await open_page.close()
+            new_page = await self._prepare_page(context)
+        except Exception as error:
+            self.logger.warning("Context reset failed (%s), replacing it", error)
+            await asyncio.gather(context.close(), return_exceptions=True)
+            return await self._create()
+        RunStats.record_time("context_pool_reset", time.perf_counter() - start)
+        RunStats.increment("context_pool_reused")
+        return context, new_page
+
+    async def _await(self, task):
+        return await task
+
+    def acquire(self):
+        """Take a prepared (context, page); blocks only while the next one is still being prepared"""
+        start = time.perf_counter()
+        task = self._ready.popleft() if self._ready else self._spawn(self._create())
+        RunStats.increment("context_pool_hit" if task.done() else "context_pool_miss")
+        try:
+            context, page = self.browser._sync(self._await(task))
+        except Exception as error:
+            # A context that failed to reset or open is replaced by a new one
+            self.logger.warning("Prepared context unusable (%s), creating a new one", error)
+            context, page = self.browser._sync(self._create())
+        RunStats.record_time("context_pool_wait", time.perf_counter() - start)
+        context = mapping.from_impl(context)
+        self._track(context)
+        return context, mapping.from_impl(page)
+
+    def _track(self, context):
+        """Mark the context as not resettable when the test makes a call reset cannot undo"""
+        context.pool_resettable = True
+        if hasattr(context, "pool_tracked"):
+            # Wrappers are cached per context, so the methods are already wrapped
+            return
+        context.pool_tracked = True
+        for name in UNRESETTABLE_CALLS + ("route",):
+            method = getattr(context, name)
+
+            def tracked(*args, _method=method, _name=name, **kwargs):
+                pattern = args[0] if args else kwargs.get("url")
+                if _name != "route" or pattern != FRAMEWORK_ROUTE:
+                    context.pool_resettable = False
+                return _method(*args, **kwargs)
+
+            setattr(context, name, tracked)
+
+    def release(self, context, page, reusable=True):
+        """Return a test's context: reset it for reuse, or close it and prepare a replacement"""
+        if not context.pool_resettable:
+            RunStats.increment("context_pool_unresettable")
+        if reusable and context.pool_resettable and self.reuse == "reset":
+            self._ready.append(self._spawn(self._reset(context._impl_obj, page._impl_obj)))
+            return
+        self._closing.append(self._spawn(context._impl_obj.close()))
+        self._closing = [task for task in self._closing if not task.done()]
+        self._ready.append(self._spawn(self._create()))
+
+    async def _drain(self):
+        prepared = await asyncio.gather(*self._ready, return_exceptions=True)
+        await asyncio.gather(*self._closing, return_exceptions=True)
+        for result in prepared:
+            if not isinstance(result, BaseException):
+                await result[0].close()
+
+    def stop(self):
+        """Wait for pending work and close every pooled context"""
+        self.browser._sync(self._drain())
+        self._ready.clear()
+        self._closing.clear()
+
+
+def pool_summary_line():
+    """One line for the terminal summary: how often tests found a context ready"""
+    hits = RunStats.get_counter("context_pool_hit")
+    misses = RunStats.get_counter("context_pool_miss")
+    if not (hits or misses):
+        return None
+    waits = RunStats.get_timings("context_pool_wait")
+    return (
+        f"context pool: hit rate {hits / (hits + misses):.0%} ({hits}/{hits + misses}), "
+        f"mean wait {sum(waits) / len(waits) * 1000:.1f}ms, "
+        f"reused {RunStats.get_counter('context_pool_reused')}, "
+        f"created {RunStats.get_counter('context_pool_created')}"
+    )
@@ -0,0 +1,136 @@
+import heapq
+import json
+import os
+import statistics
+
+from src.utils.logger import Logger
+
+# Estimate for a test when neither it nor any test sharing a marker has history
+DEFAULT_ESTIMATE = 10.0
+# Registered markers that describe how a test runs rather than what kind of test it is
+IGNORED_MARKERS = {"block_profile", "authenticated", "perf_budget"}
+
+
+class DurationHistory:
+    """Per-test durations from previous runs, keyed by browser, environment and nodeid.
+
+    Each entry keeps a smoothed duration (exponential moving average, so one
+    slow run does not dominate) plus the test's markers, which are used to
+    estimate tests that have no history yet.
+    """
+
+    def __init__(self, path, browser, environment, smoothing=0.5):
+        self.path = path
+        self.prefix = f"{browser}|{environment}|"
+        self.smoothing = smoothing
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as history_file:
+                return json.load(history_file)
+        except (OSError, ValueError) as error:
+            self.logger.warning("Ignoring unreadable duration history %s: %s", self.path, error)
+            return {}
+
+    def _known(self):
+        """nodeid -> entry for the current browser and environment"""
+        return {
+            key[len(self.prefix):]: entry
+            for key, entry in self.entries.items()
+            if key.startswith(self.prefix)
+        }
+
+    def estimates(self, tests):
+        """Estimated seconds for each (nodeid, markers) pair, in the same order.
+
+        Known tests use their history; unknown ones the average of known tests
+        sharing a marker, then the average of all known tests, then DEFAULT_ESTIMATE.
+        """
+        known = self._known()
+        by_marker = {}
+        for entry in known.values():
+            for marker in entry.get("markers", []):
+                by_marker.setdefault(marker, []).append(entry["duration"])
+        overall = statistics.mean(entry["duration"] for entry in known.values()) if known else DEFAULT_ESTIMATE
+
+        result = []
+        for nodeid, markers in tests:
+            if nodeid in known:
+                result.append(known[nodeid]["duration"])
+                continue
+            marker_durations = [statistics.mean(by_marker[marker]) for marker in markers if marker in by_marker]
+            result.append(max(marker_durations) if marker_durations else overall)
+        return result
+
+    def update(self, durations, markers):
+        """Fold one run's durations (nodeid -> seconds) into the history"""
+        for nodeid, seconds in durations.items():
+            key = self.prefix + nodeid
+            previous = self.entries.get(key)
+            if previous:
+                seconds = self.smoothing * seconds + (1 - self.smoothing) * previous["duration"]
+            self.entries[key] = {
+                "duration": round(seconds, 3),
+                "markers": sorted(markers.get(nodeid, [])),
+            }
+
+    def save(self):
+        """Write the history atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as history_file:
+            json.dump(self.entries, history_file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def marker_names(names, registered):
+    """The registered markers among names that describe a test's kind (smoke, cart, checkout, ...)"""
+    return sorted(set(names) & set(registered) - IGNORED_MARKERS)
+
+
+def registered_markers(config):
+    """Marker names declared in pytest.ini"""
+    return [line.split(":")[0].split("(")[0].strip() for line in config.getini("markers")]
+
+
+def predicted_makespan(estimates, workers):
+    """Makespan of handing tests out longest-first to whichever worker frees up first"""
+    loads = [0.0] * max(workers, 1)
+    for estimate in sorted(estimates, reverse=True):
+        heapq.heapreplace(loads, loads[0] + estimate)
+    return max(loads)
+
+
+def parse_shard(value):
+    """(index, count) from "i/N" with 1 <= i <= N, or None for an empty value"""
+    if not value:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"SHARD must look like i/N, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"SHARD index must be between 1 and {count}, got {value!r}")
+    return index, count
+
+
+def assign_shards(tests, count):
+    """Split (nodeid, estimate) pairs into count shards of similar total duration.
+
+    Longest test first to the least-loaded shard, ties broken by nodeid and
+    shard number, so every machine computes the same split from the same
+    history. Returns a list of nodeid lists, one per shard.
+    """
+    shards = [[] for _ in range(count)]
+    loads = [(0.0, shard) for shard in range(count)]
+    for nodeid, estimate in sorted(tests, key=lambda test: (-test[1], test[0])):
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(nodeid)
+        heapq.heappush(loads, (load + estimate, shard))
+    return shards
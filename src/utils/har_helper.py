@@ -0,0 +1,179 @@
+import base64
+import glob
+import json
+import os
+import zipfile
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.utils.artifacts import safe_node_name
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+# Headers that no longer describe the body once it has been decoded from the archive
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def archive_path(har_dir, nodeid):
+    """Compressed HAR archive used to record/replay a single test"""
+    return os.path.join(har_dir, f"{safe_node_name(nodeid)}.zip")
+
+
+def record_context_args(har_dir, nodeid):
+    """Extra ``browser.new_context`` arguments that record a compressed HAR for the test"""
+    os.makedirs(har_dir, exist_ok=True)
+    return {
+        "record_har_path": archive_path(har_dir, nodeid),
+        "record_har_content": "attach",
+        "record_har_mode": "full",
+    }
+
+
+def match_keys(method, url):
+    """Lookup keys from most to least specific: exact URL, normalised query, path only"""
+    parts = urlsplit(url)
+    base = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return [
+        ("exact", (method, url)),
+        ("query", (method, f"{base}?{query}")),
+        ("path", (method, base)),
+    ]
+
+
+class HarArchive:
+    """Responses from one or more HAR files, indexed by method and URL"""
+
+    def __init__(self):
+        self.entries = {strategy: defaultdict(list) for strategy in ("exact", "query", "path")}
+        self.size = 0
+
+    @classmethod
+    def from_files(cls, paths):
+        archive = cls()
+        for path in paths:
+            archive.add_file(path)
+        return archive
+
+    def add_file(self, path):
+        """Index every replayable entry of a .har or a zipped HAR"""
+        if path.endswith(".zip"):
+            with zipfile.ZipFile(path) as bundle:
+                har_name = next(name for name in bundle.namelist() if name.endswith(".har"))
+                har = json.loads(bundle.read(har_name))
+                files = {name: bundle.read(name) for name in bundle.namelist() if name != har_name}
+        else:
+            with open(path, encoding="utf-8") as har_file:
+                har = json.load(har_file)
+            files = {}
+
+        for entry in har.get("log", {}).get("entries", []):
+            response = entry.get("response", {})
+            if response.get("status", 0) <= 0:
+                continue
+            record = {
+                "status": response["status"],
+                "headers": self._headers(response.get("headers", [])),
+                "body": self._body(response.get("content", {}), files),
+            }
+            request = entry["request"]
+            for strategy, key in match_keys(request["method"], request["url"]):
+                self.entries[strategy][key].append(record)
+            self.size += 1
+
+    @staticmethod
+    def _headers(header_list):
+        headers = {}
+        for header in header_list:
+            name = header["name"].lower()
+            if name in SKIPPED_HEADERS or name.startswith(":"):
+                continue
+            headers[name] = f"{headers[name]}\n{header['value']}" if name in headers else header["value"]
+        return headers
+
+    @staticmethod
+    def _body(content, files):
+        if "_file" in content:
+            return files.get(content["_file"], b"")
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
+
+    def lookup(self, strategy, key):
+        return self.entries[strategy].get(key)
+
+
+class HarReplayer:
+    """Serves requests of one browser context from recorded archives.
+
+    The test's own archive is searched first, then the archive built from all
+    recordings. Repeated requests for the same key are answered with the
+    recorded responses in order, so flows like view_cart before and after
+    adding a product replay correctly.
+    """
+
+    _shared_archives = {}
+
+    def __init__(self, har_dir, nodeid, miss_policy="fallback"):
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.miss_policy = miss_policy
+        own_path = archive_path(har_dir, nodeid)
+        self.archives = [HarArchive.from_files([own_path])] if os.path.exists(own_path) else []
+        self.archives.append(self.shared_archive(har_dir))
+        self.cursors = defaultdict(int)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared_archive(cls, har_dir):
+        """Archive of every recording in har_dir, loaded once per process"""
+        if har_dir not in cls._shared_archives:
+            paths = sorted(glob.glob(os.path.join(har_dir, "*.zip")) + glob.glob(os.path.join(har_dir, "*.har")))
+            cls._shared_archives[har_dir] = HarArchive.from_files(paths)
+        return cls._shared_archives[har_dir]
+
+    def install(self, context):
+        """Route every request of the context through the replayer"""
+        context.route("**/*", self._handle)
+
+    def _find(self, method, url):
+        for position, archive in enumerate(self.archives):
+            for strategy, key in match_keys(method, url):
+                records = archive.lookup(strategy, key)
+                if records:
+                    cursor_key = (position, strategy, key)
+                    index = min(self.cursors[cursor_key], len(records) - 1)
+                    self.cursors[cursor_key] += 1
+                    return strategy, records[index]
+        return None, None
+
+    def _handle(self, route, request):
+        strategy, record = self._find(request.method, request.url)
+        if record is None:
+            self.misses += 1
+            RunStats.increment("har_miss")
+            self.logger.warning("HAR miss: %s %s", request.method, request.url)
+            if self.miss_policy == "abort":
+                route.abort()
+            else:
+                route.continue_()
+            return
+
+        self.hits += 1
+        RunStats.increment(f"har_hit_{strategy}")
+        route.fulfill(status=record["status"], headers=record["headers"], body=record["body"])
+
+
+def hit_rate_line():
+    """Summary of replay hits and misses for the terminal report"""
+    hits = sum(RunStats.get_counter(f"har_hit_{strategy}") for strategy in ("exact", "query", "path"))
+    misses = RunStats.get_counter("har_miss")
+    total = hits + misses
+    if not total:
+        return None
+    rate = hits / total * 100
+    line = f"HAR replay: {hits}/{total} requests served from archive ({rate:.1f}% hit rate)"
+    if misses:
+        line += " - archive may be stale, re-record with --har record"
+    return line
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+
+from src.pages.async_pages.cart_page import AsyncCartPage
+from src.pages.async_pages.home_page import AsyncHomePage
+from src.pages.async_pages.products_page import AsyncProductsPage
+from src.utils.async_runner import AsyncRunner
+from src.utils.logger import Logger
+from src.utils.run_stats import percentile
+from src.utils.test_data import TestData
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LoadStats:
+    """Latencies per page-object action, iteration counts and errors for one load run"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.started = None
+        self.finished = None
+
+    def record(self, action, seconds, ok=True):
+        self.latencies[action].append(seconds)
+        if not ok:
+            self.errors[action] += 1
+
+    def report(self):
+        """Summary as plain data: throughput, error rate and percentiles (ms) per action"""
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        total = self.iterations + self.failed_iterations
+        actions = {}
+        for action, values in self.latencies.items():
+            actions[action] = {
+                "count": len(values),
+                "errors": self.errors[action],
+                "mean_ms": round(sum(values) / len(values) * 1000, 1),
+                **{f"p{p}_ms": round(percentile(values, p) * 1000, 1) for p in PERCENTILES},
+            }
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "iterations": total,
+            "failed_iterations": self.failed_iterations,
+            "error_rate": round(self.failed_iterations / total, 4) if total else 0.0,
+            "iterations_per_s": round(total / elapsed, 2) if elapsed else 0.0,
+            "actions_per_s": round(sum(len(values) for values in self.latencies.values()) / elapsed, 2)
+            if elapsed else 0.0,
+            "actions": actions,
+        }
+
+
+def format_report(report):
+    """Human-readable lines for a LoadStats report"""
+    lines = [
+        f"{report['iterations']} iterations in {report['elapsed_s']}s: "
+        f"{report['iterations_per_s']} iterations/s, {report['actions_per_s']} actions/s, "
+        f"error rate {report['error_rate'] * 100:.1f}% ({report['failed_iterations']} failed)",
+        f"{'action':<42}{'count':>7}{'errors':>7}{'mean':>9}" + "".join(f"{f'p{p}':>9}" for p in PERCENTILES),
+    ]
+    for action, row in report["actions"].items():
+        lines.append(
+            f"{action:<42}{row['count']:>7}{row['errors']:>7}{row['mean_ms']:>9.0f}"
+            + "".join(f"{row[f'p{p}_ms']:>9.0f}" for p in PERCENTILES)
+        )
+    return lines
+
+
+class VirtualUser:
+    """One simulated shopper: a page in its own context, timing every page-object action"""
+
+    def __init__(self, index, iteration, page, stats, think_time):
+        self.index = index
+        self.iteration = iteration
+        self.page = page
+        self.stats = stats
+        self.think_time = think_time
+
+    async def act(self, action, awaitable):
+        """Await a page-object call, record its latency under action, then pause for think time"""
+        start = time.perf_counter()
+        try:
+            result = await awaitable
+        except Exception:
+            self.stats.record(action, time.perf_counter() - start, ok=False)
+            raise
+        self.stats.record(action, time.perf_counter() - start)
+        if self.think_time:
+            # +-50% jitter so users do not move in lockstep
+            await asyncio.sleep(random.uniform(0.5, 1.5) * self.think_time)
+        return result
+
+
+async def search_and_cart(user):
+    """Search, add the first result to the cart and view the cart"""
+    home_page = AsyncHomePage(user.page)
+    products_page = AsyncProductsPage(user.page)
+    search_term = TestData.SEARCH_TERMS[(user.index + user.iteration) % len(TestData.SEARCH_TERMS)]
+    await user.act("HomePage.go_to_products", home_page.go_to_products())
+    await user.act("ProductsPage.search_product", products_page.search_product(search_term))
+    await user.act("ProductsPage.add_first_product_to_cart", products_page.add_first_product_to_cart())
+    await user.act("ProductsPage.go_to_cart", products_page.go_to_cart())
+    await user.act("CartPage.snapshot", AsyncCartPage(user.page).snapshot())
+
+
+async def browse(user):
+    """Open the catalogue and a product's details without buying"""
+    home_page = AsyncHomePage(user.page)
+    products_page = AsyncProductsPage(user.page)
+    product_name = TestData.TEST_PRODUCTS[(user.index + user.iteration) % len(TestData.TEST_PRODUCTS)]
+    await user.act("HomePage.go_to_products", home_page.go_to_products())
+    await user.act("ProductsPage.get_product_names", products_page.get_product_names())
+    await user.act("ProductsPage.view_product_details", products_page.view_product_details(product_name))
+
+
+# Flows a virtual user can run; each takes a VirtualUser
+FLOWS = {
+    "search_and_cart": search_and_cart,
+    "browse": browse,
+}
+
+
+class LoadTest:
+    """Runs a flow as concurrent virtual users on one AsyncRunner.
+
+    Users start evenly spread over ramp_up seconds. Each repeats the flow, in a
+    fresh browser context per iteration, until duration seconds (ramp-up
+    included) have passed since the run started; iterations in flight are
+    allowed to finish. A failed iteration is counted and the user carries on.
+    """
+
+    def __init__(self, runner, flow, users, duration, ramp_up=0, think_time=0):
+        self.runner = runner
+        self.flow = FLOWS[flow] if isinstance(flow, str) else flow
+        self.users = users
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.stats = LoadStats()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    async def _user(self, index, deadline):
+        await asyncio.sleep(self.ramp_up * index / self.users)
+        iteration = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                page = await self.runner.new_page()
+            except Exception as error:
+                self.stats.record("open", time.perf_counter() - start, ok=False)
+                self.stats.failed_iterations += 1
+                self.logger.error("User %d could not open a page: %s", index, error)
+                await asyncio.sleep(1)
+                continue
+            self.stats.record("open", time.perf_counter() - start)
+            try:
+                await self.flow(VirtualUser(index, iteration, page, self.stats, self.think_time))
+                self.stats.iterations += 1
+            except Exception as error:
+                self.stats.failed_iterations += 1
+                self.logger.error("User %d iteration %d failed: %s", index, iteration, error)
+            finally:
+                await page.context.close()
+            iteration += 1
+
+    async def _run(self):
+        self.stats.started = time.perf_counter()
+        deadline = self.stats.started + self.duration
+        await asyncio.gather(*(self._user(index, deadline) for index in range(self.users)))
+        self.stats.finished = time.perf_counter()
+
+    def run(self):
+        """Run the load test and return its report"""
+        self.logger.info(
+            "Starting %d users for %ss (ramp-up %ss, think time %ss)",
+            self.users, self.duration, self.ramp_up, self.think_time,
+        )
+        self.runner.run(self._run())
+        return self.stats.report()
+
+
+def run_load(flow, users, duration, ramp_up=0, think_time=0, report_path="reports/load_report.json"):
+    """Run a load test against BASE_URL (or the bundled storefront with LOCAL_SERVER=true).
+
+    Browser settings come from the same environment variables as the test
+    suite. The report is printed and written to report_path; it is also returned.
+    """
+    # The suite's settings, so load mode launches the browser exactly like the async_runner fixture
+    from conftest import get_browser_args, get_config
+
+    server = None
+    if get_config()["local_server"]:
+        from src.local_store.server import StorefrontServer
+        server = StorefrontServer(port=get_config()["local_server_port"]).start()
+        os.environ["BASE_URL"] = server.url
+
+    config = get_config()
+    runner = AsyncRunner(
+        config["browser_name"],
+        {"headless": config["headless"], "slow_mo": config["slow_mo"], **get_browser_args()},
+        {"viewport": config["viewport"]},
+        config["base_url"],
+        config["timeout"],
+    ).start()
+    try:
+        report = LoadTest(runner, flow, users, duration, ramp_up, think_time).run()
+    finally:
+        runner.stop()
+        if server:
+            server.stop()
+
+    report = {"flow": flow, "users": users, "ramp_up_s": ramp_up, "think_time_s": think_time, **report}
+    for line in format_report(report):
+        print(line)
+    directory = os.path.dirname(report_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(report_path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+    print(f"Load report written to {report_path}")
+    return report
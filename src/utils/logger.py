@@ -1,37 +1,139 @@
 import  os
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import threading
 from datetime import datetime
+from src.utils.artifacts import worker_id
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Queues records without formatting them; the background listener does that.
+
+    The stock QueueHandler formats every message on the calling thread. Records
+    stay in this process, so they can be handed over as they are and the test
+    thread only pays for creating the record.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the records per level, e.g. {"INFO": 0.1} keeps every tenth INFO record.
+
+    Sampling is deterministic (a running credit per level) so the same suite
+    logs the same records from run to run. Levels without a rate are kept.
+    """
+
+    def __init__(self, rates):
+        super().__init__()
+        self.rates = rates
+        self._credit = {level: 0.0 for level in rates}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        rate = self.rates.get(record.levelname)
+        if rate is None or rate >= 1:
+            return True
+        with self._lock:
+            self._credit[record.levelname] += rate
+            if self._credit[record.levelname] >= 1:
+                self._credit[record.levelname] -= 1
+                return True
+        return False
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record, for LOG_FORMAT=jsonl"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": worker_id(),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def parse_sample_rates(value):
+    """Parse LOG_SAMPLE, e.g. "DEBUG=0.01,INFO=0.25" -> {"DEBUG": 0.01, "INFO": 0.25}"""
+    rates = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        level, _, rate = part.partition("=")
+        rates[level.strip().upper()] = float(rate)
+    return rates
+
 
 class Logger:
-    @staticmethod
-    def get_logger(name):
-        # Create logs directory if it doesn't exist
-        if not os.path.exists("logs"):
-            os.makedirs("logs")
-            
-        # Configure logger
+    """Framework loggers that write through one queue and a background writer thread.
+
+    Configured from the environment on first use:
+    LOG_LEVEL (INFO), LOG_FORMAT (text or jsonl), LOG_CONSOLE (true) and
+    LOG_SAMPLE (per-level sampling rates). Each xdist worker writes its own
+    file, logs/<date>_<worker>.log (or .jsonl).
+    """
+
+    _handler = None
+    _listener = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _setup(cls):
+        """Start the background writer once per process"""
+        level = os.getenv("LOG_LEVEL", "INFO").upper()
+        log_format = os.getenv("LOG_FORMAT", "text").lower()
+        extension = "jsonl" if log_format == "jsonl" else "log"
+        formatter = JsonLinesFormatter() if log_format == "jsonl" else logging.Formatter(TEXT_FORMAT)
+
+        os.makedirs("logs", exist_ok=True)
+        log_file = f"logs/{datetime.now().strftime('%Y%m%d')}_{worker_id()}.{extension}"
+        handlers = [logging.FileHandler(log_file)]
+        if os.getenv("LOG_CONSOLE", "true").lower() == "true":
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setLevel(level)
+            handler.setFormatter(formatter)
+
+        cls._handler = LazyQueueHandler(queue.SimpleQueue())
+        cls._handler.setLevel(level)
+        rates = parse_sample_rates(os.getenv("LOG_SAMPLE", ""))
+        if rates:
+            cls._handler.addFilter(SamplingFilter(rates))
+
+        cls._listener = logging.handlers.QueueListener(cls._handler.queue, *handlers, respect_handler_level=True)
+        cls._listener.start()
+        atexit.register(cls.shutdown)
+
+    @classmethod
+    def get_logger(cls, name):
+        """Return the logger for name, attached to the shared queue handler"""
+        if cls._handler is None:
+            with cls._lock:
+                if cls._handler is None:
+                    cls._setup()
+
         logger = logging.getLogger(name)
-        logger.setLevel(logging.INFO)
-        
-        # Check if logger already has handlers to avoid duplicates
         if not logger.handlers:
-            # File handler
-            log_file = f"logs/{datetime.now().strftime('%Y%m%d')}.log"
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.INFO)
-            
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            
-            # Create formatter and add to handlers
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-            
-            # Add handlers to logger
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
-        
+            logger.setLevel(cls._handler.level)
+            logger.addHandler(cls._handler)
         return logger
- 
\ No newline at end of file
+
+    @classmethod
+    def shutdown(cls):
+        """Write out everything still queued and stop the writer thread"""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                for handler in cls._listener.handlers:
+                    handler.close()
+                cls._listener = None
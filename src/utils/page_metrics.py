@@ -0,0 +1,173 @@
+import csv
+import json
+import os
+import time
+
+from src.utils.artifacts import worker_id
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+# Installed before any page script runs: LCP and CLS are only observable from
+# inside the page, and only in Chromium (the values stay null elsewhere)
+OBSERVER_SCRIPT = """
+(() => {
+    const vitals = window.__webVitals = {lcp: null, cls: null};
+    try {
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) vitals.lcp = entry.renderTime || entry.loadTime || entry.startTime;
+        }).observe({type: "largest-contentful-paint", buffered: true});
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) {
+                if (!entry.hadRecentInput) vitals.cls = (vitals.cls || 0) + entry.value;
+            }
+        }).observe({type: "layout-shift", buffered: true});
+    } catch (error) {}
+})();
+"""
+
+# One round trip: time to ready, Navigation Timing, paint timings, Web Vitals and
+# resource totals. Times are ms from navigation start (ready_ms is "now", i.e. when
+# the page object's readiness condition was met); sizes are bytes (0 for
+# cross-origin resources without Timing-Allow-Origin).
+COLLECT_SCRIPT = """
+() => {
+    const round = value => value === undefined || value === null ? null : Math.round(value * 10) / 10;
+    const nav = performance.getEntriesByType("navigation")[0];
+    const paint = {};
+    for (const entry of performance.getEntriesByType("paint")) paint[entry.name] = entry.startTime;
+    const resources = performance.getEntriesByType("resource");
+    const vitals = window.__webVitals || {};
+    return {
+        url: location.href,
+        ready_ms: round(performance.now()),
+        ttfb: nav ? round(nav.responseStart) : null,
+        dom_content_loaded: nav && nav.domContentLoadedEventEnd ? round(nav.domContentLoadedEventEnd) : null,
+        load: nav && nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+        document_transfer: nav ? nav.transferSize : null,
+        first_paint: round(paint["first-paint"]),
+        first_contentful_paint: round(paint["first-contentful-paint"]),
+        lcp: round(vitals.lcp),
+        cls: vitals.cls === undefined || vitals.cls === null ? null : Math.round(vitals.cls * 1000) / 1000,
+        resource_count: resources.length,
+        resource_transfer: resources.reduce((sum, entry) => sum + (entry.transferSize || 0), 0),
+        resource_decoded: resources.reduce((sum, entry) => sum + (entry.decodedBodySize || 0), 0),
+    };
+}
+"""
+
+FIELDS = [
+    "test", "page_object", "worker", "strategy", "ready_ms", "wait_ms", "url",
+    "ttfb", "dom_content_loaded", "load", "document_transfer",
+    "first_paint", "first_contentful_paint", "lcp", "cls",
+    "resource_count", "resource_transfer", "resource_decoded",
+]
+
+
+class PageMetrics:
+    """Browser performance data sampled whenever a page object becomes ready.
+
+    PAGE_METRICS=json or csv turns collection on (off by default) and
+    PAGE_METRICS_FILE sets the output (default reports/page_metrics.<format>).
+    Each document is sampled once, at the first wait_for_page_load after it was
+    navigated to, tagged with the page object, test and worker. Samples from
+    xdist workers are merged so each run writes a single file.
+    """
+
+    _rows = []
+    _settings = None
+    logger = Logger.get_logger("PageMetrics")
+
+    @classmethod
+    def settings(cls):
+        """Settings read from the environment on first use"""
+        if cls._settings is None:
+            output_format = os.getenv("PAGE_METRICS", "off").lower()
+            if output_format not in ("off", "json", "csv"):
+                cls.logger.warning("Unknown PAGE_METRICS %s, collection is off", output_format)
+                output_format = "off"
+            cls._settings = {
+                "format": output_format,
+                "file": os.getenv("PAGE_METRICS_FILE", f"reports/page_metrics.{output_format}"),
+            }
+        return cls._settings
+
+    @classmethod
+    def enabled(cls):
+        return cls.settings()["format"] != "off"
+
+    @classmethod
+    def install(cls, page, nodeid, force=False):
+        """Prepare a test's page: observe Web Vitals from the next navigation on and tag samples with the test.
+
+        force collects samples even with PAGE_METRICS=off (for budget checks);
+        they are then not written to a file.
+        """
+        if not (cls.enabled() or force):
+            return
+        page.add_init_script(OBSERVER_SCRIPT)
+        page.metrics_test = nodeid
+
+    @classmethod
+    def active(cls, page):
+        """True if samples are collected for this page"""
+        return hasattr(page, "metrics_test")
+
+    @classmethod
+    def record(cls, page, page_object, strategy, wait_seconds, navigation):
+        """Sample the current document unless it was already sampled (navigation is BasePage.navigation_count).
+
+        ready_ms is measured in the page from navigation start, so it includes
+        the goto or click that navigated; wait_ms is only the time spent in
+        wait_for_page_load.
+        """
+        if not cls.active(page) or getattr(page, "metrics_navigation", None) == navigation:
+            return None
+        page.metrics_navigation = navigation
+
+        start = time.perf_counter()
+        row = {
+            "test": page.metrics_test,
+            "page_object": page_object,
+            "worker": worker_id(),
+            "strategy": strategy,
+            "wait_ms": round(wait_seconds * 1000, 1),
+            **page.evaluate(COLLECT_SCRIPT),
+        }
+        cls._rows.append(row)
+        RunStats.record_time("page_metrics_collect", time.perf_counter() - start)
+        return row
+
+    @classmethod
+    def rows(cls):
+        return list(cls._rows)
+
+    @classmethod
+    def export(cls):
+        """Samples as plain data (used for xdist workeroutput); none if they are not written"""
+        return list(cls._rows) if cls.enabled() else []
+
+    @classmethod
+    def merge(cls, rows):
+        """Add samples collected by another process"""
+        cls._rows.extend(rows)
+
+    @classmethod
+    def write(cls):
+        """Write all samples to PAGE_METRICS_FILE; returns the path, or None if nothing was collected"""
+        settings = cls.settings()
+        if not cls.enabled() or not cls._rows:
+            return None
+        path = settings["file"]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        rows = sorted(cls._rows, key=lambda row: (row["test"], row["worker"]))
+        with open(path, "w", newline="") as output:
+            if settings["format"] == "csv":
+                writer = csv.DictWriter(output, fieldnames=FIELDS, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump(rows, output, indent=2)
+        cls.logger.info("Wrote %d page metric samples to %s", len(rows), path)
+        return path
@@ -0,0 +1,145 @@
+import os
+
+import pytest
+
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+MODES = ("off", "soft", "hard")
+
+# Budget key -> (description, value measured from a PageMetrics sample)
+METRICS = {
+    "ready_ms": ("time to ready from navigation start (ms)", lambda row: row["ready_ms"]),
+    "transfer_kb": (
+        "transfer size (KB)",
+        lambda row: round(((row.get("document_transfer") or 0) + (row.get("resource_transfer") or 0)) / 1024, 1),
+    ),
+    "requests": ("request count", lambda row: (row.get("resource_count") or 0) + 1),
+}
+
+# Per-environment overrides of the budgets declared on page objects (ENVIRONMENT /
+# --env). "*" applies to every page object, a class name to that page only; the
+# class name wins. Environments not listed use the declared budgets as they are.
+ENVIRONMENT_BUDGETS = {
+    # The bundled storefront serves no ads or third-party scripts
+    "local": {
+        "*": {"ready_ms": 1500, "transfer_kb": 500, "requests": 30},
+    },
+    "dev": {
+        "*": {"ready_ms": 8000},
+    },
+    "prod": {
+        "HomePage": {"ready_ms": 3000},
+        "ProductsPage": {"ready_ms": 3000},
+    },
+}
+
+
+def resolve_mode(node, default):
+    """Budget enforcement for a test: its perf_budget(mode) marker, else PERF_BUDGETS"""
+    marker = node.get_closest_marker("perf_budget")
+    mode = (marker.args[0] if marker and marker.args else default).lower()
+    if mode not in MODES:
+        raise ValueError(f"Performance budget mode must be one of {MODES}, got {mode!r}")
+    return mode
+
+
+class PerfBudget:
+    """Checks page-object performance budgets against PageMetrics samples.
+
+    Page objects declare ``budget = {"ready_ms": ..., "transfer_kb": ...,
+    "requests": ...}`` (each key optional); ENVIRONMENT_BUDGETS adjusts them per
+    environment. With PERF_BUDGETS=soft (or @pytest.mark.perf_budget("soft"))
+    violations are only reported; with hard they also fail the test.
+    """
+
+    _violations = []
+    logger = Logger.get_logger("PerfBudget")
+
+    @classmethod
+    def install(cls, page, mode):
+        """Enable budget checks for a test's page; returns True if they are on"""
+        if mode == "off":
+            return False
+        page.budget_mode = mode
+        page.budget_violations = []
+        return True
+
+    @classmethod
+    def budget_for(cls, page_object, environment=None):
+        """The page object's budget after applying its environment's overrides"""
+        environment = environment or os.getenv("ENVIRONMENT", "staging")
+        overrides = ENVIRONMENT_BUDGETS.get(environment, {})
+        name = page_object.__class__.__name__
+        return {
+            **(getattr(page_object, "budget", None) or {}),
+            **overrides.get("*", {}),
+            **overrides.get(name, {}),
+        }
+
+    @classmethod
+    def check(cls, page_object, row):
+        """Compare a sample with the page object's budget; returns the violations found"""
+        page = page_object.page
+        if not hasattr(page, "budget_mode"):
+            return []
+        violations = []
+        for key, limit in cls.budget_for(page_object).items():
+            description, measure = METRICS[key]
+            actual = measure(row)
+            if actual is not None and actual > limit:
+                violations.append({
+                    "test": row["test"],
+                    "page_object": row["page_object"],
+                    "metric": description,
+                    "actual": actual,
+                    "limit": limit,
+                    "mode": page.budget_mode,
+                })
+        for violation in violations:
+            cls.logger.warning("Budget exceeded: %s", describe(violation))
+        page.budget_violations.extend(violations)
+        cls._violations.extend(violations)
+        RunStats.increment("budget_checks")
+        RunStats.increment("budget_violations", len(violations))
+        return violations
+
+    @classmethod
+    def violations(cls):
+        return list(cls._violations)
+
+    @classmethod
+    def export(cls):
+        """Violations as plain data (used for xdist workeroutput)"""
+        return list(cls._violations)
+
+    @classmethod
+    def merge(cls, violations):
+        """Add violations found by another process"""
+        cls._violations.extend(violations)
+
+
+def describe(violation):
+    """One-line description of a violation"""
+    return (
+        f"{violation['page_object']} {violation['metric']} {violation['actual']} > {violation['limit']}"
+    )
+
+
+def enforce(page):
+    """In hard mode, fail the test if its page exceeded a budget.
+
+    Called once the test body has passed (pytest_runtest_call), so pytest,
+    Allure and the HTML report all record the same failure.
+    """
+    violations = getattr(page, "budget_violations", None)
+    if violations and page.budget_mode == "hard":
+        text = "\n".join(describe(violation) for violation in violations)
+        pytest.fail(f"Performance budget exceeded:\n{text}", pytrace=False)
+
+
+def apply_to_report(report, page):
+    """Add a test's budget violations to its call report"""
+    violations = getattr(page, "budget_violations", None)
+    if violations:
+        report.sections.append(("performance budget", "\n".join(describe(violation) for violation in violations)))
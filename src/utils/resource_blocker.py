@@ -0,0 +1,150 @@
+import os
+from fnmatch import fnmatch
+from urllib.parse import urlsplit
+
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+# Ad, analytics and font hosts loaded by the storefront
+AD_DOMAINS = [
+    "googlesyndication.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "adservice.google.com",
+    "fundingchoicesmessages.google.com",
+    "googletagservices.com",
+    "amazon-adsystem.com",
+    "adtrafficquality.google",
+]
+ANALYTICS_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "connect.facebook.net",
+    "hotjar.com",
+]
+FONT_DOMAINS = [
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+]
+
+# Blocking profiles; each key is optional
+PROFILES = {
+    "off": {},
+    "third_party": {
+        "block_domains": AD_DOMAINS + ANALYTICS_DOMAINS + FONT_DOMAINS,
+        "block_globs": ["**/*.woff", "**/*.woff2", "**/*.ttf"],
+    },
+    "aggressive": {
+        "block_domains": AD_DOMAINS + ANALYTICS_DOMAINS + FONT_DOMAINS,
+        "block_types": ["image", "media", "font"],
+        "block_third_party": True,
+    },
+}
+
+# Profile used for each test marker when BLOCK_PROFILE=auto (first match wins)
+MARKER_PROFILES = {
+    "e2e": "off",
+    "checkout": "third_party",
+    "cart": "third_party",
+    "search": "third_party",
+    "smoke": "aggressive",
+}
+
+# Rough transfer sizes used to estimate bytes saved, since blocked responses are never downloaded
+ESTIMATED_SIZES = {
+    "script": 60000,
+    "image": 30000,
+    "font": 40000,
+    "media": 200000,
+    "stylesheet": 20000,
+    "xhr": 2000,
+    "fetch": 2000,
+    "document": 50000,
+}
+DEFAULT_ESTIMATED_SIZE = 5000
+
+
+def _split_env(name):
+    return [value.strip() for value in os.getenv(name, "").split(",") if value.strip()]
+
+
+def _domain_matches(host, domains):
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+def resolve_profile(node, default="off"):
+    """Pick the blocking profile for a test: block_profile marker, then BLOCK_PROFILE, then marker map"""
+    marker = node.get_closest_marker("block_profile")
+    if marker and marker.args:
+        return marker.args[0]
+    if default != "auto":
+        return default
+    for marker_name, profile in MARKER_PROFILES.items():
+        if node.get_closest_marker(marker_name):
+            return profile
+    return "off"
+
+
+class ResourceBlocker:
+    """Blocks requests of a browser context according to a profile and counts what was saved"""
+
+    def __init__(self, profile, base_url):
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown block profile: {profile}. Expected one of {sorted(PROFILES)}")
+        rules = PROFILES[profile]
+        self.profile = profile
+        self.first_party = urlsplit(base_url).hostname or ""
+        self.block_types = set(rules.get("block_types", []))
+        self.block_domains = rules.get("block_domains", []) + _split_env("BLOCK_DOMAINS")
+        self.block_globs = rules.get("block_globs", []) + _split_env("BLOCK_URLS")
+        self.block_third_party = rules.get("block_third_party", False)
+        self.allow_domains = [self.first_party] + _split_env("ALLOW_DOMAINS")
+        self.allow_globs = _split_env("ALLOW_URLS")
+        self.blocked = 0
+        self.bytes_saved = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def active(self):
+        return bool(self.block_types or self.block_domains or self.block_globs or self.block_third_party)
+
+    def should_block(self, url, resource_type):
+        """Allow globs always win, blocked resource types apply everywhere, the rest only off the allowed domains"""
+        host = urlsplit(url).hostname or ""
+        if any(fnmatch(url, pattern) for pattern in self.allow_globs):
+            return False
+        if resource_type in self.block_types:
+            return True
+        if _domain_matches(host, self.allow_domains):
+            return False
+        if _domain_matches(host, self.block_domains):
+            return True
+        if any(fnmatch(url, pattern) for pattern in self.block_globs):
+            return True
+        return self.block_third_party and not _domain_matches(host, [self.first_party])
+
+    def install(self, context):
+        """Route the context's requests through the policy (only when it blocks anything)"""
+        if self.active:
+            context.route("**/*", self._handle)
+
+    def _handle(self, route, request):
+        if self.should_block(request.url, request.resource_type):
+            self.blocked += 1
+            self.bytes_saved += ESTIMATED_SIZES.get(request.resource_type, DEFAULT_ESTIMATED_SIZE)
+            route.abort("blockedbyclient")
+        else:
+            # Let earlier routes (e.g. HAR replay) or the network handle it
+            route.fallback()
+
+    def record(self, node):
+        """Store this test's counters on the test item and in the run totals"""
+        node.user_properties.append(("blocked_requests", self.blocked))
+        node.user_properties.append(("blocked_bytes_estimate", self.bytes_saved))
+        RunStats.increment("blocked_requests", self.blocked)
+        RunStats.increment("blocked_bytes_estimate", self.bytes_saved)
+        if self.blocked:
+            self.logger.info(
+                "%s: blocked %d requests (~%d KB) with profile '%s'",
+                node.name, self.blocked, self.bytes_saved // 1024, self.profile,
+            )
@@ -0,0 +1,75 @@
+import statistics
+from collections import defaultdict
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+class RunStats:
+    """Collects timings and counters for a test run and merges them across xdist workers"""
+
+    _timings = defaultdict(list)
+    _counters = defaultdict(int)
+
+    @classmethod
+    def record_time(cls, name, seconds):
+        """Record a duration in seconds under the given name"""
+        cls._timings[name].append(seconds)
+
+    @classmethod
+    def increment(cls, name, amount=1):
+        """Increase a named counter"""
+        cls._counters[name] += amount
+
+    @classmethod
+    def get_counter(cls, name):
+        """Get the current value of a named counter"""
+        return cls._counters.get(name, 0)
+
+    @classmethod
+    def get_timings(cls, name):
+        """Get all recorded durations for a name"""
+        return list(cls._timings.get(name, []))
+
+    @classmethod
+    def export(cls):
+        """Export the collected data as a plain dict (used for xdist workeroutput)"""
+        return {
+            "timings": {name: list(values) for name, values in cls._timings.items()},
+            "counters": dict(cls._counters),
+        }
+
+    @classmethod
+    def merge(cls, data):
+        """Merge data exported by another process into this one"""
+        for name, values in data.get("timings", {}).items():
+            cls._timings[name].extend(values)
+        for name, value in data.get("counters", {}).items():
+            cls._counters[name] += value
+
+    @classmethod
+    def reset(cls):
+        """Drop all collected data"""
+        cls._timings.clear()
+        cls._counters.clear()
+
+    @classmethod
+    def summary_lines(cls):
+        """Format the collected data for the terminal summary"""
+        lines = []
+        for name in sorted(cls._timings):
+            values = cls._timings[name]
+            if not values:
+                continue
+            lines.append(
+                f"{name}: n={len(values)} total={sum(values):.3f}s "
+                f"mean={statistics.mean(values) * 1000:.1f}ms "
+                f"max={max(values) * 1000:.1f}ms"
+            )
+        for name in sorted(cls._counters):
+            lines.append(f"{name}: {cls._counters[name]}")
+        return lines
@@ -0,0 +1,172 @@
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from uuid import uuid4
+
+import allure
+import allure_commons
+
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: only needed for WebP and downscaling
+    Image = None
+
+# Format -> (Allure attachment type or MIME type, file extension)
+FORMATS = {
+    "png": (allure.attachment_type.PNG, "png"),
+    "jpeg": (allure.attachment_type.JPG, "jpg"),
+    "webp": ("image/webp", "webp"),
+}
+# Formats Playwright can encode itself
+NATIVE_FORMATS = {"png", "jpeg"}
+
+
+class ScreenshotPipeline:
+    """Captures screenshots as bytes and encodes/writes them on background threads.
+
+    The test thread only asks the browser for the image and reserves the Allure
+    attachment; re-encoding, downscaling and both file writes (screenshots/ and
+    the Allure results directory) happen on the pool. ``wait`` blocks until every
+    pending write is done and is called once at session end.
+
+    Configured from the environment: SCREENSHOT_FORMAT (png, jpeg, webp),
+    SCREENSHOT_QUALITY (jpeg/webp, 1-100), SCREENSHOT_SCALE (e.g. 0.5),
+    SCREENSHOT_DIR, SCREENSHOT_WORKERS and SCREENSHOT_STEPS (false skips the
+    checkpoint screenshots page objects take in passing tests).
+    """
+
+    _executor = None
+    _pending = []
+    _settings = None
+    _lock = threading.Lock()
+    logger = Logger.get_logger("ScreenshotPipeline")
+
+    @classmethod
+    def settings(cls):
+        """Settings read from the environment on first use"""
+        if cls._settings is None:
+            cls._settings = cls._read_settings()
+        return cls._settings
+
+    @classmethod
+    def _read_settings(cls):
+        image_format = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+        if image_format == "jpg":
+            image_format = "jpeg"
+        scale = float(os.getenv("SCREENSHOT_SCALE", "1"))
+        if image_format not in FORMATS:
+            cls.logger.warning("Unknown SCREENSHOT_FORMAT %s, using png", image_format)
+            image_format = "png"
+        if Image is None and (image_format not in NATIVE_FORMATS or scale < 1):
+            cls.logger.warning("Pillow is not installed: WebP and SCREENSHOT_SCALE need it, using png at full size")
+            image_format, scale = "png", 1.0
+        return {
+            "format": image_format,
+            "quality": int(os.getenv("SCREENSHOT_QUALITY", "80")),
+            "scale": scale,
+            "dir": os.getenv("SCREENSHOT_DIR", "screenshots"),
+            "steps": os.getenv("SCREENSHOT_STEPS", "true").lower() == "true",
+        }
+
+    @classmethod
+    def _submit(cls, func, *args):
+        with cls._lock:
+            if cls._executor is None:
+                workers = int(os.getenv("SCREENSHOT_WORKERS", "2"))
+                cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+            cls._pending.append(cls._executor.submit(func, *args))
+
+    @classmethod
+    def _native(cls, settings):
+        return settings["format"] in NATIVE_FORMATS and settings["scale"] >= 1
+
+    @classmethod
+    def screenshot_args(cls):
+        """Arguments for page.screenshot(): the final format when Playwright can produce it, else PNG"""
+        settings = cls.settings()
+        if not cls._native(settings):
+            return {"type": "png"}
+        if settings["format"] == "jpeg":
+            return {"type": "jpeg", "quality": settings["quality"]}
+        return {"type": "png"}
+
+    @classmethod
+    def capture(cls, target, name, attach=True, **screenshot_args):
+        """Screenshot a page or locator and queue it for encoding and writing.
+
+        Returns the path the image will be written to. With attach=True the
+        image is also added to the current Allure test as an attachment.
+        """
+        start = time.perf_counter()
+        data = target.screenshot(**cls.screenshot_args(), **screenshot_args)
+        RunStats.record_time("screenshot_capture", time.perf_counter() - start)
+        return cls.queue(data, name, attach)
+
+    @classmethod
+    def queue(cls, data, name, attach=True):
+        """Queue bytes captured with screenshot_args() for encoding and writing; returns the path"""
+        settings = cls.settings()
+        attachment_type, extension = FORMATS[settings["format"]]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = os.path.join(settings["dir"], f"{name}_{timestamp}.{extension}")
+        attachment_file = cls._reserve_attachment(name, attachment_type, extension) if attach else None
+        cls._submit(cls._write, data, None if cls._native(settings) else settings, path, attachment_file)
+        return path
+
+    @classmethod
+    def _reserve_attachment(cls, name, attachment_type, extension):
+        """Add the attachment to the current Allure test now and return the file name to write later"""
+        for plugin in allure_commons.plugin_manager.get_plugins():
+            reporter = getattr(plugin, "allure_logger", None)
+            if reporter is not None:
+                return reporter._attach(uuid4(), name=name, attachment_type=attachment_type, extension=extension)
+        return None
+
+    @classmethod
+    def _write(cls, data, settings, path, attachment_file):
+        start = time.perf_counter()
+        if settings:
+            data = encode(data, settings["format"], settings["quality"], settings["scale"])
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as image_file:
+            image_file.write(data)
+        if attachment_file:
+            allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=attachment_file)
+        RunStats.record_time("screenshot_write", time.perf_counter() - start)
+
+    @classmethod
+    def wait(cls):
+        """Block until all queued screenshots are written; returns how many failed"""
+        with cls._lock:
+            pending, cls._pending = cls._pending, []
+        if not pending:
+            return 0
+        start = time.perf_counter()
+        wait(pending)
+        RunStats.record_time("screenshot_drain", time.perf_counter() - start)
+        failures = [future.exception() for future in pending if future.exception()]
+        for error in failures:
+            cls.logger.error("Screenshot write failed: %s", error)
+        return len(failures)
+
+
+def encode(png_bytes, image_format, quality, scale):
+    """Re-encode (and optionally downscale) a PNG screenshot with Pillow"""
+    image = Image.open(io.BytesIO(png_bytes))
+    if scale < 1:
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        image = image.resize(size, Image.LANCZOS)
+    if image_format == "jpeg" and image.mode != "RGB":
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    save_args = {} if image_format == "png" else {"quality": quality}
+    image.save(output, format=image_format.upper(), **save_args)
+    return output.getvalue()
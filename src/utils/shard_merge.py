@@ -0,0 +1,277 @@
+import csv
+import html
+import json
+import os
+import re
+import shutil
+from collections import defaultdict
+
+from src.utils.logger import Logger
+
+TIMINGS_FILE = "reports/timings.json"
+HTML_REPORT = "reports/report.html"
+ALLURE_RESULTS = "allure-results"
+DURATION_HISTORY = ".durations.json"
+PAGE_METRICS = ("reports/page_metrics.json", "reports/page_metrics.csv")
+# Copied file by file; a name another shard already used gets the shard's directory name as prefix
+ARTIFACT_DIRS = ("screenshots", "videos", "traces", "logs")
+# Static files of a pytest-html report written without --self-contained-html
+HTML_ASSETS = "reports/assets"
+
+# pytest-html counts these outcomes in "N tests took ..."
+RUN_COUNT_OUTCOMES = ("passed", "failed", "xpassed", "xfailed")
+
+
+def write_timings(durations, markers, browser, environment, shard, workers, wall_seconds, path=TIMINGS_FILE):
+    """Write one run's per-test durations and wall-clock time, for merging shards"""
+    data = {
+        "browser": browser,
+        "environment": environment,
+        "shard": shard or None,
+        "workers": workers,
+        "wall_s": round(wall_seconds, 3),
+        "tests": {
+            nodeid: {"duration": round(seconds, 3), "markers": markers.get(nodeid, [])}
+            for nodeid, seconds in sorted(durations.items())
+        },
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as timings_file:
+        json.dump(data, timings_file, indent=2)
+
+
+def _parse_duration(text):
+    """Seconds from pytest-html's "15 ms" or "HH:MM:SS" """
+    if text.endswith(" ms"):
+        return int(text[:-3]) / 1000
+    hours, minutes, seconds = (int(part) for part in text.split(":"))
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _read_blob(content, path):
+    """The test data pytest-html 4 embeds in its report"""
+    match = re.search(r'data-jsonblob="([^"]*)"', content)
+    if match is None:
+        raise ValueError(f"{path} is not a pytest-html 4 report (no data-jsonblob); merging needs pytest-html>=4")
+    return json.loads(html.unescape(match.group(1)))
+
+
+def _format_duration(seconds):
+    """The same format pytest-html uses"""
+    if seconds < 1:
+        return f"{round(seconds * 1000)} ms"
+    seconds = round(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class ShardMerger:
+    """Combines the artifacts of the machines that ran one suite with SHARD=i/N into a single run.
+
+    Each shard directory is laid out like the project root after a run
+    (allure-results/, reports/, screenshots/, videos/, traces/, logs/,
+    .durations.json). The output gets:
+      allure-results/         every shard's result files (uuid-named, so they do not clash)
+      reports/report.html     one pytest-html report with all tests (one row per browser) and summed counts
+      reports/timings.json    all tests' durations per browser, per-shard wall-clock and the run's wall-clock
+      .durations.json         the duration history updated with every shard's tests
+      screenshots/, videos/, traces/, logs/, page metrics - all shards' files
+    """
+
+    def __init__(self, shard_dirs, output_dir):
+        self.shard_dirs = list(shard_dirs)
+        self.output_dir = output_dir
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def _shard_paths(self, relative):
+        """(shard name, path) for shards that have the given file or directory"""
+        for shard_dir in self.shard_dirs:
+            path = os.path.join(shard_dir, relative)
+            if os.path.exists(path):
+                yield os.path.basename(os.path.normpath(shard_dir)), path
+
+    def _output(self, relative):
+        path = os.path.join(self.output_dir, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def _copy_tree(self, relative, keep_first=False):
+        """Copy a directory from every shard; returns the number of files copied"""
+        copied = 0
+        for shard, source in self._shard_paths(relative):
+            for root, _, files in os.walk(source):
+                for name in files:
+                    nested = os.path.relpath(os.path.join(root, name), source)
+                    target = self._output(os.path.join(relative, nested))
+                    if os.path.exists(target):
+                        if keep_first:
+                            continue
+                        target = os.path.join(os.path.dirname(target), f"{shard}_{name}")
+                    shutil.copy2(os.path.join(root, name), target)
+                    copied += 1
+        return copied
+
+    def merge_allure(self):
+        # environment.properties, executor.json and categories.json are the same on every shard
+        return self._copy_tree(ALLURE_RESULTS, keep_first=True)
+
+    def _load_timings(self):
+        """(shard name, timings) for shards that wrote a timings file"""
+        timings = []
+        for shard, path in self._shard_paths(TIMINGS_FILE):
+            with open(path, encoding="utf-8") as timings_file:
+                timings.append((shard, json.load(timings_file)))
+        return timings
+
+    def merge_html(self):
+        """Combine the shards' pytest-html reports; the first one is the template.
+
+        The same nodeid run in several browsers keeps one row per browser,
+        with the browser appended to the test name.
+        """
+        reports = list(self._shard_paths(HTML_REPORT))
+        if not reports:
+            return 0
+        browsers = {shard: data["browser"] for shard, data in self._load_timings()}
+        label = len(set(browsers.values())) > 1
+        tests, counts, wall = defaultdict(list), defaultdict(int), 0.0
+        for shard, path in reports:
+            with open(path, encoding="utf-8") as report_file:
+                content = report_file.read()
+            blob = _read_blob(content, path)
+            for nodeid, results in blob["tests"].items():
+                if label and shard in browsers:
+                    results = [{**result, "testId": f"{result['testId']} [{browsers[shard]}]"} for result in results]
+                tests[nodeid].extend(results)
+            for outcome, count in re.findall(r'<span class="(\w+)">(\d+) ', content):
+                counts[outcome] += int(count)
+            took = re.search(r'<p class="run-count">\d+ tests? took (.+?)\.</p>', content)
+            if took:
+                wall = max(wall, _parse_duration(took.group(1)))
+
+        with open(reports[0][1], encoding="utf-8") as report_file:
+            merged = report_file.read()
+        blob = _read_blob(merged, reports[0][1])
+        blob["tests"] = tests
+        merged = re.sub(
+            r'data-jsonblob="[^"]*"',
+            lambda _: f'data-jsonblob="{html.escape(json.dumps(blob))}"',
+            merged,
+        )
+        merged = re.sub(
+            r'<span class="(\w+)">\d+ ',
+            lambda match: f'<span class="{match.group(1)}">{counts[match.group(1)]} ',
+            merged,
+        )
+        # Outcomes without tests have their filter checkbox disabled
+        merged = re.sub(
+            r'data-test-result="(\w+)"( disabled)?',
+            lambda match: f'data-test-result="{match.group(1)}"' + ("" if counts[match.group(1)] else " disabled"),
+            merged,
+        )
+        ran = sum(counts[outcome] for outcome in RUN_COUNT_OUTCOMES)
+        merged = re.sub(
+            r'<p class="run-count">.*?</p>',
+            lambda _: f'<p class="run-count">{ran} {"tests" if ran > 1 else "test"} took {_format_duration(wall)}.</p>',
+            merged,
+        )
+        with open(self._output(HTML_REPORT), "w", encoding="utf-8") as report_file:
+            report_file.write(merged)
+        return sum(len(results) for results in tests.values())
+
+    def merge_page_metrics(self):
+        """Concatenate the shards' page metric samples; returns the number of samples"""
+        json_path, csv_path = PAGE_METRICS
+        samples, csv_rows, fieldnames = [], [], None
+        for _, path in self._shard_paths(json_path):
+            with open(path, encoding="utf-8") as metrics_file:
+                samples.extend(json.load(metrics_file))
+        for _, path in self._shard_paths(csv_path):
+            with open(path, newline="", encoding="utf-8") as metrics_file:
+                reader = csv.DictReader(metrics_file)
+                fieldnames = fieldnames or reader.fieldnames
+                csv_rows.extend(reader)
+        if samples:
+            with open(self._output(json_path), "w", encoding="utf-8") as metrics_file:
+                json.dump(sorted(samples, key=lambda row: (row["test"], row["worker"])), metrics_file, indent=2)
+        if csv_rows:
+            with open(self._output(csv_path), "w", newline="", encoding="utf-8") as metrics_file:
+                writer = csv.DictWriter(metrics_file, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(sorted(csv_rows, key=lambda row: (row["test"], row["worker"])))
+        return len(samples) + len(csv_rows)
+
+    def merge_timings(self):
+        """Combine the shards' timings and duration histories; returns the merged timings.
+
+        Tests are keyed like the duration history (browser|environment|nodeid),
+        so shards of different browsers do not overwrite each other.
+        """
+        timings = self._load_timings()
+        if not timings:
+            return None
+
+        tests, shards, owners = {}, [], {}
+        for shard, data in timings:
+            prefix = f"{data['browser']}|{data['environment']}|"
+            for nodeid, test in data["tests"].items():
+                tests[prefix + nodeid] = {**test, "shard": data["shard"]}
+                owners[prefix + nodeid] = shard
+            shards.append({
+                "browser": data["browser"],
+                "shard": data["shard"],
+                "directory": shard,
+                "workers": data["workers"],
+                "tests": len(data["tests"]),
+                "busy_s": round(sum(test["duration"] for test in data["tests"].values()), 3),
+                "wall_s": data["wall_s"],
+            })
+        merged = {
+            "shards": sorted(shards, key=lambda shard: (shard["browser"], shard["shard"] or "", shard["directory"])),
+            "wall_s": max(shard["wall_s"] for shard in shards),
+            "busy_s": round(sum(shard["busy_s"] for shard in shards), 3),
+            "tests": dict(sorted(tests.items())),
+        }
+        with open(self._output(TIMINGS_FILE), "w", encoding="utf-8") as timings_file:
+            json.dump(merged, timings_file, indent=2)
+
+        # Each shard folded only its own tests into its copy of the history
+        history = {}
+        for shard, path in self._shard_paths(DURATION_HISTORY):
+            with open(path, encoding="utf-8") as history_file:
+                for key, entry in json.load(history_file).items():
+                    if key not in history or owners.get(key) == shard:
+                        history[key] = entry
+        if history:
+            with open(self._output(DURATION_HISTORY), "w", encoding="utf-8") as history_file:
+                json.dump(history, history_file, indent=2, sort_keys=True)
+        return merged
+
+    def merge(self):
+        """Merge everything; returns printable summary lines"""
+        lines = [
+            f"allure-results: {self.merge_allure()} files",
+            f"pytest-html: {self.merge_html()} results",
+        ]
+        self._copy_tree(HTML_ASSETS, keep_first=True)
+        for relative in ARTIFACT_DIRS:
+            copied = self._copy_tree(relative)
+            if copied:
+                lines.append(f"{relative}: {copied} files")
+        samples = self.merge_page_metrics()
+        if samples:
+            lines.append(f"page metrics: {samples} samples")
+        timings = self.merge_timings()
+        if timings:
+            lines.append(
+                f"timings: {len(timings['tests'])} tests on {len(timings['shards'])} shards, "
+                f"wall-clock {timings['wall_s']:.1f}s (slowest shard), {timings['busy_s']:.1f}s of test time"
+            )
+            for shard in timings["shards"]:
+                lines.append(
+                    f"  {shard['browser']} shard {shard['shard'] or shard['directory']}: {shard['tests']} tests, "
+                    f"{shard['busy_s']:.1f}s busy, {shard['wall_s']:.1f}s wall-clock"
+                )
+        self.logger.info("Merged %d shards into %s", len(self.shard_dirs), self.output_dir)
+        return lines
@@ -0,0 +1,133 @@
+import functools
+import os
+import threading
+import time
+
+import allure
+from allure_commons.model2 import Parameter, TestStepResult
+from allure_commons.utils import func_parameters, represent
+from allure_pytest.utils import get_status, get_status_details
+
+from src.utils.run_stats import RunStats
+
+# Step levels: BasePage primitives (click, fill, ...) and page-object methods built on them
+ACTION = "action"
+PAGE = "page"
+
+# STEP_LEVEL -> levels that produce steps
+LEVELS = {
+    "full": {ACTION, PAGE},
+    "page": {PAGE},
+    "off": set(),
+}
+
+
+class BufferedStep:
+    """A step kept in memory until the test ends; the title is only formatted if it is written"""
+
+    __slots__ = ("title", "func", "args", "kwargs", "start", "stop", "error", "children")
+
+    def __init__(self, title, func, args, kwargs):
+        self.title = title
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.start = time.time()
+        self.stop = None
+        self.error = None
+        self.children = []
+
+    def to_result(self):
+        """Build the Allure step result, formatting the title the way allure.step does"""
+        params = func_parameters(self.func, *self.args, **self.kwargs)
+        title = self.title.format(*[represent(arg) for arg in self.args], **params)
+        error = self.error
+        return TestStepResult(
+            name=title,
+            start=int(self.start * 1000),
+            stop=int((self.stop or time.time()) * 1000),
+            parameters=[Parameter(name=name, value=value) for name, value in params.items()],
+            status=get_status(error),
+            statusDetails=get_status_details(type(error), error, error.__traceback__) if error else None,
+            steps=[child.to_result() for child in self.children],
+        )
+
+
+class StepTrace:
+    """Decides how page-object steps reach the Allure report.
+
+    STEP_MODE:  live     - allure.step as before, one start/stop event per call
+                buffered - keep steps in memory and write them when the test ends
+                failure  - like buffered, but only write them for failed tests
+    STEP_LEVEL: full (primitives and page-object methods), page (page-object
+                methods only) or off.
+    """
+
+    mode = None
+    levels = None
+    _local = threading.local()
+
+    @classmethod
+    def configure(cls, mode=None, level=None):
+        """Read STEP_MODE/STEP_LEVEL (or use the given values)"""
+        cls.mode = (mode or os.getenv("STEP_MODE", "live")).lower()
+        cls.levels = LEVELS[(level or os.getenv("STEP_LEVEL", "full")).lower()]
+
+    @classmethod
+    def _roots(cls):
+        if not hasattr(cls._local, "roots"):
+            cls._local.roots = []
+            cls._local.stack = []
+        return cls._local.roots
+
+    @classmethod
+    def record(cls, title, func, args, kwargs):
+        """Call func, keeping a buffered step for it"""
+        roots = cls._roots()
+        stack = cls._local.stack
+        buffered = BufferedStep(title, func, args, kwargs)
+        (stack[-1].children if stack else roots).append(buffered)
+        stack.append(buffered)
+        try:
+            return func(*args, **kwargs)
+        except BaseException as error:
+            buffered.error = error
+            raise
+        finally:
+            buffered.stop = time.time()
+            stack.pop()
+
+    @classmethod
+    def flush(cls, test_result, failed):
+        """Write the buffered steps into test_result (None drops them) and start over"""
+        roots = cls._roots()
+        count = cls._count(roots)
+        RunStats.increment("steps_buffered", count)
+        if test_result is not None and roots and (cls.mode == "buffered" or failed):
+            test_result.steps.extend(step.to_result() for step in roots)
+            RunStats.increment("steps_written", count)
+        roots.clear()
+        cls._local.stack.clear()
+
+    @classmethod
+    def _count(cls, steps):
+        return sum(1 + cls._count(step.children) for step in steps)
+
+
+def step(title, level=PAGE):
+    """Drop-in replacement for @allure.step that honours STEP_MODE and STEP_LEVEL"""
+    def decorator(func):
+        live = allure.step(title)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if StepTrace.mode is None:
+                StepTrace.configure()
+            if level not in StepTrace.levels:
+                return func(*args, **kwargs)
+            if StepTrace.mode == "live":
+                return live(*args, **kwargs)
+            return StepTrace.record(title, func, args, kwargs)
+
+        return wrapper
+    return decorator
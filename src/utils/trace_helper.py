@@ -0,0 +1,76 @@
+import os
+import time
+
+from src.utils.artifacts import failed_or_retried, safe_node_name, worker_id
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+
+class TraceBuffer:
+    """Traces one test as a chunk of the context's tracing session and only saves it on failure.
+
+    Tracing is started once per browser context with screenshots and snapshots;
+    every test then records into its own chunk. A passing test's chunk is
+    stopped without a path, so Playwright discards it without writing a file.
+    A failed (or re-run) test's chunk is written to
+    traces/<nodeid>_<worker>.zip.
+
+    With max_actions (TRACE_ACTIONS) set, the chunk is discarded and restarted
+    every max_actions page-object actions, so the trace of a long test stays
+    small and only a failure writes anything: the current window, i.e. the
+    last 1 to max_actions actions.
+    """
+
+    def __init__(self, context, trace_dir="traces", max_actions=0):
+        self.context = context
+        self.trace_dir = trace_dir
+        self.max_actions = max_actions
+        self.actions = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def start(self, title=None):
+        """Start this test's chunk, starting the context's tracing session on first use"""
+        start = time.perf_counter()
+        tracing = self.context.tracing
+        if getattr(self.context, "tracing_started", False):
+            tracing.start_chunk(title=title)
+        else:
+            # tracing.start() opens the first chunk itself
+            tracing.start(title=title, screenshots=True, snapshots=True)
+            self.context.tracing_started = True
+        RunStats.record_time("trace_start", time.perf_counter() - start)
+
+    def action(self):
+        """Count a page-object action about to run; start a new window once max_actions are recorded"""
+        if self.max_actions and self.actions >= self.max_actions:
+            self._rotate()
+        self.actions += 1
+
+    def _rotate(self):
+        """Discard the finished window without writing it and start a new chunk"""
+        start = time.perf_counter()
+        self.context.tracing.stop_chunk()
+        self.context.tracing.start_chunk()
+        self.actions = 0
+        RunStats.increment("trace_rotations")
+        RunStats.record_time("trace_rotate", time.perf_counter() - start)
+
+    def finish(self, item):
+        """Stop the chunk: save it if the test failed or was re-run, discard it otherwise.
+
+        Call before the context is closed. Returns the saved trace path or None.
+        """
+        start = time.perf_counter()
+        if not failed_or_retried(item):
+            self.context.tracing.stop_chunk()
+            RunStats.increment("trace_discarded")
+            RunStats.record_time("trace_stop", time.perf_counter() - start)
+            return None
+
+        os.makedirs(self.trace_dir, exist_ok=True)
+        path = os.path.join(self.trace_dir, f"{safe_node_name(item.nodeid)}_{worker_id()}.zip")
+        self.context.tracing.stop_chunk(path=path)
+        RunStats.increment("trace_kept")
+        RunStats.record_time("trace_stop", time.perf_counter() - start)
+        self.logger.info("Saved trace %s", path)
+        return path
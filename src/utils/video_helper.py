@@ -0,0 +1,116 @@
+import os
+import time
+
+from src.utils.artifacts import failed_or_retried, safe_node_name, worker_id
+from src.utils.logger import Logger
+from src.utils.run_stats import RunStats
+
+# VIDEO values -> mode
+MODES = {
+    "off": "off", "false": "off",
+    "on": "on", "true": "on",
+    "retain-on-failure": "retain-on-failure",
+}
+
+
+def video_mode(value):
+    """Normalise VIDEO (off/false, on/true, retain-on-failure)"""
+    mode = MODES.get((value or "off").strip().lower())
+    if mode is None:
+        raise ValueError(f"VIDEO must be one of {sorted(MODES)}, got {value!r}")
+    return mode
+
+
+def parse_size(value):
+    """Parse VIDEO_SIZE ("640x360") into Playwright's record_video_size, None for the default"""
+    if not value:
+        return None
+    width, _, height = value.lower().partition("x")
+    return {"width": int(width), "height": int(height)}
+
+
+class VideoRecorder:
+    """Records a context's video and decides whether to keep it when the context closes.
+
+    on                - keep every video
+    retain-on-failure - record every test but keep only failed or re-run ones
+    off               - no recording
+
+    Kept videos are renamed to videos/<nodeid>_<worker>.webm.
+    """
+
+    def __init__(self, mode, video_dir="videos", size=None, viewport=None):
+        self.mode = video_mode(mode)
+        self.video_dir = video_dir
+        self.size = size
+        self.viewport = viewport
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def active(self):
+        return self.mode != "off"
+
+    def context_args(self):
+        """Arguments for browser.new_context()"""
+        if not self.active:
+            return {}
+        args = {"record_video_dir": self.video_dir}
+        if self.size:
+            args["record_video_size"] = self.size
+        return args
+
+    def close_context(self, context):
+        """Close the context, timing how long the video takes to be finalised"""
+        start = time.perf_counter()
+        context.close()
+        if self.active:
+            elapsed = time.perf_counter() - start
+            RunStats.record_time("video_finalize", elapsed)
+            self._record_size_saving(elapsed)
+
+    def _record_size_saving(self, elapsed):
+        """Estimate finalize time saved by recording below viewport size (encoding scales with pixels)"""
+        if not (self.size and self.viewport):
+            return
+        recorded = self.size["width"] * self.size["height"]
+        full = self.viewport["width"] * self.viewport["height"]
+        if recorded < full:
+            RunStats.record_time("video_encoding_saved_estimate", elapsed * (full / recorded - 1))
+
+    def finish(self, page, item):
+        """Keep or delete the page's video; call after the context is closed"""
+        video = page.video if self.active else None
+        if video is None:
+            return None
+        path = video.path()
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+
+        if self.mode == "retain-on-failure" and not failed_or_retried(item):
+            video.delete()
+            RunStats.increment("video_discarded")
+            RunStats.increment("video_bytes_discarded", size)
+            return None
+
+        kept_path = os.path.join(self.video_dir, f"{safe_node_name(item.nodeid)}_{worker_id()}.webm")
+        os.replace(path, kept_path)
+        RunStats.increment("video_kept")
+        RunStats.increment("video_bytes_kept", size)
+        self.logger.info("Kept video %s", kept_path)
+        return kept_path
+
+
+def video_summary_line():
+    """One line for the terminal summary: what retention and a smaller recording size saved"""
+    kept = RunStats.get_counter("video_kept")
+    discarded = RunStats.get_counter("video_discarded")
+    if not (kept or discarded):
+        return None
+    saved_seconds = sum(RunStats.get_timings("video_encoding_saved_estimate"))
+    line = (
+        f"video: kept {kept} ({RunStats.get_counter('video_bytes_kept') / 1e6:.1f}MB), "
+        f"discarded {discarded} ({RunStats.get_counter('video_bytes_discarded') / 1e6:.1f}MB saved), "
+        f"finalize {sum(RunStats.get_timings('video_finalize')):.1f}s"
+    )
+    if saved_seconds:
+        line += f", ~{saved_seconds:.1f}s encoding saved by VIDEO_SIZE"
+    return line
@@ -64,17 +64,11 @@ class TestCart:
     @pytest.mark.cart
     @allure.title("Test remove product from cart")
     @allure.description("Test removing a product from the cart")
-    def test_remove_from_cart(self, page):
-        # Arrange
-        home_page = HomePage(page)
-        products_page = ProductsPage(page)
-        cart_page = CartPage(page)
-        
-        # Add product to cart
-        home_page.go_to_products()
+    def test_remove_from_cart(self, cart_with):
+        # Arrange - seed the cart over HTTP, only the removal goes through the UI
         product_name = TestData.TEST_PRODUCTS[0]
-        products_page.add_to_cart(product_name)
-        products_page.go_to_cart()
+        page = cart_with([product_name])
+        cart_page = CartPage(page)
         
         # Verify product is in cart before removing
         assert cart_page.is_product_in_cart(product_name), f"Product '{product_name}' not found in cart"
@@ -1,9 +1,6 @@
 import  pytest
 import allure
-from src.pages.home_page import HomePage
-from src.pages.products_page import ProductsPage
 from src.pages.cart_page import CartPage
-from src.pages.login_page import LoginPage
 from src.pages.checkout_page import CheckoutPage
 from src.utils.test_data import TestData
 
@@ -11,32 +8,15 @@ from src.utils.test_data import TestData
 class TestCheckout:
     
     @pytest.mark.checkout
+    @pytest.mark.authenticated
     @allure.title("Test checkout process")
     @allure.description("Test the complete checkout process from adding items to payment")
-    def test_checkout_process(self, page):
-        # Arrange
-        home_page = HomePage(page)
-        products_page = ProductsPage(page)
+    def test_checkout_process(self, cart_with):
+        # Arrange - logged in through the cached storage state (checkout requires account)
+        # and cart seeded over HTTP
+        page = cart_with([TestData.TEST_PRODUCTS[0]])
         cart_page = CartPage(page)
         checkout_page = CheckoutPage(page)
-        login_page = LoginPage(page)
-        
-        # Login first (checkout requires account)
-        home_page.go_to_login()
-        login_success = login_page.login(TestData.TEST_USER["email"], TestData.TEST_USER["password"])
-        
-        if not login_success:
-            # Create account if login failed (likely first run)
-            login_page.signup(TestData.TEST_USER["name"], TestData.TEST_USER["email"])
-            # Complete registration would be here, but automationexercise.com redirects
-            # directly to login after signup, so we'll try login again
-            login_page.login(TestData.TEST_USER["email"], TestData.TEST_USER["password"])
-        
-        # Add product to cart
-        home_page.go_to_products()
-        product_name = TestData.TEST_PRODUCTS[0]
-        products_page.add_to_cart(product_name)
-        products_page.go_to_cart()
         
         # Act - proceed to checkout
         cart_page.proceed_to_checkout()
@@ -65,26 +45,13 @@ class TestCheckout:
     @pytest.mark.checkout
     @allure.title("Test cart calculation")
     @allure.description("Test that cart total is calculated correctly")
-    def test_cart_calculation(self, page):
-        # Arrange
-        home_page = HomePage(page)
-        products_page = ProductsPage(page)
+    def test_cart_calculation(self, cart_with):
+        # Arrange - seed the first two test products over HTTP
+        added_products = TestData.TEST_PRODUCTS[:2]
+        page = cart_with(added_products)
         cart_page = CartPage(page)
-        
-        # Add multiple products to cart
-        home_page.go_to_products()
-        
-        added_products = []
         expected_total = 0
         
-        # Add first two test products and calculate expected total
-        for i in range(2):
-            product_name = TestData.TEST_PRODUCTS[i]
-            products_page.add_to_cart(product_name)
-            added_products.append(product_name)
-        
-        products_page.go_to_cart()
-        
         # Calculate expected total from individual product prices
         for product_name in added_products:
             price = cart_page.get_product_price(product_name)
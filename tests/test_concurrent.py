@@ -0,0 +1,51 @@
+import  pytest
+import allure
+from src.pages.async_pages.home_page import AsyncHomePage
+from src.pages.async_pages.products_page import AsyncProductsPage
+from src.pages.async_pages.cart_page import AsyncCartPage
+from src.utils.test_data import TestData
+
+@allure.feature("Concurrent Scenarios")
+class TestConcurrent:
+    
+    @pytest.mark.cart
+    @allure.title("Test independent carts in concurrent contexts")
+    @allure.description("Run many add-to-cart scenarios at once on one event loop and verify each context keeps its own cart")
+    def test_concurrent_carts(self, async_runner):
+        products = TestData.TEST_PRODUCTS
+        
+        async def add_one_product(page, index):
+            product_name = products[index % len(products)]
+            await AsyncHomePage(page).go_to_products()
+            products_page = AsyncProductsPage(page)
+            await products_page.add_to_cart(product_name)
+            await products_page.go_to_cart()
+            cart_page = AsyncCartPage(page)
+            return product_name, (await cart_page.snapshot()).names
+        
+        # Act
+        results = async_runner.run_scenarios(add_one_product, count=12)
+        
+        # Assert
+        for product_name, cart_names in results:
+            assert cart_names == [product_name], f"Expected only '{product_name}' in cart, got {cart_names}"
+    
+    @pytest.mark.search
+    @allure.title("Test concurrent searches")
+    @allure.description("Search for every test term at the same time in separate contexts")
+    def test_concurrent_searches(self, async_runner):
+        search_terms = TestData.SEARCH_TERMS
+        
+        async def search(page, index):
+            home_page = AsyncHomePage(page)
+            await home_page.go_to_products()
+            products_page = AsyncProductsPage(page)
+            await products_page.search_product(search_terms[index])
+            return await products_page.get_search_results_count()
+        
+        # Act
+        counts = async_runner.run_scenarios(search, count=len(search_terms))
+        
+        # Assert
+        for term, count in zip(search_terms, counts):
+            assert count > 0, f"No search results found for '{term}'"
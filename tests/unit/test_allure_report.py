@@ -0,0 +1,107 @@
+import json
+import os
+
+import pytest
+
+from src.utils.allure_report import IncrementalAllureReport, build_report
+
+
+def write_result(results_dir, name, history_id, status, start=1000, stop=3000):
+    """An Allure result file with the fields the report reads"""
+    path = results_dir / f"{name}-result.json"
+    path.write_text(json.dumps({
+        "uuid": name, "historyId": history_id, "name": history_id, "fullName": f"tests.{history_id}",
+        "status": status, "start": start, "stop": stop,
+        "statusDetails": {"message": "boom"} if status == "failed" else {},
+    }), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    directory = tmp_path / "allure-results"
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def report(results_dir, tmp_path):
+    return IncrementalAllureReport(str(results_dir), str(tmp_path / "allure-report"))
+
+
+def read_history(report, file_name):
+    with open(os.path.join(report.report_dir, "history", file_name), encoding="utf-8") as history_file:
+        return json.load(history_file)
+
+
+def test_update_parses_only_new_and_changed_files(report, results_dir):
+    write_result(results_dir, "r1", "test_a", "passed")
+    changed = write_result(results_dir, "r2", "test_b", "passed")
+    assert report.update() == 2
+    assert report.update() == 0
+
+    write_result(results_dir, "r2", "test_b", "failed")
+    os.utime(changed, ns=(1, 1))
+    write_result(results_dir, "r3", "test_c", "passed")
+    assert report.update() == 2
+    assert report.statistic()["failed"] == 1
+
+
+def test_update_drops_removed_files_and_survives_a_restart(report, results_dir, tmp_path):
+    write_result(results_dir, "r1", "test_a", "passed")
+    removed = write_result(results_dir, "r2", "test_b", "passed")
+    report.update()
+    removed.unlink()
+    reloaded = IncrementalAllureReport(str(results_dir), str(tmp_path / "allure-report"))
+    assert reloaded.update() == 0
+    assert reloaded.statistic()["total"] == 1
+
+
+def test_latest_result_wins_and_earlier_ones_count_as_retries(report, results_dir):
+    write_result(results_dir, "r1", "test_a", "failed", stop=2000)
+    write_result(results_dir, "r2", "test_a", "passed", stop=4000)
+    report.update()
+    ((latest, retries),) = report.latest().values()
+    assert (latest["status"], retries) == ("passed", 1)
+
+
+def test_finish_build_appends_to_trend_and_history(report, results_dir):
+    write_result(results_dir, "r1", "test_a", "passed")
+    write_result(results_dir, "r2", "test_b", "failed", start=2000, stop=5000)
+    assert report.finish_build()["total"] == 2
+    # Nothing new since the previous build
+    assert report.finish_build() is None
+
+    write_result(results_dir, "r3", "test_a", "failed", start=6000, stop=7000)
+    report.finish_build("nightly")
+
+    trend = read_history(report, "history-trend.json")
+    assert [(build["buildOrder"], build["reportName"]) for build in trend] == [(2, "nightly"), (1, "Run 1")]
+    assert trend[1]["data"]["passed"] == 1 and trend[1]["data"]["failed"] == 1
+    assert read_history(report, "duration-trend.json") == [{"data": {"duration": 1000}}, {"data": {"duration": 4000}}]
+
+    history = read_history(report, "history.json")
+    # Each item points at the result it came from, newest first
+    assert [item["uid"] for item in history["test_a"]["items"]] == ["r3", "r1"]
+    assert history["test_a"]["statistic"]["total"] == 2
+    assert history["test_b"]["items"][0]["statusDetails"] == "boom"
+
+
+def test_new_report_is_seeded_from_history_files(report, results_dir, tmp_path):
+    previous = write_result(results_dir, "r1", "test_a", "passed")
+    report.finish_build()
+    # Only the history files are left, as after a full build with fresh results
+    os.remove(report.state_path)
+    previous.unlink()
+
+    write_result(results_dir, "r2", "test_a", "failed")
+    seeded = IncrementalAllureReport(str(results_dir), str(tmp_path / "allure-report"))
+    assert [build["buildOrder"] for build in seeded.state["trend"]] == [1]
+    seeded.finish_build()
+    assert [build["buildOrder"] for build in read_history(seeded, "history-trend.json")] == [2, 1]
+    assert [item["uid"] for item in read_history(seeded, "history.json")["test_a"]["items"]] == ["r2", "r1"]
+
+
+def test_build_report_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        build_report("static")
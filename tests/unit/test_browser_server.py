@@ -0,0 +1,34 @@
+from collections import defaultdict
+
+import pytest
+
+from src.utils import browser_server
+from src.utils.browser_server import BrowserServer, browser_summary_line, check_playwright_version
+from src.utils.run_stats import RunStats
+
+
+@pytest.fixture(autouse=True)
+def run_stats(monkeypatch):
+    monkeypatch.setattr(RunStats, "_counters", defaultdict(int))
+    monkeypatch.setattr(RunStats, "_timings", defaultdict(list))
+
+
+def test_check_playwright_version_accepts_the_pinned_version(monkeypatch):
+    monkeypatch.setattr(browser_server, "version", lambda package: browser_server.SUPPORTED_PLAYWRIGHT)
+    check_playwright_version()
+
+
+def test_check_playwright_version_rejects_other_versions(monkeypatch):
+    monkeypatch.setattr(browser_server, "version", lambda package: "1.40.0")
+    with pytest.raises(ValueError, match="1.40.0"):
+        check_playwright_version()
+
+
+def test_shared_summary_adds_peaks(monkeypatch):
+    server = BrowserServer("chromium", {})
+    server.peak_rss_kb = 300 * 1024
+    RunStats.record_time("browser_server_start", 1.5)
+    RunStats.increment("browser_worker_rss_kb", 200 * 1024)
+    RunStats.increment("browser_workers_sampled", 2)
+    line = browser_summary_line(server)
+    assert "peak RSS <= 500MB (server peak 300MB + 2 worker drivers' peaks 200MB)" in line
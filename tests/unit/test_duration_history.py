@@ -0,0 +1,86 @@
+import pytest
+
+from src.utils.duration_history import (
+    DEFAULT_ESTIMATE, DurationHistory, assign_shards, parse_shard, predicted_makespan,
+)
+
+
+@pytest.fixture
+def history(tmp_path):
+    return DurationHistory(str(tmp_path / "durations.json"), "chromium", "staging")
+
+
+def test_update_smooths_with_moving_average(history):
+    history.update({"tests/test_cart.py::test_add": 10.0}, {"tests/test_cart.py::test_add": ["cart"]})
+    history.update({"tests/test_cart.py::test_add": 20.0}, {"tests/test_cart.py::test_add": ["cart"]})
+    entry = history.entries["chromium|staging|tests/test_cart.py::test_add"]
+    assert entry == {"duration": 15.0, "markers": ["cart"]}
+
+
+def test_history_is_saved_and_reloaded(history, tmp_path):
+    history.update({"a": 3.0}, {})
+    history.save()
+    reloaded = DurationHistory(str(tmp_path / "durations.json"), "chromium", "staging")
+    assert reloaded.estimates([("a", [])]) == [3.0]
+
+
+def test_history_is_kept_per_browser_and_environment(history, tmp_path):
+    history.update({"a": 3.0}, {})
+    history.save()
+    other = DurationHistory(str(tmp_path / "durations.json"), "firefox", "staging")
+    assert other.estimates([("a", [])]) == [DEFAULT_ESTIMATE]
+
+
+def test_unknown_test_uses_marker_average(history):
+    history.update({"cart_1": 4.0, "cart_2": 8.0, "search_1": 1.0},
+                   {"cart_1": ["cart"], "cart_2": ["cart"], "search_1": ["search"]})
+    # Several matching markers: the slowest marker average wins
+    assert history.estimates([("new", ["cart"]), ("new", ["cart", "search"])]) == [6.0, 6.0]
+
+
+def test_unknown_test_without_marker_history_uses_overall_average(history):
+    history.update({"a": 2.0, "b": 4.0}, {"a": ["cart"], "b": []})
+    assert history.estimates([("new", ["checkout"]), ("new", [])]) == [3.0, 3.0]
+
+
+def test_empty_history_uses_default_estimate(history):
+    assert history.estimates([("new", ["cart"])]) == [DEFAULT_ESTIMATE]
+
+
+def test_parse_shard():
+    assert parse_shard("") is None
+    assert parse_shard("2/4") == (2, 4)
+    for value in ("0/2", "3/2", "1", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_assign_shards_puts_every_test_on_exactly_one_shard():
+    tests = [(f"test_{index}", float(index % 7 + 1)) for index in range(50)]
+    shards = assign_shards(tests, 4)
+    assigned = [nodeid for shard in shards for nodeid in shard]
+    assert sorted(assigned) == sorted(nodeid for nodeid, _ in tests)
+    assert len(assigned) == len(set(assigned))
+
+
+def test_assign_shards_is_independent_of_collection_order():
+    tests = [(f"test_{index}", float(index % 5)) for index in range(30)]
+    assert assign_shards(tests, 3) == assign_shards(list(reversed(tests)), 3)
+
+
+def test_assign_shards_balances_estimated_duration():
+    tests = [(f"test_{index}", float(index % 7 + 1)) for index in range(50)]
+    estimates = dict(tests)
+    loads = [sum(estimates[nodeid] for nodeid in shard) for shard in assign_shards(tests, 4)]
+    assert max(loads) - min(loads) <= max(estimates.values())
+
+
+def test_assign_shards_with_equal_estimates_splits_evenly():
+    shards = assign_shards([(f"test_{index}", DEFAULT_ESTIMATE) for index in range(10)], 3)
+    assert sorted(len(shard) for shard in shards) == [3, 3, 4]
+
+
+def test_predicted_makespan():
+    # Longest-first to the least-loaded worker: 5, 2 | 3, 2
+    assert predicted_makespan([5, 3, 2, 2], 2) == 7
+    assert predicted_makespan([5, 3, 2], 1) == 10
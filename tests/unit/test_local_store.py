@@ -0,0 +1,33 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.local_store.server import StorefrontServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StorefrontServer() as server:
+        yield server
+
+
+def get(server, path):
+    """Status and JSON body of a GET request"""
+    try:
+        with urllib.request.urlopen(server.url + path, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_add_to_cart(server):
+    assert get(server, "/add_to_cart/1?quantity=2") == (200, {"status": "added", "product_id": 1})
+
+
+@pytest.mark.parametrize("quantity", ["abc", "0", "-1"])
+def test_add_to_cart_rejects_invalid_quantity(server, quantity):
+    assert get(server, f"/add_to_cart/1?quantity={quantity}") == (400, {"error": "Invalid quantity"})
+    # The handler answered and the server keeps serving
+    assert get(server, "/add_to_cart/1")[0] == 200
@@ -0,0 +1,98 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.perf_budget import ENVIRONMENT_BUDGETS, PerfBudget, apply_to_report, enforce
+from src.utils.run_stats import RunStats
+
+
+class HomePage:
+    budget = {"ready_ms": 5000, "transfer_kb": 4000, "requests": 150}
+
+    def __init__(self, page):
+        self.page = page
+
+
+class Report:
+    """The parts of a pytest TestReport apply_to_report touches"""
+
+    def __init__(self):
+        self.outcome = "passed"
+        self.sections = []
+
+
+def sample(**values):
+    return {"test": "tests/test_smoke.py::test_home", "page_object": "HomePage", "ready_ms": 100,
+            "document_transfer": 1024, "resource_transfer": 0, "resource_count": 0, **values}
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    monkeypatch.setattr(PerfBudget, "_violations", [])
+    monkeypatch.setattr(RunStats, "_counters", defaultdict(int))
+    monkeypatch.setitem(ENVIRONMENT_BUDGETS, "test", {
+        "*": {"ready_ms": 2000, "requests": 50},
+        "HomePage": {"ready_ms": 1000},
+    })
+
+
+def test_budget_for_uses_declared_budget_without_overrides():
+    assert PerfBudget.budget_for(HomePage(None), "staging") == HomePage.budget
+
+
+def test_budget_for_page_override_beats_wildcard_beats_declared():
+    assert PerfBudget.budget_for(HomePage(None), "test") == {
+        "ready_ms": 1000, "transfer_kb": 4000, "requests": 50,
+    }
+
+
+def test_check_is_skipped_when_budgets_are_off():
+    page = SimpleNamespace()
+    assert not PerfBudget.install(page, "off")
+    assert PerfBudget.check(HomePage(page), sample(ready_ms=99999)) == []
+
+
+def test_check_reports_each_metric_over_budget(monkeypatch):
+    monkeypatch.setenv("ENVIRONMENT", "test")
+    page = SimpleNamespace()
+    PerfBudget.install(page, "soft")
+    violations = PerfBudget.check(HomePage(page), sample(ready_ms=1500, resource_count=60))
+    assert [(violation["metric"], violation["actual"], violation["limit"]) for violation in violations] == [
+        ("time to ready from navigation start (ms)", 1500, 1000),
+        ("request count", 61, 50),
+    ]
+    assert page.budget_violations == violations == PerfBudget.violations()
+
+
+def check(mode):
+    page = SimpleNamespace()
+    PerfBudget.install(page, mode)
+    PerfBudget.check(HomePage(page), sample(ready_ms=99999))
+    return page
+
+
+def test_hard_mode_fails_the_test():
+    with pytest.raises(pytest.fail.Exception, match="Performance budget exceeded"):
+        enforce(check("hard"))
+
+
+def test_soft_mode_does_not_fail_the_test():
+    enforce(check("soft"))
+
+
+def test_violations_are_added_to_the_report_in_either_mode():
+    for mode in ("soft", "hard"):
+        report = Report()
+        apply_to_report(report, check(mode))
+        assert report.outcome == "passed"
+        assert report.sections[0][0] == "performance budget"
+
+
+def test_nothing_happens_without_violations():
+    page = SimpleNamespace()
+    PerfBudget.install(page, "hard")
+    enforce(page)
+    report = Report()
+    apply_to_report(report, page)
+    assert report.sections == []
@@ -0,0 +1,136 @@
+import html
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.shard_merge import DURATION_HISTORY, HTML_REPORT, TIMINGS_FILE, ShardMerger
+
+OUTCOMES = ("failed", "passed", "skipped", "error")
+
+
+def html_report(tests, took):
+    """A pytest-html 4 report reduced to the parts the merge rewrites"""
+    counts = {outcome: sum(result["result"].lower() == outcome for results in tests.values() for result in results)
+              for outcome in OUTCOMES}
+    ran = counts["passed"] + counts["failed"]
+    filters = "".join(
+        f'<input class="filter" type="checkbox" data-test-result="{outcome}" {"disabled" if not count else ""}>'
+        f'<span class="{outcome}">{count} {outcome.title()},</span>'
+        for outcome, count in counts.items()
+    )
+    blob = html.escape(json.dumps({"environment": {}, "tests": tests}))
+    return (f'<p class="run-count">{ran} {"tests" if ran > 1 else "test"} took {took}.</p>{filters}'
+            f'<div id="data-container" data-jsonblob="{blob}"></div>')
+
+
+def result(nodeid, outcome):
+    return {"testId": nodeid, "result": outcome, "duration": "1 ms"}
+
+
+def write_shard(directory, browser, shard, outcomes, durations, wall, took):
+    (directory / "reports").mkdir(parents=True)
+    tests = {nodeid: [result(nodeid, outcome)] for nodeid, outcome in outcomes.items()}
+    (directory / HTML_REPORT).write_text(html_report(tests, took), encoding="utf-8")
+    (directory / TIMINGS_FILE).write_text(json.dumps({
+        "browser": browser, "environment": "staging", "shard": shard, "workers": 2, "wall_s": wall,
+        "tests": {nodeid: {"duration": seconds, "markers": []} for nodeid, seconds in durations.items()},
+    }), encoding="utf-8")
+    # Each shard folded its own tests into its copy of the history
+    history = {f"{browser}|staging|{nodeid}": {"duration": 1.0, "markers": []} for nodeid in ("a", "b", "c")}
+    history.update({f"{browser}|staging|{nodeid}": {"duration": seconds, "markers": []}
+                    for nodeid, seconds in durations.items()})
+    (directory / DURATION_HISTORY).write_text(json.dumps(history), encoding="utf-8")
+    return str(directory)
+
+
+def read_blob(path):
+    content = open(path, encoding="utf-8").read()
+    return content, json.loads(html.unescape(re.search(r'data-jsonblob="([^"]*)"', content).group(1)))
+
+
+@pytest.fixture
+def shards(tmp_path):
+    return [
+        write_shard(tmp_path / "shard-1", "chromium", "1/2", {"a": "Passed", "b": "Failed"},
+                    {"a": 4.0, "b": 2.0}, 7.5, "00:00:07"),
+        write_shard(tmp_path / "shard-2", "chromium", "2/2", {"c": "Passed"}, {"c": 5.0}, 6.0, "00:00:06"),
+    ]
+
+
+def test_merge_html_combines_rows_and_counts(shards, tmp_path):
+    merger = ShardMerger(shards, str(tmp_path / "merged"))
+    assert merger.merge_html() == 3
+    content, blob = read_blob(tmp_path / "merged" / HTML_REPORT)
+    assert sorted(blob["tests"]) == ["a", "b", "c"]
+    assert '<span class="passed">2 ' in content
+    assert '<span class="failed">1 ' in content
+    assert '<p class="run-count">3 tests took 00:00:07.</p>' in content
+    # Disabled in shard 2, which had no failures
+    assert 'data-test-result="failed" disabled' not in content
+    assert 'data-test-result="skipped" disabled' in content
+
+
+def test_merge_html_keeps_one_row_per_browser(tmp_path):
+    shards = [
+        write_shard(tmp_path / "chromium", "chromium", None, {"a": "Passed"}, {"a": 4.0}, 4.0, "00:00:04"),
+        write_shard(tmp_path / "firefox", "firefox", None, {"a": "Failed"}, {"a": 6.0}, 6.0, "00:00:06"),
+    ]
+    merger = ShardMerger(shards, str(tmp_path / "merged"))
+    assert merger.merge_html() == 2
+    content, blob = read_blob(tmp_path / "merged" / HTML_REPORT)
+    assert [row["testId"] for row in blob["tests"]["a"]] == ["a [chromium]", "a [firefox]"]
+    assert '<p class="run-count">2 tests took 00:00:06.</p>' in content
+
+    timings = merger.merge_timings()
+    assert sorted(timings["tests"]) == ["chromium|staging|a", "firefox|staging|a"]
+
+
+def test_merge_html_reads_reports_of_the_installed_pytest_html(tmp_path):
+    (tmp_path / "test_sample.py").write_text(
+        "def test_a():\n    pass\n\ndef test_b():\n    assert False\n\ndef test_c():\n    pass\n"
+    )
+    shards = []
+    for index, selected in ((1, "test_a or test_b"), (2, "test_c")):
+        directory = tmp_path / f"shard-{index}"
+        subprocess.run(
+            [sys.executable, "-m", "pytest", "test_sample.py", "-k", selected, "-p", "no:cacheprovider",
+             f"--html={directory / HTML_REPORT}", "--self-contained-html"],
+            cwd=tmp_path, capture_output=True, env={**os.environ, "PYTHONPATH": ""},
+        )
+        shards.append(str(directory))
+    merger = ShardMerger(shards, str(tmp_path / "merged"))
+    assert merger.merge_html() == 3
+    content, blob = read_blob(tmp_path / "merged" / HTML_REPORT)
+    assert sorted(blob["tests"]) == ["test_sample.py::test_a", "test_sample.py::test_b", "test_sample.py::test_c"]
+    assert '<span class="passed">2 ' in content
+    assert '<span class="failed">1 ' in content
+
+
+def test_merge_html_rejects_reports_without_test_data(tmp_path):
+    shard = tmp_path / "shard-1"
+    (shard / "reports").mkdir(parents=True)
+    # pytest-html 3 renders the results table server-side
+    (shard / HTML_REPORT).write_text('<table id="results-table"></table>', encoding="utf-8")
+    with pytest.raises(ValueError, match="pytest-html>=4"):
+        ShardMerger([str(shard)], str(tmp_path / "merged")).merge_html()
+
+
+def test_merge_timings_sums_busy_time_and_takes_slowest_wall_clock(shards, tmp_path):
+    timings = ShardMerger(shards, str(tmp_path / "merged")).merge_timings()
+    assert timings["wall_s"] == 7.5
+    assert timings["busy_s"] == 11.0
+    assert [(shard["shard"], shard["tests"]) for shard in timings["shards"]] == [("1/2", 2), ("2/2", 1)]
+    assert timings["tests"]["chromium|staging|c"] == {"duration": 5.0, "markers": [], "shard": "2/2"}
+    assert json.load(open(tmp_path / "merged" / TIMINGS_FILE)) == timings
+
+
+def test_merge_timings_takes_each_history_entry_from_the_shard_that_ran_the_test(shards, tmp_path):
+    ShardMerger(shards, str(tmp_path / "merged")).merge_timings()
+    history = json.load(open(tmp_path / "merged" / DURATION_HISTORY))
+    assert {key: entry["duration"] for key, entry in history.items()} == {
+        "chromium|staging|a": 4.0, "chromium|staging|b": 2.0, "chromium|staging|c": 5.0,
+    }
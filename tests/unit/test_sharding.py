@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def collect(marker, shard=""):
+    """Nodeids pytest collects from the suite for a marker expression and SHARD"""
+    env = {**os.environ, "SHARD": shard, "SCHEDULE": "default", "LOG_CONSOLE": "false"}
+    output = subprocess.run(
+        [sys.executable, "-m", "pytest", "tests", "-m", marker, "--collect-only", "-q", "-p", "no:cacheprovider"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return [line for line in output.splitlines() if "::" in line]
+
+
+def test_shards_split_only_the_selected_marker_group():
+    group = collect("cart")
+    shards = [collect("cart", f"{index}/2") for index in (1, 2)]
+    assert sorted(shards[0] + shards[1]) == sorted(group)
+    assert not set(shards[0]) & set(shards[1])
+    assert abs(len(shards[0]) - len(shards[1])) <= 1
@@ -0,0 +1,61 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.run_stats import RunStats
+from src.utils.trace_helper import TraceBuffer
+
+
+class Tracing:
+    """Records the tracing calls TraceBuffer makes"""
+
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **kwargs):
+        self.calls.append(("start", None))
+
+    def start_chunk(self, **kwargs):
+        self.calls.append(("start_chunk", None))
+
+    def stop_chunk(self, path=None):
+        self.calls.append(("stop_chunk", path))
+
+
+@pytest.fixture(autouse=True)
+def run_stats(monkeypatch):
+    monkeypatch.setattr(RunStats, "_counters", defaultdict(int))
+    monkeypatch.setattr(RunStats, "_timings", defaultdict(list))
+
+
+@pytest.fixture
+def trace_buffer(tmp_path):
+    context = SimpleNamespace(tracing=Tracing())
+    trace_buffer = TraceBuffer(context, trace_dir=str(tmp_path), max_actions=2)
+    trace_buffer.start("test")
+    return trace_buffer
+
+
+def test_rotation_discards_windows_without_writing(trace_buffer):
+    for _ in range(5):
+        trace_buffer.action()
+    stops = [path for call, path in trace_buffer.context.tracing.calls if call == "stop_chunk"]
+    assert stops == [None, None]
+    assert RunStats.get_counter("trace_rotations") == 2
+
+
+def test_passing_test_writes_nothing(trace_buffer):
+    trace_buffer.action()
+    assert trace_buffer.finish(SimpleNamespace()) is None
+    assert trace_buffer.context.tracing.calls[-1] == ("stop_chunk", None)
+
+
+def test_failed_test_saves_only_the_current_window(trace_buffer, tmp_path):
+    for _ in range(3):
+        trace_buffer.action()
+    item = SimpleNamespace(nodeid="tests/test_cart.py::test_add", rep_call=SimpleNamespace(failed=True))
+    path = trace_buffer.finish(item)
+    stops = [path for call, path in trace_buffer.context.tracing.calls if call == "stop_chunk"]
+    assert stops == [None, path]
+    assert path.startswith(str(tmp_path)) and path.endswith(".zip")